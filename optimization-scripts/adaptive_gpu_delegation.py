@@ -9,67 +9,601 @@ Dynamically adapts GPU delegation based on hardware capabilities:
 - Universal compatibility across all CUDA architectures
 """
 
+from __future__ import annotations
+
 import sys
 import os
-from typing import Dict, Any, Tuple, Optional, Union
+import json
+import math
+import logging
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Dict, Any, Tuple, Optional, Union, List, Sequence
 from decimal import Decimal, getcontext
 import importlib.util
 
+# Optional: numpy backs the float64 vector paths (and CuPy needs it anyway);
+# without it those paths run as plain Python loops over lists
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+_LOG = logging.getLogger("cortex.adaptive_gpu")
+
+# Recently seen warning templates - repeats drop to DEBUG instead of flooding
+_WARNED_TEMPLATES: 'OrderedDict[str, None]' = OrderedDict()
+_WARNED_TEMPLATES_MAX = 32
+_WARNED_TEMPLATES_LOCK = threading.Lock()  # Worker threads warn concurrently
+
+
+def _warn_once(template: str, *args):
+    """⚠️ Log a warning once per message template; repeats are logged at DEBUG"""
+    with _WARNED_TEMPLATES_LOCK:
+        repeat = template in _WARNED_TEMPLATES
+        if repeat:
+            _WARNED_TEMPLATES.move_to_end(template)
+        else:
+            _WARNED_TEMPLATES[template] = None
+            if len(_WARNED_TEMPLATES) > _WARNED_TEMPLATES_MAX:
+                _WARNED_TEMPLATES.popitem(last=False)
+    
+    # Log outside the lock - handlers may be slow or warn themselves
+    if repeat:
+        _LOG.debug(template, *args)
+    else:
+        _LOG.warning(template, *args)
+
+
 # Add adaptions directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__)))
 
 try:
     from gpu_compatibility_checker import check_gpu_compatibility, create_adaptive_gpu_config
 except ImportError:
-    print("⚠️ GPU compatibility checker not found - using conservative defaults")
+    _LOG.warning("GPU compatibility checker not found - using conservative defaults")
+
+# Vector inputs: Python sequences (Decimal/float/int) or float64-convertible ndarrays
+ArrayLike = Union[Sequence[Union[Decimal, float]], 'np.ndarray']
+
+# Elementwise kernels shipped as a fatbin with SASS for every target architecture
+# (build command in adaptive_gpu_kernels.cu). Without the fatbin the source is
+# compiled once for the detected arch and kept in CuPy's kernel cache.
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+ARCH_KERNEL_FATBIN = os.path.join(_MODULE_DIR, 'adaptive_gpu_kernels.fatbin')
+ARCH_KERNEL_SOURCE = os.path.join(_MODULE_DIR, 'adaptive_gpu_kernels.cu')
+
+ARCH_KERNEL_NAMES = {
+    'power': 'cortex_pow_f64',
+    'add': 'cortex_add_f64',
+    'sin': 'cortex_sin_f64',
+    'cos': 'cortex_cos_f64',
+    'tan': 'cortex_tan_f64',
+}
+
+# Decimal digits a float64 result actually carries - beyond this the GPU can't help
+FLOAT64_DIGITS = 15
+
+
+def _to_decimal(value: Union[Decimal, float, int]) -> Decimal:
+    """🔢 Convert to Decimal (Decimals pass through untouched)
+    
+    Goes through str() like the original code: 0.1 becomes Decimal('0.1'),
+    not the exact binary expansion Decimal(0.1) would give.
+    """
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+# Scalar trig goes straight to libm; arrays use numpy on the CPU path
+SCALAR_TRIG_FUNCTIONS = {'sin': math.sin, 'cos': math.cos, 'tan': math.tan}
+if NUMPY_AVAILABLE:
+    ARRAY_TRIG_FUNCTIONS = {'sin': np.sin, 'cos': np.cos, 'tan': np.tan}
+else:
+    ARRAY_TRIG_FUNCTIONS = {name: (lambda xs, f=f: [f(float(x)) for x in xs])
+                            for name, f in SCALAR_TRIG_FUNCTIONS.items()}
+
+# float64 scalar power for the low-precision CPU path - JIT-compiled when Numba is installed
+try:
+    from numba import njit
+    
+    @njit(cache=True)
+    def _pow_f64(base: float, exponent: float) -> float:
+        return math.pow(base, exponent)
+    
+    NUMBA_AVAILABLE = True
+except ImportError:
+    _pow_f64 = math.pow
+    NUMBA_AVAILABLE = False
+
+# Integer operation codes - should_use_gpu compares ints instead of strings
+OP_OTHER = -1
+OP_EXPONENTIAL = 0
+OP_POWER = 1
+OP_TRIGONOMETRIC = 2
+OP_ARITHMETIC = 3
+OP_BASIC = 4
+_OP_CODES = {
+    'exponential': OP_EXPONENTIAL,
+    'power': OP_POWER,
+    'trigonometric': OP_TRIGONOMETRIC,
+    'arithmetic': OP_ARITHMETIC,
+    'basic': OP_BASIC,
+}
+
+# Per-architecture tuning keyed on compute capability (major, minor), merged
+# over the probed/conservative config. Batch sizes track SM count; small
+# minimum GPU sizes only pay off on the wider, faster-launching parts.
+_ARCH_TUNING: Dict[Tuple[int, int], Dict[str, Any]] = {
+    (6, 1): {'batch_size': 2048, 'min_array_size_gpu': 10000, 'complexity_threshold': 2000.0},   # Pascal
+    (7, 5): {'batch_size': 4096, 'min_array_size_gpu': 8000, 'complexity_threshold': 1500.0},    # Turing
+    (8, 0): {'batch_size': 8192, 'min_array_size_gpu': 4096, 'complexity_threshold': 1000.0},    # Ampere (GA100)
+    (8, 6): {'batch_size': 8192, 'min_array_size_gpu': 4096, 'complexity_threshold': 1000.0},    # Ampere (GA10x)
+    (8, 9): {'batch_size': 16384, 'min_array_size_gpu': 2048, 'complexity_threshold': 800.0},    # Ada Lovelace
+    (9, 0): {'batch_size': 32768, 'min_array_size_gpu': 2048, 'complexity_threshold': 500.0},    # Hopper
+    (10, 0): {'batch_size': 32768, 'min_array_size_gpu': 2048, 'complexity_threshold': 500.0},   # Blackwell
+}
+
+# Element count at which the GPU starts beating numpy, per operation code. Simple
+# elementwise ops lose to AVX2 until H2D+D2H is amortized; transcendental ops
+# cross over much earlier. Replaced by calibrated values once a GPU is in use.
+_CROSSOVER: Dict[int, int] = {
+    OP_ARITHMETIC: 50_000,
+    OP_BASIC: 50_000,
+    OP_EXPONENTIAL: 5_000,
+    OP_POWER: 5_000,
+    OP_TRIGONOMETRIC: 10_000,
+}
+
+# Sizes timed by the startup crossover calibration (small / mid / large)
+_CALIBRATION_SIZES = (10_000, 100_000, 1_000_000)
+_CALIBRATION_RUNS = 5  # Timings per size and side; the fastest one counts
+
+# Probe results keyed by (driver version, device uuid) - skips the probe on rerun
+GPU_CONFIG_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'cortex-gpu-config.json')
+
+
+class _BatchedFuture(Future):
+    """⏳ Future that flushes its owning delegator's queue when read"""
+
+    def __init__(self, delegator: 'AdaptiveGPUDelegator'):
+        super().__init__()
+        self._delegator = delegator
+
+    def result(self, timeout: Optional[float] = None):
+        if not self.done():
+            self._delegator.flush()
+        return super().result(timeout)
+
+
+@dataclass
+class PendingOp:
+    """📥 Scalar power operation waiting for the next batched kernel launch
+    
+    Scalar trig runs on libm and never queues.
+    """
+    operand: float
+    exponent: float = 0.0
+    precision: int = 50
+    validate: bool = False  # fall back to CPU on NaN/Inf results
+    future: Optional[Future] = None
+
+
+class PinnedBufferPool:
+    """📌 Fixed-size page-locked host buffers reused across transfers
+    
+    Pageable host memory has to be staged by the driver on every copy;
+    pinned slots are registered once and copied at full PCIe bandwidth.
+    """
+    
+    def __init__(self, cp, slot_bytes: int = 4 * 1024 * 1024, slots: int = 8):
+        self.slot_bytes = slot_bytes
+        self._buffers = [cp.cuda.alloc_pinned_memory(slot_bytes) for _ in range(slots)]
+        self._free = list(range(slots))
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> Optional[int]:
+        """📌 Take a free slot, or None when the pool is exhausted"""
+        with self._lock:
+            return self._free.pop() if self._free else None
+    
+    def release(self, slot: int):
+        """📌 Return a slot to the free-list"""
+        with self._lock:
+            self._free.append(slot)
+    
+    def view(self, slot: int, count: int) -> np.ndarray:
+        """📌 float64 view over the first `count` elements of a slot"""
+        return np.frombuffer(self._buffers[slot], dtype=np.float64, count=count)
 
 
 class AdaptiveGPUDelegator:
-    """🔧 Adaptive GPU delegation based on hardware capabilities"""
+    """🔧 Adaptive GPU delegation based on hardware capabilities
+    
+    One instance per CUDA device: constructing it again returns the existing
+    delegator instead of re-initializing CuPy, pools and kernels.
+    """
+    
+    _instances: Dict[int, 'AdaptiveGPUDelegator'] = {}
+    _instances_lock = threading.Lock()
+    
+    def __new__(cls):
+        device_id = cls._current_device_id()
+        with cls._instances_lock:
+            instance = cls._instances.get(device_id)
+            if instance is None:
+                instance = super().__new__(cls)
+                instance._initialized = False
+                cls._instances[device_id] = instance
+            return instance
+    
+    @staticmethod
+    def _current_device_id() -> int:
+        """🔑 Active CUDA device id (0 until CuPy has been imported by someone)"""
+        cp = sys.modules.get('cupy')
+        if cp is None:
+            return 0
+        try:
+            return cp.cuda.runtime.getDevice()
+        except Exception:
+            return 0
     
     def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
+        
         self.gpu_available = False
-        self.cupy_available = False
+        self.cupy_available: Optional[bool] = None  # None until the first GPU-routed call
+        self.cp = None
+        self._cupy_lock = threading.Lock()
         self.config = self._initialize_config()
-        self.stats = {
-            'gpu_operations': 0,
-            'cpu_fallbacks': 0,
-            'total_operations': 0,
-            'memory_errors': 0
+        self._cache_thresholds(self.config)
+        
+        # Per-thread counters - no shared dict mutated from every worker thread
+        self._tls = threading.local()
+        self._thread_stats: List[Counter] = []
+        self._thread_stats_lock = threading.Lock()
+        
+        # Scalar requests are queued and launched together by flush()
+        self._pending: List[PendingOp] = []
+        self._pending_lock = threading.Lock()
+        
+        # CuPy itself is imported lazily by _ensure_cupy()
+        self.memory_pool = None
+        self._ew: Dict[str, Any] = {}
+        self._bad_check = None
+        self._arch_kernels: Dict[str, Any] = {}
+        self.compute_capability: Optional[str] = None
+        self._vram_constrained = False
+        self.pinned_pool: Optional[PinnedBufferPool] = None
+        self._transfer_stream = None
+        self._pipeline_streams: Optional[Tuple[Any, Any, Any]] = None
+    
+    def _ensure_cupy(self) -> bool:
+        """🔌 Import CuPy and set up GPU resources on first use
+        
+        CPU-only workloads never pay the CuPy import / driver probe cost.
+        """
+        calibrate = False
+        if self.cupy_available is None:
+            with self._cupy_lock:
+                if self.cupy_available is None:
+                    try:
+                        import cupy as cp
+                        self.cp = cp
+                        self.gpu_available = True
+                        _LOG.info("CuPy initialized - GPU acceleration enabled")
+                        self._apply_arch_tuning()
+                        self._setup_gpu_resources()
+                        calibrate = 'crossover' not in self.config
+                        self.cupy_available = True
+                    except ImportError:
+                        _LOG.warning("CuPy not available - CPU-only mode")
+                        self.cupy_available = False
+        
+        # Timed outside the lock - other threads route on the default crossovers meanwhile
+        if calibrate:
+            self._calibrate_crossover()
+        return self.cupy_available
+    
+    def _calibrate_crossover(self):
+        """⏱️ Time numpy vs CuPy (transfers included) at small/mid/large sizes per op
+        
+        The smallest size where the GPU wins becomes that op's crossover; ops the
+        GPU never wins stay on the CPU unless their complexity says otherwise.
+        Results are stored in the config cache so this runs once per setup.
+        """
+        cp = self.cp
+        benches = {
+            OP_ARITHMETIC: (np.add, cp.add),
+            OP_POWER: (np.power, cp.power),
+            OP_TRIGONOMETRIC: (lambda a, _b: np.sin(a), lambda a, _b: cp.sin(a)),
         }
         
-        # Try to initialize CuPy
+        def timed(fn) -> float:
+            # Best of several runs - one sample is mostly scheduler and clock noise
+            best = math.inf
+            for _ in range(_CALIBRATION_RUNS):
+                start = time.perf_counter()
+                fn()
+                best = min(best, time.perf_counter() - start)
+            return best
+        
+        def gpu_run(kernel, a, b):
+            cp.asnumpy(kernel(cp.asarray(a), cp.asarray(b)))
+        
+        crossover: Dict[int, int] = {}
         try:
-            import cupy as cp
-            self.cp = cp
-            self.cupy_available = True
-            self.gpu_available = True
-            print(f"✅ CuPy initialized - GPU acceleration enabled")
-        except ImportError:
-            print("⚠️ CuPy not available - CPU-only mode")
-            self.cp = None
+            for op, (cpu_kernel, gpu_kernel) in benches.items():
+                crossover[op] = self._max_size + 1
+                for size in _CALIBRATION_SIZES:
+                    if size > self._max_size:
+                        break
+                    a = np.random.random(size) + 0.5
+                    b = np.random.random(size) + 0.5
+                    gpu_run(gpu_kernel, a, b)  # warm up kernel + pool
+                    if timed(lambda: gpu_run(gpu_kernel, a, b)) < timed(lambda: cpu_kernel(a, b)):
+                        crossover[op] = size
+                        break
+        except Exception as e:
+            _warn_once("Crossover calibration failed: %s - keeping defaults", e)
+            return
+        
+        crossover[OP_BASIC] = crossover[OP_ARITHMETIC]
+        crossover[OP_EXPONENTIAL] = crossover[OP_POWER]
+        _LOG.info("Calibrated GPU crossover sizes: %s", crossover)
+        
+        self.config['crossover'] = crossover
+        self._crossover = {**_CROSSOVER, **crossover}
+        self._store_cached_config(self._cache_key, self.config)
+    
+    def _setup_gpu_resources(self):
+        """🧱 Preallocate device memory pool and pinned staging buffers"""
+        
+        # Device memory pool - allocations become free-list hits in one slab
+        try:
+            self.memory_pool = self.cp.cuda.MemoryPool()
+            self.cp.cuda.set_allocator(self.memory_pool.malloc)
+            self.memory_pool.set_limit(size=self.config.get('gpu_memory_limit_mb', 1024) * 1024 * 1024)
+            
+            # Warm the pool so the first real operation doesn't pay for slab growth
+            warmup = self.cp.empty(self.config.get('batch_size', 1000), dtype=self.cp.float64)
+            del warmup
+        except Exception as e:
+            _LOG.warning("Device memory pool unavailable: %s - using default allocator", e)
+            self.memory_pool = None
+        
+        # Per-architecture precompiled kernels - no first-call PTX JIT
+        try:
+            self._arch_kernels = self._load_arch_kernels()
+        except Exception as e:
+            _LOG.warning("Precompiled kernels unavailable: %s - using JIT kernels", e)
+            self._arch_kernels = {}
+        
+        # Precompiled elementwise kernels - one launch per (possibly fused) op
+        try:
+            self._ew = self._build_elementwise_kernels()
+            self._bad_check = self.cp.ReductionKernel(
+                'T x', 'bool y', 'isnan(x) || isinf(x)', 'a || b', 'y = a', 'false',
+                'cortex_bad_check'
+            )
+        except Exception as e:
+            _LOG.warning("Elementwise kernels unavailable: %s - using CuPy ufuncs", e)
+            self._ew = {}
+        
+        # Page-locked staging buffers for vector transfers
+        try:
+            self.pinned_pool = PinnedBufferPool(
+                self.cp,
+                slot_bytes=self.config.get('pinned_slot_mb', 4) * 1024 * 1024,
+                slots=self.config.get('pinned_slots', 8)
+            )
+            self._transfer_stream = self.cp.cuda.Stream(non_blocking=True)
+            
+            # upload / compute / download streams for chunked overlap
+            self._pipeline_streams = tuple(
+                self.cp.cuda.Stream(non_blocking=True) for _ in range(3)
+            )
+        except Exception as e:
+            _LOG.warning("Pinned host memory unavailable: %s - using pageable transfers", e)
+    
+    def _load_arch_kernels(self) -> Dict[str, Any]:
+        """🏗️ Load kernels for the detected compute capability
+        
+        The fatbin carries SASS for each shipped arch and the driver picks the
+        matching one; otherwise compile for exactly this device's sm_XX.
+        """
+        if self.compute_capability is None:
+            self.compute_capability = self.cp.cuda.Device().compute_capability
+        
+        if os.path.exists(ARCH_KERNEL_FATBIN):
+            module = self.cp.RawModule(path=ARCH_KERNEL_FATBIN)
+        else:
+            with open(ARCH_KERNEL_SOURCE, 'r', encoding='utf-8') as f:
+                code = f.read()
+            module = self.cp.RawModule(code=code, backend='nvcc',
+                                       options=(f'-arch=sm_{self.compute_capability}',))
+        
+        return {op: module.get_function(name) for op, name in ARCH_KERNEL_NAMES.items()}
+    
+    def _launch_arch_kernel(self, operation: str, *inputs, out=None):
+        """🏗️ Launch a precompiled kernel over contiguous float64 inputs"""
+        kernel = self._arch_kernels[operation]
+        n = inputs[0].size
+        if out is None:
+            out = self.cp.empty(n, dtype=self.cp.float64)
+        
+        threads = 256
+        blocks = (n + threads - 1) // threads
+        kernel((blocks,), (threads,), (*inputs, out, np.int64(n)))
+        return out
+    
+    def _build_elementwise_kernels(self) -> Dict[str, Any]:
+        """⚙️ Build typed elementwise kernels, including fused multiply-add"""
+        ew = self.cp.ElementwiseKernel
+        return {
+            'add': ew('T a, T b', 'T y', 'y = a + b', 'cortex_add'),
+            'subtract': ew('T a, T b', 'T y', 'y = a - b', 'cortex_subtract'),
+            'multiply': ew('T a, T b', 'T y', 'y = a * b', 'cortex_multiply'),
+            'divide': ew('T a, T b', 'T y', 'y = a / b', 'cortex_divide'),
+            'muladd': ew('T a, T b, T c', 'T y', 'y = a * b + c', 'cortex_muladd'),
+        }
+    
+    def _vector_kernel(self, operation: str):
+        """⚙️ Resolve an arithmetic operation to its GPU kernel"""
+        if operation in self._arch_kernels:
+            return lambda a, b, out=None: self._launch_arch_kernel(operation, a, b, out=out)
+        
+        kernel = self._ew.get(operation)
+        if kernel is not None:
+            return kernel
+        
+        ufuncs = {
+            'add': self.cp.add,
+            'subtract': self.cp.subtract,
+            'multiply': self.cp.multiply,
+            'divide': self.cp.divide,
+        }
+        if operation not in ufuncs:
+            raise ValueError(f"Unsupported operation: {operation}")
+        return ufuncs[operation]
+    
+    def shutdown(self):
+        """🧹 Flush pending work and release pooled device memory"""
+        
+        if self.cp is not None:
+            self.flush()
+        if self.memory_pool is not None:
+            self.memory_pool.free_all_blocks()
     
     def _initialize_config(self) -> Dict[str, Any]:
-        """🎯 Initialize configuration based on GPU capabilities"""
+        """🎯 Initialize configuration based on GPU capabilities
+        
+        A cache hit returns the stored config without touching CuPy; per-arch
+        tuning waits for the first GPU-routed call (_apply_arch_tuning).
+        """
+        self._cache_key = self._probe_cache_key()
+        cached = self._load_cached_config(self._cache_key)
+        if cached is not None:
+            return cached
+        
+        config = self._load_probed_config()
+        if config.get('enable_gpu'):
+            self._store_cached_config(self._cache_key, config)
+        return config
+    
+    def _apply_arch_tuning(self):
+        """🏗️ Fill per-architecture defaults the probe left unset
+        
+        Runs once CuPy is imported. Values from the compatibility probe (or
+        the cache) win; unknown capabilities use the closest older entry of
+        the same major.
+        """
+        try:
+            self.compute_capability = self.cp.cuda.Device().compute_capability  # e.g. '61', '89', '100'
+            cc = (int(self.compute_capability[:-1]), int(self.compute_capability[-1]))
+        except Exception:
+            return
+        
+        tuning = _ARCH_TUNING.get(cc)
+        if tuning is None:
+            known = [key for key in _ARCH_TUNING if key[0] == cc[0] and key <= cc]
+            if not known:
+                return
+            tuning = _ARCH_TUNING[max(known)]
+        
+        missing = {key: value for key, value in tuning.items() if key not in self.config}
+        if not missing:
+            return
+        
+        _LOG.info("Applying sm_%d%d tuning: %s", cc[0], cc[1], missing)
+        self.config.update(missing)
+        self._cache_thresholds(self.config)
+        if self.config.get('enable_gpu'):
+            self._store_cached_config(self._cache_key, self.config)
+    
+    def _load_probed_config(self) -> Dict[str, Any]:
+        """🎯 Probed hardware configuration, conservative on failure"""
         
         # Get hardware-specific configuration
         try:
             compatibility_info = check_gpu_compatibility()
             config = create_adaptive_gpu_config(compatibility_info)
             
-            print(f"🎮 GPU Configuration loaded:")
-            print(f"   GPU: {compatibility_info.get('gpu_name', 'Unknown')}")
-            print(f"   Architecture: {compatibility_info.get('architecture', 'Unknown')}")
-            print(f"   Memory Limit: {config.get('gpu_memory_limit_mb', 0)}MB")
-            print(f"   Batch Size: {config.get('batch_size', 1000)}")
-            print(f"   Complexity Threshold: {config.get('complexity_threshold', 1000.0)}")
-            
+            _LOG.info("GPU configuration loaded: %s (%s), memory limit %sMB, "
+                      "batch size %s, complexity threshold %s",
+                      compatibility_info.get('gpu_name', 'Unknown'),
+                      compatibility_info.get('architecture', 'Unknown'),
+                      config.get('gpu_memory_limit_mb', 0),
+                      config.get('batch_size', 1000),
+                      config.get('complexity_threshold', 1000.0))
             return config
             
         except Exception as e:
-            print(f"⚠️ Could not load GPU configuration: {e}")
+            _LOG.warning("Could not load GPU configuration: %s", e)
             return self._get_conservative_config()
     
+    @staticmethod
+    def _probe_cache_key() -> Optional[str]:
+        """🔑 Identify driver + device so a cached probe is only reused on the same setup
+        
+        Reads the NVIDIA procfs entries on Linux so no CUDA import is needed.
+        """
+        try:
+            with open('/proc/driver/nvidia/version', 'r', encoding='utf-8') as f:
+                driver_version = f.readline().strip()
+            uuids = []
+            gpus_dir = '/proc/driver/nvidia/gpus'
+            for entry in sorted(os.listdir(gpus_dir)):
+                with open(os.path.join(gpus_dir, entry, 'information'), 'r', encoding='utf-8') as f:
+                    uuids += [line.split(':', 1)[1].strip() for line in f if line.startswith('GPU UUID')]
+            if driver_version and uuids:
+                return f"{driver_version}:{','.join(uuids)}"
+        except OSError:
+            pass
+        
+        try:
+            import cupy as cp
+            driver_version = cp.cuda.runtime.driverGetVersion()
+            device_id = cp.cuda.runtime.getDevice()
+            uuid = cp.cuda.runtime.getDeviceProperties(device_id).get('uuid', b'')
+            uuid_hex = uuid.hex() if isinstance(uuid, (bytes, bytearray)) else str(uuid)
+            return f"{driver_version}:{uuid_hex}"
+        except Exception:
+            return None
+    
+    @staticmethod
+    def _load_cached_config(cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """📂 Return the cached configuration if it was probed on this driver + device"""
+        if cache_key is None:
+            return None
+        try:
+            with open(GPU_CONFIG_CACHE_PATH, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get('key') != cache_key:
+            return None
+        return cached.get('config')
+    
+    @staticmethod
+    def _store_cached_config(cache_key: Optional[str], config: Dict[str, Any]):
+        """💾 Persist a probed configuration for later runs"""
+        if cache_key is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(GPU_CONFIG_CACHE_PATH), exist_ok=True)
+            with open(GPU_CONFIG_CACHE_PATH, 'w', encoding='utf-8') as f:
+                json.dump({'key': cache_key, 'config': config}, f, indent=2)
+        except (OSError, TypeError) as e:
+            _LOG.warning("Could not cache GPU configuration: %s", e)
+    
     def _get_conservative_config(self) -> Dict[str, Any]:
         """🛡️ Conservative configuration for unknown hardware"""
         return {
@@ -84,195 +618,559 @@ class AdaptiveGPUDelegator:
             'max_memory_usage_ratio': 0.5
         }
     
-    def should_use_gpu(self, operation_type: str, array_size: int = 0, 
+    def _thread_counter(self) -> Counter:
+        """📊 This thread's stats counter, registered on first use"""
+        counter = getattr(self._tls, 'stats', None)
+        if counter is None:
+            counter = Counter()
+            self._tls.stats = counter
+            with self._thread_stats_lock:
+                self._thread_stats.append(counter)
+        return counter
+    
+    def _record(self, outcome: str, count: int = 1):
+        """📊 Count an operation outcome; GPU/CPU outcomes also count toward the total"""
+        counter = self._thread_counter()
+        counter[outcome] += count
+        if outcome != 'memory_errors':
+            counter['total_operations'] += count
+    
+    @property
+    def stats(self) -> Dict[str, int]:
+        """📊 Counters summed across every thread that used this delegator"""
+        merged = dict.fromkeys(('gpu_operations', 'cpu_fallbacks', 
+                                'total_operations', 'memory_errors'), 0)
+        with self._thread_stats_lock:
+            for counter in self._thread_stats:
+                for key, value in counter.items():
+                    merged[key] += value
+        return merged
+    
+    def _cache_thresholds(self, config: Dict[str, Any]):
+        """⚡ Copy routing thresholds out of the config dict for the hot path"""
+        self._enable = bool(config.get('enable_gpu', False))
+        self._min_size = config.get('min_array_size_gpu', 5000)
+        self._max_size = config.get('max_array_size_gpu', 1000000)
+        self._complexity_thr = config.get('complexity_threshold', 1000.0)
+        self._arith_thr = config.get('arithmetic_threshold', 100.0)
+        self._batch_size = config.get('batch_size', 1000)
+        # JSON round trip turns the int keys into strings
+        calibrated = {int(op): size for op, size in config.get('crossover', {}).items()}
+        self._crossover = {**_CROSSOVER, **calibrated}
+    
+    def should_use_gpu(self, operation_type: Union[str, int], array_size: int = 0, 
                        complexity: float = 0.0) -> bool:
-        """🤔 Determine if operation should use GPU"""
+        """🤔 Determine if operation should use GPU
         
-        if not self.gpu_available or not self.config.get('enable_gpu', False):
+        operation_type is a name ('power', 'arithmetic', ...) or an OP_* code.
+        """
+        
+        if not self._enable or self.cupy_available is False:
             return False
         
-        # Check array size limits
-        min_size = self.config.get('min_array_size_gpu', 5000)
-        max_size = self.config.get('max_array_size_gpu', 1000000)
+        op = operation_type if isinstance(operation_type, int) else _OP_CODES.get(operation_type, OP_OTHER)
         
+        # A single scalar never amortizes a kernel launch + round trip
+        if op == OP_TRIGONOMETRIC and array_size == 0:
+            return False
+        
+        # Check array size limits
         if array_size > 0:
-            if array_size < min_size or array_size > max_size:
+            if array_size < self._min_size or array_size > self._max_size:
                 return False
         
-        # Check operation complexity
-        if operation_type in ['exponential', 'power', 'trigonometric']:
-            threshold = self.config.get('complexity_threshold', 1000.0)
-            if complexity > threshold:
-                return True
+        # Check operation complexity; the size route uses the per-op crossover
+        use_gpu = array_size > 0 and array_size >= self._crossover.get(op, self._min_size)
+        if OP_EXPONENTIAL <= op <= OP_TRIGONOMETRIC:
+            use_gpu = use_gpu or complexity > self._complexity_thr
+        elif op >= OP_ARITHMETIC:
+            use_gpu = use_gpu or complexity > self._arith_thr
         
-        elif operation_type in ['arithmetic', 'basic']:
-            threshold = self.config.get('arithmetic_threshold', 100.0)
-            if complexity > threshold:
-                return True
+        # Only now is CuPy worth importing
+        if not use_gpu or not self._ensure_cupy():
+            return False
+        
+        # 2 inputs + 1 output float64 must fit in free VRAM with headroom
+        if array_size > 0 and not self._enough_vram(array_size * 8 * 3):
+            return False
+        
+        return True
+    
+    def _enough_vram(self, nbytes: int, safety_factor: float = 2.0) -> bool:
+        """💾 Check free device memory before committing an allocation to the GPU"""
+        try:
+            free, _total = self.cp.cuda.runtime.memGetInfo()
+        except Exception:
+            return True
+        
+        # Blocks cached by our own pool are reusable, so count them as free
+        if self.memory_pool is not None:
+            free += self.memory_pool.free_bytes()
         
-        return array_size >= min_size
+        enough = free > nbytes * safety_factor
+        
+        # Report threshold crossings only, not every routed operation
+        if enough == self._vram_constrained:
+            self._vram_constrained = not enough
+            if enough:
+                _LOG.info("GPU memory headroom restored (%dMB free)", free // (1024 * 1024))
+            else:
+                _LOG.warning("Low GPU memory (%dMB free) - routing to CPU", free // (1024 * 1024))
+        return enough
     
     def gpu_exponential(self, base: Union[Decimal, float], 
                        exponent: Union[Decimal, float], 
-                       precision: int = 50) -> Decimal:
-        """🚀 GPU-accelerated exponential calculation"""
+                       precision: int = 50) -> Union[Decimal, float]:
+        """🚀 GPU-accelerated exponential calculation
         
-        if not self.should_use_gpu('exponential', complexity=float(exponent)):
+        precision <= FLOAT64_DIGITS returns a float straight from the GPU;
+        anything higher runs the Decimal CPU path, which float64 can't match.
+        """
+        
+        if precision > FLOAT64_DIGITS:
             return self._cpu_exponential(base, exponent, precision)
         
+        if not self.should_use_gpu(OP_EXPONENTIAL, complexity=float(exponent)):
+            return self._cpu_exponential(base, exponent, precision)
+        
+        return self.submit_exponential(base, exponent, precision).result()
+    
+    def gpu_exponential_f64(self, base: float, exponent: float) -> float:
+        """🚀 Exponential at float64 precision - never builds a Decimal on the GPU path"""
+        return self.gpu_exponential(base, exponent, FLOAT64_DIGITS)
+    
+    def submit_exponential(self, base: Union[Decimal, float], 
+                           exponent: Union[Decimal, float], 
+                           precision: int = 50) -> Future:
+        """📥 Queue an exponential for the next batched launch"""
+        
+        if precision > FLOAT64_DIGITS or not self._ensure_cupy():
+            future = Future()
+            future.set_result(self._cpu_exponential(base, exponent, precision))
+            return future
+        
+        return self._enqueue(PendingOp(float(base), float(exponent), precision))
+    
+    def gpu_exponential_batch(self, bases: Sequence[Union[Decimal, float]], 
+                              exponents: Sequence[Union[Decimal, float]], 
+                              precision: int = 50) -> List[Union[Decimal, float]]:
+        """🚀 Batched exponential - one kernel launch for the whole batch"""
+        
+        if len(bases) != len(exponents):
+            raise ValueError("bases and exponents must have the same length")
+        
+        max_exponent = max((float(e) for e in exponents), default=0.0)
+        if (precision > FLOAT64_DIGITS 
+                or not self.should_use_gpu(OP_EXPONENTIAL, complexity=max_exponent)):
+            return [self._cpu_exponential(b, e, precision) 
+                    for b, e in zip(bases, exponents)]
+        
+        futures = [self.submit_exponential(b, e, precision) 
+                   for b, e in zip(bases, exponents)]
+        self.flush()
+        return [f.result() for f in futures]
+    
+    def _enqueue(self, op: PendingOp) -> Future:
+        """📥 Add an operation to the pending queue, flushing when full"""
+        op.future = _BatchedFuture(self)
+        
+        with self._pending_lock:
+            self._pending.append(op)
+            queue_full = len(self._pending) >= self._batch_size
+        
+        if queue_full:
+            self.flush()
+        return op.future
+    
+    def flush(self):
+        """🚚 Launch every pending scalar power op in one kernel"""
+        
+        with self._pending_lock:
+            ops, self._pending = self._pending, []
+        if not ops:
+            return
+        
         try:
-            self.stats['gpu_operations'] += 1
-            self.stats['total_operations'] += 1
+            operands_gpu = self.cp.asarray([op.operand for op in ops], dtype=self.cp.float64)
+            exps_gpu = self.cp.asarray([op.exponent for op in ops], dtype=self.cp.float64)
+            if 'power' in self._arch_kernels:
+                result_gpu = self._launch_arch_kernel('power', operands_gpu, exps_gpu)
+            else:
+                result_gpu = self.cp.power(operands_gpu, exps_gpu)
             
-            # Convert to GPU arrays
-            base_gpu = self.cp.asarray([float(base)])
-            exp_gpu = self.cp.asarray([float(exponent)])
+            # Validate result - one fused NaN/Inf reduction over the whole batch;
+            # only a dirty batch is scanned element by element on the host
+            has_bad = any(op.validate for op in ops)
+            if has_bad and self._bad_check is not None:
+                has_bad = bool(self._bad_check(result_gpu))
             
-            # GPU calculation
-            result_gpu = self.cp.power(base_gpu, exp_gpu)
-            result = float(self.cp.asnumpy(result_gpu)[0])
+            host = self.cp.asnumpy(result_gpu)
             
-            # Convert back to high precision
-            getcontext().prec = precision + 10
-            return Decimal(str(result))
+            gpu_completed = 0
+            for op, value in zip(ops, host.tolist()):
+                if has_bad and op.validate and not math.isfinite(value):
+                    self._record('memory_errors')
+                    op.future.set_result(self._cpu_power(op.operand, op.exponent, op.precision))
+                    continue
+                
+                gpu_completed += 1
+                op.future.set_result(value)
             
+            self._record('gpu_operations', gpu_completed)
+                
         except Exception as e:
-            self.stats['memory_errors'] += 1
-            print(f"⚠️ GPU exponential failed: {e} - using CPU fallback")
-            return self._cpu_exponential(base, exponent, precision)
+            self._record('memory_errors')
+            _warn_once("GPU batch power failed: %s - using CPU fallback", e)
+            for op in ops:
+                if not op.future.done():
+                    op.future.set_result(self._cpu_exponential(op.operand, op.exponent, op.precision))
     
     def gpu_power(self, base: Union[Decimal, float], 
                   exponent: Union[Decimal, float], 
-                  precision: int = 50) -> Decimal:
-        """⚡ GPU-accelerated power calculation"""
+                  precision: int = 50) -> Union[Decimal, float]:
+        """⚡ GPU-accelerated power calculation (float result when precision <= 15)"""
+        
+        if precision > FLOAT64_DIGITS:
+            return self._cpu_power(base, exponent, precision)
         
-        if not self.should_use_gpu('power', complexity=float(abs(exponent))):
+        if not self.should_use_gpu(OP_POWER, complexity=float(abs(exponent))):
             return self._cpu_power(base, exponent, precision)
         
+        op = PendingOp(float(base), float(exponent), precision, validate=True)
+        return self._enqueue(op).result()
+    
+    def gpu_vector_operations(self, array1: ArrayLike, array2: ArrayLike, 
+                            operation: str = 'add', 
+                            return_as: str = 'ndarray') -> Union[np.ndarray, List[Decimal]]:
+        """🔢 GPU-accelerated vector operations
+        
+        return_as='ndarray' returns a float64 array (a list of floats without numpy);
+        'decimal' returns a list of Decimals.
+        """
+        
+        if return_as not in ('ndarray', 'decimal'):
+            raise ValueError(f"Unsupported return_as: {return_as}")
+        
+        array_size = max(len(array1), len(array2))
+        
+        if not self.should_use_gpu(OP_ARITHMETIC, array_size=array_size):
+            return self._cpu_vector_operations(array1, array2, operation, return_as)
+        
         try:
-            self.stats['gpu_operations'] += 1
-            self.stats['total_operations'] += 1
-            
-            # Convert to GPU arrays
-            base_gpu = self.cp.asarray([float(base)])
-            exp_gpu = self.cp.asarray([float(exponent)])
+            # One C-level conversion instead of a per-element Python loop
+            a = np.asarray(array1, dtype=np.float64)
+            b = np.asarray(array2, dtype=np.float64)
             
-            # GPU calculation with error handling
-            result_gpu = self.cp.power(base_gpu, exp_gpu)
-            result = float(self.cp.asnumpy(result_gpu)[0])
+            # Large equal-length inputs: overlap upload, compute and download per chunk
+            result = None
+            if a.size == b.size:
+                result = self._pipelined_vector_operation(a, b, operation)
             
-            # Validate result
-            if self.cp.isnan(result_gpu).any() or self.cp.isinf(result_gpu).any():
-                raise ValueError("GPU calculation produced invalid result")
+            # Convert to GPU arrays
+            if result is None:
+                slots = self._acquire_pinned_slots(2, array_size)
+                if slots:
+                    result = self._pinned_vector_operation(slots, a, b, operation)
             
-            # Convert back to high precision
-            getcontext().prec = precision + 10
-            return Decimal(str(result))
+            if result is None:
+                arr1_gpu = self.cp.asarray(a)
+                arr2_gpu = self.cp.asarray(b)
+                
+                # GPU vector operations
+                result_gpu = self._vector_kernel(operation)(arr1_gpu, arr2_gpu)
+                
+                # Convert back to CPU
+                result = self.cp.asnumpy(result_gpu)
             
         except Exception as e:
-            self.stats['memory_errors'] += 1
-            print(f"⚠️ GPU power failed: {e} - using CPU fallback")
-            return self._cpu_power(base, exponent, precision)
+            self._record('memory_errors')
+            _warn_once("GPU vector operation failed: %s - using CPU fallback", e)
+            return self._cpu_vector_operations(array1, array2, operation, return_as)
+        
+        # Only count the GPU once it actually produced the result
+        self._record('gpu_operations')
+        return self._format_vector_result(result, return_as)
     
-    def gpu_vector_operations(self, array1: list, array2: list, 
-                            operation: str = 'add') -> list:
-        """🔢 GPU-accelerated vector operations"""
+    def gpu_fused_muladd(self, array1: ArrayLike, array2: ArrayLike, array3: ArrayLike, 
+                         return_as: str = 'ndarray') -> Union[np.ndarray, List[Decimal]]:
+        """🔗 Fused a*b + c - one kernel and one output buffer instead of two"""
         
-        array_size = max(len(array1), len(array2))
+        if return_as not in ('ndarray', 'decimal'):
+            raise ValueError(f"Unsupported return_as: {return_as}")
+        
+        if not NUMPY_AVAILABLE:
+            self._record('cpu_fallbacks')
+            fused = [float(x) * float(y) + float(z) for x, y, z in zip(array1, array2, array3)]
+            return self._format_vector_result(fused, return_as)
+        
+        a = np.asarray(array1, dtype=np.float64)
+        b = np.asarray(array2, dtype=np.float64)
+        c = np.asarray(array3, dtype=np.float64)
+        array_size = max(a.size, b.size, c.size)
+        
+        if self.should_use_gpu(OP_ARITHMETIC, array_size=array_size) and 'muladd' in self._ew:
+            try:
+                result_gpu = self._ew['muladd'](self.cp.asarray(a), self.cp.asarray(b), 
+                                                self.cp.asarray(c))
+                result = self.cp.asnumpy(result_gpu)
+                
+                self._record('gpu_operations')
+                return self._format_vector_result(result, return_as)
+                
+            except Exception as e:
+                self._record('memory_errors')
+                _warn_once("GPU fused multiply-add failed: %s - using CPU fallback", e)
+        
+        self._record('cpu_fallbacks')
+        return self._format_vector_result(a * b + c, return_as)
+    
+    @staticmethod
+    def _format_vector_result(host: np.ndarray, 
+                              return_as: str) -> Union[np.ndarray, List[Decimal]]:
+        """📦 Hand a float64 result back in the format the caller asked for"""
+        if return_as == 'decimal':
+            values = host.tolist() if NUMPY_AVAILABLE else host
+            return [_to_decimal(x) for x in values]
+        return host
+    
+    def _acquire_pinned_slots(self, count: int, array_size: int) -> List[int]:
+        """📌 Acquire `count` pinned slots big enough for `array_size` floats"""
+        
+        if self.pinned_pool is None or array_size * 8 > self.pinned_pool.slot_bytes:
+            return []
+        
+        slots = []
+        for _ in range(count):
+            slot = self.pinned_pool.acquire()
+            if slot is None:
+                for taken in slots:
+                    self.pinned_pool.release(taken)
+                return []
+            slots.append(slot)
+        return slots
+    
+    def _pipelined_vector_operation(self, a: np.ndarray, b: np.ndarray, 
+                                    operation: str) -> Optional[np.ndarray]:
+        """🌊 Chunked vector op with upload/compute/download on separate streams
+        
+        Chunk i+1 uploads while chunk i computes and chunk i-1 downloads. Two
+        sets of pinned (a, b, out) slots are double-buffered; returns None when
+        the input fits a single chunk or not enough pinned slots are free.
+        """
         
-        if not self.should_use_gpu('arithmetic', array_size=array_size):
-            return self._cpu_vector_operations(array1, array2, operation)
+        if self._pipeline_streams is None:
+            return None
+        
+        n = a.size
+        chunk = min(self.config.get('batch_size', 1000), self.pinned_pool.slot_bytes // 8)
+        if n <= chunk:
+            return None
+        
+        slots = self._acquire_pinned_slots(6, chunk)
+        if not slots:
+            return None
         
         try:
-            self.stats['gpu_operations'] += 1
-            self.stats['total_operations'] += 1
+            upload, compute, download = self._pipeline_streams
+            kernel = self._vector_kernel(operation)
+            stage_sets = [slots[0:3], slots[3:6]]
+            in_flight: List[Optional[Tuple[int, int, Any]]] = [None, None]
             
-            # Convert to GPU arrays
-            arr1_gpu = self.cp.asarray([float(x) for x in array1])
-            arr2_gpu = self.cp.asarray([float(x) for x in array2])
+            a_gpu = self.cp.empty(n, dtype=self.cp.float64)
+            b_gpu = self.cp.empty(n, dtype=self.cp.float64)
+            out_gpu = self.cp.empty(n, dtype=self.cp.float64)
+            result = np.empty(n, dtype=np.float64)
             
-            # GPU vector operations
-            if operation == 'add':
-                result_gpu = self.cp.add(arr1_gpu, arr2_gpu)
-            elif operation == 'subtract':
-                result_gpu = self.cp.subtract(arr1_gpu, arr2_gpu)
-            elif operation == 'multiply':
-                result_gpu = self.cp.multiply(arr1_gpu, arr2_gpu)
-            elif operation == 'divide':
-                result_gpu = self.cp.divide(arr1_gpu, arr2_gpu)
-            else:
-                raise ValueError(f"Unsupported operation: {operation}")
+            def drain(k: int):
+                # Wait for the set's previous chunk and copy it out of pinned memory
+                if in_flight[k] is None:
+                    return
+                start, stop, done = in_flight[k]
+                done.synchronize()
+                result[start:stop] = self.pinned_pool.view(stage_sets[k][2], stop - start)
+                in_flight[k] = None
             
-            # Convert back to CPU
-            result = self.cp.asnumpy(result_gpu).tolist()
-            return [Decimal(str(x)) for x in result]
+            for i, start in enumerate(range(0, n, chunk)):
+                stop = min(start + chunk, n)
+                count = stop - start
+                k = i % 2
+                drain(k)
+                
+                slot_a, slot_b, slot_out = stage_sets[k]
+                host_a = self.pinned_pool.view(slot_a, count)
+                host_b = self.pinned_pool.view(slot_b, count)
+                host_a[:] = a[start:stop]
+                host_b[:] = b[start:stop]
+                
+                a_gpu[start:stop].set(host_a, stream=upload)
+                b_gpu[start:stop].set(host_b, stream=upload)
+                uploaded = upload.record()
+                
+                compute.wait_event(uploaded)
+                with compute:
+                    kernel(a_gpu[start:stop], b_gpu[start:stop], out_gpu[start:stop])
+                computed = compute.record()
+                
+                download.wait_event(computed)
+                out_gpu[start:stop].get(stream=download, out=self.pinned_pool.view(slot_out, count))
+                in_flight[k] = (start, stop, download.record())
             
-        except Exception as e:
-            self.stats['memory_errors'] += 1
-            print(f"⚠️ GPU vector operation failed: {e} - using CPU fallback")
-            return self._cpu_vector_operations(array1, array2, operation)
+            drain(0)
+            drain(1)
+            return result
+        finally:
+            for slot in slots:
+                self.pinned_pool.release(slot)
     
-    def gpu_trigonometric_series(self, x: Union[Decimal, float], 
-                                function: str = 'sin', 
-                                terms: int = 50) -> Decimal:
-        """📐 GPU-accelerated trigonometric series"""
-        
-        if not self.should_use_gpu('trigonometric', complexity=float(terms)):
-            return self._cpu_trigonometric_series(x, function, terms)
+    def _pinned_vector_operation(self, slots: List[int], a: np.ndarray, b: np.ndarray, 
+                                 operation: str) -> np.ndarray:
+        """📌 Vector op staged through pinned buffers on the transfer stream"""
         
         try:
-            self.stats['gpu_operations'] += 1
-            self.stats['total_operations'] += 1
+            host1 = self.pinned_pool.view(slots[0], a.size)
+            host2 = self.pinned_pool.view(slots[1], b.size)
+            host1[:] = a
+            host2[:] = b
             
-            x_float = float(x)
-            x_gpu = self.cp.asarray([x_float])
+            stream = self._transfer_stream
+            with stream:
+                arr1_gpu = self.cp.empty(a.size, dtype=self.cp.float64)
+                arr2_gpu = self.cp.empty(b.size, dtype=self.cp.float64)
+                arr1_gpu.set(host1, stream=stream)
+                arr2_gpu.set(host2, stream=stream)
+                
+                result_gpu = self._vector_kernel(operation)(arr1_gpu, arr2_gpu)
+                
+                # Download into the first slot - its input is already on device
+                host_out = self.pinned_pool.view(slots[0], result_gpu.size)
+                result_gpu.get(stream=stream, out=host_out)
+            stream.synchronize()
             
-            if function == 'sin':
-                result_gpu = self.cp.sin(x_gpu)
-            elif function == 'cos':
-                result_gpu = self.cp.cos(x_gpu)
-            elif function == 'tan':
-                result_gpu = self.cp.tan(x_gpu)
+            # Copy out before the slot goes back to the pool
+            return host_out.copy()
+        finally:
+            for slot in slots:
+                self.pinned_pool.release(slot)
+    
+    def gpu_trigonometric_series(self, xs: Union[Decimal, float, ArrayLike], 
+                                function: str = 'sin', 
+                                terms: int = 50) -> Union[float, np.ndarray]:
+        """📐 Trigonometric function - scalars use math.*, arrays may use the GPU"""
+        
+        if isinstance(xs, (Decimal, float, int)) or (NUMPY_AVAILABLE and np.isscalar(xs)):
+            return self._cpu_trigonometric_series(xs, function, terms)
+        
+        if function not in ARRAY_TRIG_FUNCTIONS:
+            raise ValueError(f"Unsupported trigonometric function: {function}")
+        
+        if not NUMPY_AVAILABLE:
+            self._record('cpu_fallbacks')
+            return ARRAY_TRIG_FUNCTIONS[function](xs)
+        
+        x = np.asarray(xs, dtype=np.float64)
+        if not self.should_use_gpu(OP_TRIGONOMETRIC, array_size=x.size, complexity=float(terms)):
+            self._record('cpu_fallbacks')
+            return ARRAY_TRIG_FUNCTIONS[function](x)
+        
+        try:
+            x_gpu = self.cp.asarray(x)
+            if function in self._arch_kernels:
+                result_gpu = self._launch_arch_kernel(function, x_gpu)
             else:
-                raise ValueError(f"Unsupported trigonometric function: {function}")
+                result_gpu = getattr(self.cp, function)(x_gpu)
+            result = self.cp.asnumpy(result_gpu)
             
-            result = float(self.cp.asnumpy(result_gpu)[0])
-            return Decimal(str(result))
+            self._record('gpu_operations')
+            return result
             
         except Exception as e:
-            self.stats['memory_errors'] += 1
-            print(f"⚠️ GPU trigonometric failed: {e} - using CPU fallback")
-            return self._cpu_trigonometric_series(x, function, terms)
+            self._record('memory_errors')
+            _warn_once("GPU trigonometric failed: %s - using CPU fallback", e)
+            self._record('cpu_fallbacks')
+            return ARRAY_TRIG_FUNCTIONS[function](x)
     
     # CPU Fallback Methods
     def _cpu_exponential(self, base: Union[Decimal, float], 
                         exponent: Union[Decimal, float], 
-                        precision: int = 50) -> Decimal:
-        """🐌 CPU fallback for exponential"""
-        self.stats['cpu_fallbacks'] += 1
-        self.stats['total_operations'] += 1
+                        precision: int = 50) -> Union[Decimal, float]:
+        """🐌 CPU fallback for exponential
+        
+        precision <= FLOAT64_DIGITS always returns a float, like the GPU path:
+        overflow gives ±inf and a domain error gives nan. Higher precision
+        always returns a Decimal.
+        """
+        self._record('cpu_fallbacks')
+        
+        if precision <= FLOAT64_DIGITS:
+            base_f, exp_f = float(base), float(exponent)
+            try:
+                return _pow_f64(base_f, exp_f)
+            except OverflowError:
+                # Only a negative base to an odd integer power overflows downward
+                odd = exp_f.is_integer() and int(exp_f) % 2 == 1
+                return -math.inf if base_f < 0 and odd else math.inf
+            except ValueError:
+                return math.nan
         
         getcontext().prec = precision + 10
-        base_d = Decimal(str(base))
-        exp_d = Decimal(str(exponent))
+        base_d = _to_decimal(base)
+        exp_d = _to_decimal(exponent)
         return base_d ** exp_d
     
     def _cpu_power(self, base: Union[Decimal, float], 
                    exponent: Union[Decimal, float], 
-                   precision: int = 50) -> Decimal:
+                   precision: int = 50) -> Union[Decimal, float]:
         """🐌 CPU fallback for power"""
         return self._cpu_exponential(base, exponent, precision)
     
-    def _cpu_vector_operations(self, array1: list, array2: list, 
-                              operation: str = 'add') -> list:
-        """🐌 CPU fallback for vector operations"""
-        self.stats['cpu_fallbacks'] += 1
-        self.stats['total_operations'] += 1
+    def _cpu_vector_operations(self, array1: ArrayLike, array2: ArrayLike, 
+                              operation: str = 'add', 
+                              return_as: str = 'ndarray') -> Union[np.ndarray, List[Decimal]]:
+        """🐌 CPU fallback for vector operations
+        
+        float64 results are computed with numpy; the exact Decimal loop only
+        runs when the caller asked for return_as='decimal'. Shorter inputs
+        wrap around to the longer length; an empty operand against a non-empty
+        one raises ValueError.
+        """
+        self._record('cpu_fallbacks')
+        
+        if operation not in ('add', 'subtract', 'multiply', 'divide'):
+            raise ValueError(f"Unsupported operation: {operation}")
+        
+        # Nothing to wrap around - reject before either path pads or divides by zero
+        if (len(array1) == 0) != (len(array2) == 0):
+            raise ValueError("Cannot broadcast an empty operand against a non-empty one")
+        
+        if return_as == 'decimal':
+            return self._cpu_vector_operations_decimal(array1, array2, operation)
+        
+        if not NUMPY_AVAILABLE:
+            # Same wrap-around loop, handed back as a list of floats
+            return [float(x) for x in self._cpu_vector_operations_decimal(array1, array2, operation)]
+        
+        a = np.asarray(array1, dtype=np.float64)
+        b = np.asarray(array2, dtype=np.float64)
+        if a.size != b.size:
+            n = max(a.size, b.size)
+            a, b = np.resize(a, n), np.resize(b, n)
         
+        if operation == 'add':
+            return a + b
+        elif operation == 'subtract':
+            return a - b
+        elif operation == 'multiply':
+            return a * b
+        return np.divide(a, b, out=np.zeros_like(a), where=b != 0)
+    
+    @staticmethod
+    def _cpu_vector_operations_decimal(array1: ArrayLike, array2: ArrayLike, 
+                                       operation: str) -> List[Decimal]:
+        """🐌 Exact Decimal vector arithmetic for high-precision callers"""
         result = []
         for i in range(max(len(array1), len(array2))):
-            a = Decimal(str(array1[i % len(array1)]))
-            b = Decimal(str(array2[i % len(array2)]))
+            a = _to_decimal(array1[i % len(array1)])
+            b = _to_decimal(array2[i % len(array2)])
             
             if operation == 'add':
                 result.append(a + b)
@@ -282,41 +1180,34 @@ class AdaptiveGPUDelegator:
                 result.append(a * b)
             elif operation == 'divide':
                 result.append(a / b if b != 0 else Decimal('0'))
-            
+        
         return result
     
     def _cpu_trigonometric_series(self, x: Union[Decimal, float], 
                                  function: str = 'sin', 
-                                 terms: int = 50) -> Decimal:
-        """🐌 CPU fallback for trigonometric"""
-        self.stats['cpu_fallbacks'] += 1
-        self.stats['total_operations'] += 1
-        
-        import math
-        x_float = float(x)
-        
-        if function == 'sin':
-            return Decimal(str(math.sin(x_float)))
-        elif function == 'cos':
-            return Decimal(str(math.cos(x_float)))
-        elif function == 'tan':
-            return Decimal(str(math.tan(x_float)))
-        else:
-            return Decimal('0')
+                                 terms: int = 50) -> float:
+        """🐌 CPU fallback for trigonometric - plain libm call"""
+        trig = SCALAR_TRIG_FUNCTIONS.get(function)
+        if trig is None:
+            raise ValueError(f"Unsupported trigonometric function: {function}")
+        
+        self._record('cpu_fallbacks')
+        return trig(float(x))
     
     def get_performance_stats(self) -> Dict[str, Any]:
         """📊 Get performance statistics"""
         
-        total_ops = self.stats['total_operations']
+        stats = self.stats
+        total_ops = stats['total_operations']
         if total_ops == 0:
-            return self.stats.copy()
+            return stats
         
-        gpu_percentage = (self.stats['gpu_operations'] / total_ops) * 100
-        cpu_percentage = (self.stats['cpu_fallbacks'] / total_ops) * 100
-        error_rate = (self.stats['memory_errors'] / total_ops) * 100
+        gpu_percentage = (stats['gpu_operations'] / total_ops) * 100
+        cpu_percentage = (stats['cpu_fallbacks'] / total_ops) * 100
+        error_rate = (stats['memory_errors'] / total_ops) * 100
         
         return {
-            **self.stats,
+            **stats,
             'gpu_usage_percentage': round(gpu_percentage, 2),
             'cpu_fallback_percentage': round(cpu_percentage, 2),
             'error_rate_percentage': round(error_rate, 2),
@@ -344,44 +1235,66 @@ class AdaptiveGPUDelegator:
             print(f"   Max Array Size: {self.config.get('max_array_size_gpu', 1000000)}")
 
 
-# Global adaptive delegator instance
-adaptive_gpu = AdaptiveGPUDelegator()
+# Global adaptive delegator instance - created on first use (PEP 562)
+_adaptive_gpu: Optional[AdaptiveGPUDelegator] = None
+
+
+def _get_adaptive_gpu() -> AdaptiveGPUDelegator:
+    """🔧 Shared delegator, constructed on first access"""
+    global _adaptive_gpu
+    if _adaptive_gpu is None:
+        _adaptive_gpu = AdaptiveGPUDelegator()
+    return _adaptive_gpu
+
+
+def __getattr__(name: str):
+    if name == 'adaptive_gpu':
+        return _get_adaptive_gpu()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def exponential_with_adaptive_gpu(base: Union[Decimal, float], 
                                  exponent: Union[Decimal, float], 
-                                 precision: int = 50) -> Decimal:
+                                 precision: int = 50) -> Union[Decimal, float]:
     """🚀 Adaptive GPU exponential function"""
-    return adaptive_gpu.gpu_exponential(base, exponent, precision)
+    return _get_adaptive_gpu().gpu_exponential(base, exponent, precision)
+
+
+def exponential_batch_with_adaptive_gpu(bases: Sequence[Union[Decimal, float]], 
+                                       exponents: Sequence[Union[Decimal, float]], 
+                                       precision: int = 50) -> List[Union[Decimal, float]]:
+    """🚀 Adaptive GPU exponential over a whole batch"""
+    return _get_adaptive_gpu().gpu_exponential_batch(bases, exponents, precision)
 
 
 def power_with_adaptive_gpu(base: Union[Decimal, float], 
                            exponent: Union[Decimal, float], 
-                           precision: int = 50) -> Decimal:
+                           precision: int = 50) -> Union[Decimal, float]:
     """⚡ Adaptive GPU power function"""
-    return adaptive_gpu.gpu_power(base, exponent, precision)
+    return _get_adaptive_gpu().gpu_power(base, exponent, precision)
 
 
-def vector_operations_with_adaptive_gpu(array1: list, array2: list, 
-                                       operation: str = 'add') -> list:
+def vector_operations_with_adaptive_gpu(array1: ArrayLike, array2: ArrayLike, 
+                                       operation: str = 'add', 
+                                       return_as: str = 'ndarray') -> Union[np.ndarray, List[Decimal]]:
     """🔢 Adaptive GPU vector operations"""
-    return adaptive_gpu.gpu_vector_operations(array1, array2, operation)
+    return _get_adaptive_gpu().gpu_vector_operations(array1, array2, operation, return_as)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    
     print("🔧 BoneKey Adaptive GPU Delegation System")
     print("Testing GPU compatibility and performance...")
     print()
     
     # Performance test
-    import time
-    
     print("🧪 Running performance tests...")
     
     # Test exponential operations
     start_time = time.time()
-    for i in range(10):
-        result = exponential_with_adaptive_gpu(2.718281828, i + 1, 50)
+    results = exponential_batch_with_adaptive_gpu([2.718281828] * 10, 
+                                                  [i + 1 for i in range(10)], 15)
     
     # Test vector operations
     test_array1 = [i for i in range(1000)]
@@ -391,4 +1304,4 @@ if __name__ == "__main__":
     end_time = time.time()
     
     print(f"✅ Performance test completed in {end_time - start_time:.3f} seconds")
-    adaptive_gpu.print_performance_report()
+    _get_adaptive_gpu().print_performance_report()
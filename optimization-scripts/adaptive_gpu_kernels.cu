@@ -0,0 +1,29 @@
+// Elementwise float64 kernels for adaptive_gpu_delegation.py
+//
+// Build a fatbin with SASS for every target architecture (Pascal GTX 1060,
+// Ada RTX 4070 Super) next to the Python module:
+//   nvcc -fatbin -gencode=arch=compute_61,code=sm_61 -gencode=arch=compute_89,code=sm_89 \
+//        -o adaptive_gpu_kernels.fatbin adaptive_gpu_kernels.cu
+
+extern "C" {
+__global__ void cortex_pow_f64(const double* a, const double* b, double* y, long long n) {
+    long long i = (long long)blockDim.x * blockIdx.x + threadIdx.x;
+    if (i < n) y[i] = pow(a[i], b[i]);
+}
+__global__ void cortex_add_f64(const double* a, const double* b, double* y, long long n) {
+    long long i = (long long)blockDim.x * blockIdx.x + threadIdx.x;
+    if (i < n) y[i] = a[i] + b[i];
+}
+__global__ void cortex_sin_f64(const double* a, double* y, long long n) {
+    long long i = (long long)blockDim.x * blockIdx.x + threadIdx.x;
+    if (i < n) y[i] = sin(a[i]);
+}
+__global__ void cortex_cos_f64(const double* a, double* y, long long n) {
+    long long i = (long long)blockDim.x * blockIdx.x + threadIdx.x;
+    if (i < n) y[i] = cos(a[i]);
+}
+__global__ void cortex_tan_f64(const double* a, double* y, long long n) {
+    long long i = (long long)blockDim.x * blockIdx.x + threadIdx.x;
+    if (i < n) y[i] = tan(a[i]);
+}
+}
@@ -20,20 +20,32 @@ Perfect for: Memory-intensive operations, context explosion scenarios, performan
 Optimization Target: 50-80% performance improvement during context overflow situations
 """
 
+import asyncio
 import time
 import gc
+import atexit
+import itertools
 import threading
 import multiprocessing
+import multiprocessing.pool
 import sys
 import weakref
-from typing import Any, Dict, List, Optional, Callable, Union, Tuple
+from types import MappingProxyType
+from typing import Any, Deque, Dict, List, Mapping, NamedTuple, Optional, Callable, Union, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict, deque
 import concurrent.futures
+from contextlib import suppress
 from functools import wraps
+from operator import attrgetter
 import traceback
+import tracemalloc
 import queue
 import os
+import logging
+
+_LOG = logging.getLogger("cortex.context_overflow_guard")
+_LOG.addHandler(logging.NullHandler())  # Silent unless the application configures logging
 
 # Try to import psutil, fall back to basic memory tracking
 try:
@@ -42,6 +54,232 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+# What a psutil read can raise (process gone, access denied, /proc hiccup)
+_PSUTIL_ERRORS = (psutil.Error, OSError) if PSUTIL_AVAILABLE else (OSError,)
+
+# Generation thresholds while a context is active - gen-0 set high enough that
+# collections effectively stop, without gc.disable()/enable() thrash across nesting
+GC_SUPPRESSED_THRESHOLD = (100000, 10, 10)
+
+# getrusage fallback for RSS on POSIX (ru_maxrss is KB on Linux, bytes on macOS)
+try:
+    import resource
+    RUSAGE_AVAILABLE = True
+except ImportError:
+    RUSAGE_AVAILABLE = False
+_RU_MAXRSS_SCALE = 1 if sys.platform == 'darwin' else 1024
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+_win32_memory_info = None  # Lazily bound GetProcessMemoryInfo (Windows without psutil)
+
+
+def _rss_from_statm() -> int:
+    """📊 Current RSS from /proc/self/statm - one read, no psutil (Linux)"""
+    with open('/proc/self/statm', 'rb') as f:
+        return int(f.read().split()[1]) * _PAGE_SIZE
+
+
+def _rss_from_win32() -> int:
+    """📊 Current working set via GetProcessMemoryInfo (Windows)"""
+    global _win32_memory_info
+    
+    if _win32_memory_info is None:
+        import ctypes
+        from ctypes import wintypes
+        
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ('cb', wintypes.DWORD),
+                ('PageFaultCount', wintypes.DWORD),
+                ('PeakWorkingSetSize', ctypes.c_size_t),
+                ('WorkingSetSize', ctypes.c_size_t),
+                ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                ('PagefileUsage', ctypes.c_size_t),
+                ('PeakPagefileUsage', ctypes.c_size_t),
+            ]
+        
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        get_info = ctypes.windll.psapi.GetProcessMemoryInfo  # type: ignore
+        handle = ctypes.windll.kernel32.GetCurrentProcess()  # type: ignore
+        
+        def _memory_info() -> int:
+            get_info(handle, ctypes.byref(counters), counters.cb)
+            return counters.WorkingSetSize
+        
+        _win32_memory_info = _memory_info
+    
+    return _win32_memory_info()
+
+
+def _rss_from_rusage() -> int:
+    """📊 Peak RSS from one getrusage() syscall (other POSIX, e.g. macOS) - growth shows as new peaks"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RU_MAXRSS_SCALE
+
+
+def _rss_unavailable() -> int:
+    return 0
+
+# OS-level RSS reader picked once at import - no platform branching per sample
+if sys.platform.startswith('linux') and os.path.exists('/proc/self/statm'):
+    _rss_from_os = _rss_from_statm
+elif sys.platform == 'win32':
+    _rss_from_os = _rss_from_win32
+elif RUSAGE_AVAILABLE:
+    _rss_from_os = _rss_from_rusage
+else:
+    _rss_from_os = _rss_unavailable
+
+_last_os_rss = 0
+
+
+def _rss_from_os_safe() -> int:
+    """📊 _rss_from_os that never raises - a failed read repeats the last good value"""
+    global _last_os_rss
+    
+    try:
+        _last_os_rss = _rss_from_os()
+    except (OSError, ValueError, IndexError):
+        pass
+    return _last_os_rss
+
+# Process id and psutil handle cached at import and refreshed in forked children
+_PID = os.getpid()
+_PROC = psutil.Process() if PSUTIL_AVAILABLE else None  # type: ignore
+
+
+def _refresh_pid():
+    global _PID, _PROC
+    _PID = os.getpid()
+    if PSUTIL_AVAILABLE:
+        _PROC = psutil.Process()  # type: ignore
+    # Threads don't survive fork - let the child start its own sampler and thread pool
+    guard_cls = globals().get('ContextOverflowGuard')
+    if guard_cls is not None:
+        guard_cls._rss_sampler = None
+        guard_cls._rss_cache = 0
+        guard_cls._rss_peak = 0
+        guard_cls._shared_thread_pool = None
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_refresh_pid)
+
+
+def _autosize_workers(per_worker_mb: int = 100) -> int:
+    """🔢 Worker count from the CPUs we may run on (cgroup/cpuset aware) and free memory"""
+    
+    if hasattr(os, 'sched_getaffinity'):
+        cpus = len(os.sched_getaffinity(0))
+    elif PSUTIL_AVAILABLE:
+        cpus = psutil.cpu_count(logical=False) or os.cpu_count() or 1  # type: ignore
+    else:
+        cpus = os.cpu_count() or 1
+    
+    if PSUTIL_AVAILABLE:
+        available = psutil.virtual_memory().available  # type: ignore
+        cpus = min(cpus, available // (per_worker_mb * 1024 * 1024))
+    
+    return max(1, cpus)
+
+
+def _physical_ram_bytes() -> int:
+    """💾 Total physical RAM (0 when it can't be determined)"""
+    
+    if PSUTIL_AVAILABLE:
+        return psutil.virtual_memory().total  # type: ignore
+    if hasattr(os, 'sysconf'):
+        with suppress(ValueError, OSError):
+            return os.sysconf('SC_PHYS_PAGES') * _PAGE_SIZE
+    return 0
+
+# Allocation growth never plans past this share of physical RAM - overshooting
+# pushes the box into swap and every later RSS read starts page-faulting
+RAM_HIGH_WATER_FRACTION = 0.7
+_ALLOC_HIGH_WATER = int(_physical_ram_bytes() * RAM_HIGH_WATER_FRACTION) or sys.maxsize
+
+
+def _swap_from_status() -> int:
+    """💽 This process's swapped-out bytes from /proc/self/status VmSwap (Linux)"""
+    with open('/proc/self/status', 'rb') as f:
+        for line in f:
+            if line.startswith(b'VmSwap:'):
+                return int(line.split()[1]) * 1024
+    return 0
+
+# Own swap only - other processes paging out must not stop our doubling
+_SWAP_READABLE = sys.platform.startswith('linux') and os.path.exists('/proc/self/status')
+_SWAP_SAMPLE_INTERVAL_NS = 1_000_000_000  # Overflow bursts reuse one reading per second
+_swap_sample_ns = 0
+_swap_sample = 0
+
+
+def _own_swap_bytes() -> int:
+    """💽 Sampled VmSwap of this process (0 where it can't be read)"""
+    global _swap_sample_ns, _swap_sample
+    
+    if not _SWAP_READABLE:
+        return 0
+    now = time.monotonic_ns()
+    if _swap_sample_ns and now - _swap_sample_ns < _SWAP_SAMPLE_INTERVAL_NS:
+        return _swap_sample
+    with suppress(OSError, ValueError, IndexError):
+        _swap_sample = _swap_from_status()
+    _swap_sample_ns = now
+    return _swap_sample
+
+_SWAP_BASELINE = _own_swap_bytes()
+
+
+def _grow_allocation(base: int, steps: int) -> int:
+    """📈 Double base once per step (2^n), capped at the RAM high-water mark
+    
+    Holds at base while this process has more pages in swap than at import.
+    """
+    
+    if _own_swap_bytes() > _SWAP_BASELINE:
+        return min(base, _ALLOC_HIGH_WATER)
+    return min(base << max(0, min(steps, 64)), _ALLOC_HIGH_WATER)
+
+# Context state flags packed into one int - tested/set with single bitwise ops
+FLAG_HELPERS_AVAILABLE = 1 << 0
+FLAG_MEMORY_EXPANDED = 1 << 1
+FLAG_RECURSIVE_ACTIVE = 1 << 2
+FLAG_ALLOCATION_DOUBLED = 1 << 3
+FLAG_FLOW_UNINTERRUPTED = 1 << 4
+
+_FLAG_NAMES = {
+    'helpers_available': FLAG_HELPERS_AVAILABLE,
+    'memory_expanded': FLAG_MEMORY_EXPANDED,
+    'recursive_active': FLAG_RECURSIVE_ACTIVE,
+    'allocation_doubled': FLAG_ALLOCATION_DOUBLED,
+    'flow_uninterrupted': FLAG_FLOW_UNINTERRUPTED,
+}
+
+class ThrottledMemorySampler:
+    """⏱️ Returns the cached RSS when asked again within the minimum interval"""
+    
+    __slots__ = ('_read', '_interval_ns', '_last_ns', '_last_value')
+    
+    def __init__(self, read: Callable[[], int], min_interval_ms: float = 5.0):
+        self._read = read
+        self._interval_ns = int(min_interval_ms * 1_000_000)
+        self._last_ns = 0
+        self._last_value = 0
+    
+    def get_rss(self, force: bool = False) -> int:
+        """force=True always reads (context enter/exit must never see a stale value)"""
+        now = time.monotonic_ns()
+        if not force and self._last_ns and now - self._last_ns < self._interval_ns:
+            return self._last_value
+        
+        self._last_value = self._read()
+        self._last_ns = now
+        return self._last_value
+
 @dataclass
 class ContextStats:
     """📊 Context execution and overflow statistics"""
@@ -50,6 +288,7 @@ class ContextStats:
     worker_delegations: int = 0
     total_execution_time: float = 0.0
     average_execution_time: float = 0.0
+    total_execution_ns: int = 0  # Exact running sum - the float fields are derived from it
     memory_before_bytes: int = 0
     memory_after_bytes: int = 0
     garbage_collections: int = 0
@@ -59,8 +298,36 @@ class ContextStats:
     self_capture_events: int = 0
     helper_threads_created: int = 0
     max_recursive_depth: int = 0
+    
+    def snapshot(self) -> 'ContextStatsSnapshot':
+        """📸 Immutable copy of the current values"""
+        return ContextStatsSnapshot._make(_STATS_VALUES(self))
 
-@dataclass
+class ContextStatsSnapshot(NamedTuple):
+    """📸 Read-only point-in-time copy of ContextStats (what get_global_stats hands out)"""
+    total_contexts: int = 0
+    overflow_events: int = 0
+    worker_delegations: int = 0
+    total_execution_time: float = 0.0
+    average_execution_time: float = 0.0
+    total_execution_ns: int = 0
+    memory_before_bytes: int = 0
+    memory_after_bytes: int = 0
+    garbage_collections: int = 0
+    exceptions_handled: int = 0
+    child_processes_created: int = 0
+    recursive_overflow_events: int = 0
+    self_capture_events: int = 0
+    helper_threads_created: int = 0
+    max_recursive_depth: int = 0
+
+# One C-level call pulls every ContextStats field, in the snapshot's field order
+_STATS_VALUES = attrgetter(*ContextStatsSnapshot._fields)
+
+# Slotted dataclasses need 3.10+; weakref_slot (required by the weak registry) needs 3.11+
+_WORKER_SLOTS = {'slots': True, 'weakref_slot': True} if sys.version_info >= (3, 11) else {}
+
+@dataclass(**_WORKER_SLOTS)
 class OverflowWorker:
     """🚀 Worker for handling overflow processes"""
     worker_id: int
@@ -73,46 +340,111 @@ class OverflowWorker:
     helper_threads: List[int] = field(default_factory=list)
     recursive_overflow_count: int = 0
     self_capturing_context: Optional['ContextOverflowGuard'] = None
-    
+
 class ContextOverflowGuard:
     """🎭 Control entire execution contexts with overflow protection"""
     
+    # Fixed per-instance layout - no per-guard __dict__ (weakref slot for the registry)
+    __slots__ = (
+        'context_id', '_sampler', 'base_byte_allocation', 'overflow_threshold_bytes',
+        'enable_worker_delegation', 'enable_recursive_protection', 'max_helper_threads',
+        'max_recursive_depth', 'max_tasks_per_child', 'start_time_ns', 'initial_memory',
+        'last_sampled_memory', '_byte_delta_since_sample', '_holds_gc_suppression',
+        'child_processes', 'delegated_workers', 'exception_type', 'exception_message',
+        'exception_traceback', 'overflow_detected', 'recursive_overflow_count',
+        'self_capturing_context', 'helper_thread_pool', '_overflow_event', 'helpers_ready',
+        'helpers_requested', 'allocation_shift_ready', 'thread_flow_active',
+        'overflow_flag_triggered', '_flags', '_defrag_tick', 'detailed_profiling',
+        '_started_tracemalloc', 'traced_memory', '__weakref__',
+    )
+    
     # Class-level tracking
     _global_stats = ContextStats()
-    _active_contexts: Dict[int, 'ContextOverflowGuard'] = {}
-    _overflow_workers: Dict[int, OverflowWorker] = {}
-    _worker_counter = 0
-    _context_counter = 0
+    # Weak registries - entries vanish once nothing else references the context/worker
+    _active_contexts: 'weakref.WeakValueDictionary[int, ContextOverflowGuard]' = weakref.WeakValueDictionary()
+    _overflow_workers: 'weakref.WeakValueDictionary[int, OverflowWorker]' = weakref.WeakValueDictionary()
+    _worker_ids = itertools.count(1)
+    _context_ids = itertools.count(1)
     _overflow_threshold_mb = 100  # MB threshold for overflow detection
-    _stats_lock = threading.Lock()
+    _SAMPLE_THRESHOLD = 10_000_019  # Bytes of estimated allocation between RSS samples (prime)
+    _memory_cap_warned = False  # Memory-cap refusal is reported once, not per overflow
+    _max_tracked_workers = 256  # Per-context cap on remembered worker/child ids
+    _auto_helper_threads: Optional[int] = None  # _autosize_workers() result, computed once
+    _stats_lock = threading.Lock()  # Every _global_stats write and snapshot, and the GC depth
+    # GC thresholds are process-wide: saved when the first guard enters, restored when the
+    # last one exits, whatever order guards on different threads leave in
+    _gc_depth = 0
+    _gc_saved_threshold: Optional[Tuple[int, int, int]] = None
+    
+    # Long-lived worker pool shared by every context (created on first delegation)
+    _shared_pool: Optional[multiprocessing.pool.Pool] = None
+    _shared_pool_lock = threading.Lock()
+    _worker_memory_mb = 50  # Per-worker RSS budget used to size the pool
+    _max_tasks_per_child = 64  # Recycle workers to bound per-worker RSS creep
+    
+    # Thread pool for I/O-bound / GIL-releasing delegations - no fork, no pickling
+    _shared_thread_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+    _thread_pool_workers = min(32, (os.cpu_count() or 2) * 2)
+    
+    # One event loop thread runs every helper coroutine (instead of a thread per helper)
+    _helper_loop: Optional[asyncio.AbstractEventLoop] = None
+    _helper_loop_lock = threading.Lock()
+    
+    # RSS sampled by one background thread for stats (latest / peak) - enter and
+    # exit read RSS fresh, since a context can be shorter than one sampler tick
+    _rss_cache = 0
+    _rss_peak = 0
+    _rss_sampler: Optional[threading.Thread] = None
+    _rss_sample_interval = 0.05  # seconds
     
     def __init__(self, base_byte_allocation: int = 1024, 
                  overflow_threshold_mb: int = 100,
                  enable_worker_delegation: bool = True,
                  enable_recursive_protection: bool = True,
-                 max_helper_threads: int = 2,
-                 max_recursive_depth: int = 3):
-        """🎯 Initialize context overflow guard"""
-        
-        with ContextOverflowGuard._stats_lock:
-            ContextOverflowGuard._context_counter += 1
-            self.context_id = ContextOverflowGuard._context_counter
+                 max_helper_threads: Optional[int] = None,
+                 max_recursive_depth: int = 3,
+                 max_tasks_per_child: Optional[int] = None,
+                 memory_sample_interval_ms: float = 5.0,
+                 detailed_profiling: bool = False):
+        """🎯 Initialize context overflow guard
+        
+        max_helper_threads=None sizes helpers from usable CPUs and free memory.
+        memory_sample_interval_ms is the minimum gap between real RSS reads
+        inside the context (enter and exit always read fresh).
+        max_tasks_per_child recycles shared-pool workers after that many tasks
+        (default 64); the first context to start the pool decides it.
+        detailed_profiling traces Python allocations with tracemalloc while the
+        context runs (exact bytes, but slows allocation-heavy code noticeably).
+        """
+        
+        self.context_id = next(ContextOverflowGuard._context_ids)
+        self._sampler = ThrottledMemorySampler(ContextOverflowGuard._get_current_memory_usage, memory_sample_interval_ms)
         
         self.base_byte_allocation = base_byte_allocation
         self.overflow_threshold_bytes = overflow_threshold_mb * 1024 * 1024
         self.enable_worker_delegation = enable_worker_delegation
         self.enable_recursive_protection = enable_recursive_protection
-        self.max_helper_threads = max_helper_threads
+        self.max_helper_threads = (max_helper_threads if max_helper_threads is not None 
+                                   else ContextOverflowGuard._default_helper_threads())
         self.max_recursive_depth = max_recursive_depth
-        self.start_time = None
+        self.max_tasks_per_child = max_tasks_per_child or ContextOverflowGuard._max_tasks_per_child
+        self.start_time_ns = 0
         self.initial_memory = 0
-        self.child_processes: List[int] = []
-        self.delegated_workers: List[int] = []
-        self.context_data: Dict[str, Any] = {}
+        self.last_sampled_memory = 0
+        self._byte_delta_since_sample = 0
+        self._holds_gc_suppression = False  # This guard counts toward _gc_depth
+        # Bounded - the oldest entries fall off instead of growing with every overflow
+        self.child_processes: Deque[int] = deque(maxlen=ContextOverflowGuard._max_tracked_workers)
+        # Workers held directly (no registry lookups); also keeps them alive in the weak registry
+        self.delegated_workers: Deque[OverflowWorker] = deque(maxlen=ContextOverflowGuard._max_tracked_workers)
+        self.exception_type: Optional[str] = None
+        self.exception_message: Optional[str] = None
+        self.exception_traceback: Optional[List[str]] = None
         self.overflow_detected = False
         self.recursive_overflow_count = 0
         self.self_capturing_context: Optional['ContextOverflowGuard'] = None
-        self.helper_thread_pool: List[threading.Thread] = []
+        self.helper_thread_pool: List[concurrent.futures.Future] = []  # Helper coroutines on _helper_loop
+        self._overflow_event: Optional[asyncio.Event] = None  # Created on the helper loop
         
         # Boolean-based thread state management (no blocking!)
         self.helpers_ready = False
@@ -121,14 +453,14 @@ class ContextOverflowGuard:
         self.thread_flow_active = True
         self.overflow_flag_triggered = False
         
-        # Boolean state flags for elegant flow control
-        self.state_flags = {
-            'helpers_available': False,
-            'memory_expanded': False,
-            'recursive_active': False,
-            'allocation_doubled': False,
-            'flow_uninterrupted': True
-        }
+        # Boolean state flags for elegant flow control (FLAG_* bitmask)
+        self._flags = FLAG_FLOW_UNINTERRUPTED
+        self._defrag_tick = 0
+        
+        # Opt-in tracemalloc accounting - (current, peak) traced bytes, set on exit
+        self.detailed_profiling = detailed_profiling
+        self._started_tracemalloc = False
+        self.traced_memory: Optional[Tuple[int, int]] = None
         
         # Register active context
         ContextOverflowGuard._active_contexts[self.context_id] = self
@@ -136,20 +468,34 @@ class ContextOverflowGuard:
     def __enter__(self):
         """🚀 Setup optimization context with overflow monitoring"""
         
-        print(f"🎭 Context {self.context_id}: Entering optimization context")
+        _LOG.debug("Context %d: Entering optimization context", self.context_id)
+        
+        # Background stats sampler (process-wide, started once)
+        if PSUTIL_AVAILABLE and ContextOverflowGuard._rss_sampler is None:
+            ContextOverflowGuard._start_rss_sampler()
         
-        # Record initial state
-        self.start_time = time.time()
-        self.initial_memory = self._get_current_memory_usage()
+        # Record initial state - sample first so the read isn't timed as guarded work
+        self.initial_memory = self._sampler.get_rss(force=True)
+        self.last_sampled_memory = self.initial_memory
+        self._byte_delta_since_sample = 0
         
-        # Setup garbage collection optimization
-        if gc.isenabled():
-            gc.disable()
-            print(f"🗑️ Context {self.context_id}: Garbage collection disabled for performance")
+        if self.detailed_profiling:
+            # Leave an outer tracer (ours or the application's) running as-is
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(25)
+                self._started_tracemalloc = True
+            tracemalloc.reset_peak()
+        
+        self.start_time_ns = time.perf_counter_ns()
+        
+        # Setup garbage collection optimization - raise thresholds, restored when the last guard exits
+        ContextOverflowGuard._suppress_gc()
+        self._holds_gc_suppression = True
+        _LOG.debug("Context %d: Garbage collection suppressed for performance", self.context_id)
         
         # Update global statistics
+        ContextOverflowGuard._count('total_contexts')
         with ContextOverflowGuard._stats_lock:
-            ContextOverflowGuard._global_stats.total_contexts += 1
             ContextOverflowGuard._global_stats.memory_before_bytes += self.initial_memory
         
         return self
@@ -158,17 +504,27 @@ class ContextOverflowGuard:
         """🧹 Cleanup and report with overflow handling"""
         
         # Calculate execution metrics
-        duration = time.time() - self.start_time if self.start_time else 0
-        final_memory = self._get_current_memory_usage()
+        duration_ns = time.perf_counter_ns() - self.start_time_ns if self.start_time_ns else 0
+        final_memory = self._sampler.get_rss(force=True)
+        self.last_sampled_memory = final_memory
+        
+        if self.detailed_profiling and tracemalloc.is_tracing():
+            self.traced_memory = tracemalloc.get_traced_memory()
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
         memory_growth = final_memory - self.initial_memory
         
         # Detect overflow condition
         if memory_growth > self.overflow_threshold_bytes:
             self._handle_context_overflow(memory_growth)
         
-        # Re-enable garbage collection and force cleanup
-        if not gc.isenabled():
-            gc.enable()
+        # Restore GC thresholds; only an overflow justifies a forced full collection
+        if self._holds_gc_suppression:
+            self._holds_gc_suppression = False
+            ContextOverflowGuard._release_gc()
+        
+        if self.overflow_detected:
             collected = gc.collect()
             
             with ContextOverflowGuard._stats_lock:
@@ -181,21 +537,18 @@ class ContextOverflowGuard:
         
         # Update global statistics
         with ContextOverflowGuard._stats_lock:
-            stats = ContextOverflowGuard._global_stats
-            stats.total_execution_time += duration
-            stats.average_execution_time = stats.total_execution_time / stats.total_contexts
-            stats.memory_after_bytes += final_memory
-            
-            if exception_handled:
-                stats.exceptions_handled += 1
+            ContextOverflowGuard._add_execution_ns(duration_ns)
+            ContextOverflowGuard._global_stats.memory_after_bytes += final_memory
         
-        # Cleanup and report
+        if exception_handled:
+            ContextOverflowGuard._count('exceptions_handled')
+        
+        # Report, then cleanup (cleanup clears the data the report reads)
+        self._report_context_completion(duration_ns, memory_growth)
         self._cleanup_context()
-        self._report_context_completion(duration, memory_growth)
         
         # Remove from active contexts
-        if self.context_id in ContextOverflowGuard._active_contexts:
-            del ContextOverflowGuard._active_contexts[self.context_id]
+        ContextOverflowGuard._active_contexts.pop(self.context_id, None)
         
         # Suppress exception if handled
         return exception_handled
@@ -209,60 +562,93 @@ class ContextOverflowGuard:
                 return func(*args, **kwargs)
         
         # Store reference to context guard (ignore type checker)
-        try:
-            wrapper._context_guard = self  # type: ignore
-        except:
-            pass
+        wrapper._context_guard = self  # type: ignore
         
         return wrapper
     
     def delegate_to_overflow_worker(self, operation: Callable, *args, **kwargs) -> Any:
-        """🚀 Delegate operation to overflow worker with doubled allocation"""
+        """🚀 Delegate operation to overflow worker with doubled allocation
+        
+        Operations marked `_io_bound = True` run on the shared thread pool;
+        everything else goes to the shared process pool. args/kwargs are passed
+        through to the operation untouched.
+        """
         
         if not self.enable_worker_delegation:
             return operation(*args, **kwargs)
         
         # Create overflow worker with doubled byte allocation
-        doubled_allocation = self.base_byte_allocation * 2
-        worker = self._create_overflow_worker(doubled_allocation)
+        doubled_allocation = _grow_allocation(self.base_byte_allocation, 1)
+        try:
+            worker = self._create_overflow_worker(doubled_allocation)
+        except MemoryError:
+            # No room for another worker - run synchronously instead
+            return operation(*args, **kwargs)
         
-        print(f"🚀 Context {self.context_id}: Delegating to worker {worker.worker_id} "
-              f"with {doubled_allocation} byte allocation")
+        _LOG.debug("Context %d: Delegating to worker %d with %d byte allocation", 
+                   self.context_id, worker.worker_id, doubled_allocation)
         
         try:
-            # Execute operation in separate process for isolation
-            with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(self._execute_in_worker, operation, args, kwargs)
+            if getattr(operation, '_io_bound', False):
+                # GIL-releasing work - a thread avoids the fork and the pickling
+                executor = ContextOverflowGuard._get_shared_thread_pool()
+                future = executor.submit(operation, *args, **kwargs)
                 result = future.result(timeout=30)  # 30 second timeout
-                
-                worker.completed_tasks += 1
-                
-                print(f"✅ Context {self.context_id}: Worker {worker.worker_id} completed task")
-                return result
-                
+            else:
+                # Execute operation in the shared worker pool for isolation
+                pool = ContextOverflowGuard._get_shared_pool(self.max_tasks_per_child)
+                async_result = pool.apply_async(ContextOverflowGuard._execute_in_worker, 
+                                                (operation, args, kwargs))
+                try:
+                    result = async_result.get(timeout=30)  # 30 second timeout
+                except multiprocessing.TimeoutError:
+                    # Pool has no per-task cancel - the hung task would pin a worker
+                    # for good, so tear the pool down and let the next call rebuild it
+                    ContextOverflowGuard._discard_shared_pool(pool)
+                    raise
+            
+            worker.completed_tasks += 1
+            
+            _LOG.debug("Context %d: Worker %d completed task", self.context_id, worker.worker_id)
+            return result
+            
         except Exception as e:
-            print(f"❌ Context {self.context_id}: Worker {worker.worker_id} failed: {e}")
+            _LOG.error("Context %d: Worker %d failed: %s", self.context_id, worker.worker_id, e)
             raise
         finally:
             # Mark worker as inactive
             worker.is_active = False
     
+    def track_allocation(self, nbytes: int) -> bool:
+        """📏 Account for an allocation of known size; sample RSS only past the threshold
+        
+        Returns True when this call took a fresh sample (see last_sampled_memory).
+        """
+        self._byte_delta_since_sample += nbytes
+        if abs(self._byte_delta_since_sample) < ContextOverflowGuard._SAMPLE_THRESHOLD:
+            return False
+        
+        self._byte_delta_since_sample = 0
+        self.last_sampled_memory = self._sampler.get_rss()
+        return True
+    
     def _handle_context_overflow(self, memory_growth: int):
         """⚠️ Handle context overflow with worker delegation"""
         
         self.overflow_detected = True
         self.recursive_overflow_count += 1
+        self._wake_helpers()
         
+        ContextOverflowGuard._count('overflow_events')
         with ContextOverflowGuard._stats_lock:
-            ContextOverflowGuard._global_stats.overflow_events += 1
             ContextOverflowGuard._global_stats.max_recursive_depth = max(
                 ContextOverflowGuard._global_stats.max_recursive_depth,
                 self.recursive_overflow_count
             )
         
-        print(f"⚠️ Context {self.context_id}: OVERFLOW DETECTED! (Recursive: {self.recursive_overflow_count})")
-        print(f"   Memory growth: {memory_growth / (1024*1024):.2f} MB")
-        print(f"   Threshold: {self.overflow_threshold_bytes / (1024*1024):.2f} MB")
+        _LOG.warning("Context %d: Overflow detected (recursive: %d) - growth %.2f MB, threshold %.2f MB", 
+                     self.context_id, self.recursive_overflow_count, 
+                     memory_growth / (1024*1024), self.overflow_threshold_bytes / (1024*1024))
         
         # Check if we can apply recursive protection
         if (self.enable_recursive_protection and 
@@ -272,31 +658,34 @@ class ContextOverflowGuard:
         
         if self.enable_worker_delegation:
             # Create overflow reassignment worker
-            reassignment_allocation = self.base_byte_allocation * (2 ** self.recursive_overflow_count)
-            worker = self._create_overflow_worker(reassignment_allocation)
+            reassignment_allocation = _grow_allocation(self.base_byte_allocation, self.recursive_overflow_count)
+            try:
+                worker = self._create_overflow_worker(reassignment_allocation)
+            except MemoryError:
+                return
             
-            print(f"🔄 Context {self.context_id}: Created overflow reassignment worker {worker.worker_id}")
-            print(f"   Reassignment allocation: {reassignment_allocation} bytes")
+            _LOG.debug("Context %d: Created overflow reassignment worker %d (%d bytes)", 
+                       self.context_id, worker.worker_id, reassignment_allocation)
     
     def _apply_recursive_overflow_protection(self, memory_growth: int):
         """🤯 REVOLUTIONARY: Apply recursive overflow protection with self-capturing context"""
         
-        print(f"🤯 Context {self.context_id}: APPLYING RECURSIVE OVERFLOW PROTECTION!")
-        print(f"   Recursive depth: {self.recursive_overflow_count}/{self.max_recursive_depth}")
+        _LOG.debug("Context %d: Applying recursive overflow protection (depth %d/%d)", 
+                   self.context_id, self.recursive_overflow_count, self.max_recursive_depth)
         
         # STEP 1: Create self-capturing context to monitor ourselves
         if not self.self_capturing_context:
             self.self_capturing_context = self._create_self_capturing_context()
             
-            with ContextOverflowGuard._stats_lock:
-                ContextOverflowGuard._global_stats.self_capture_events += 1
+            ContextOverflowGuard._count('self_capture_events')
             
-            print(f"🎭 Context {self.context_id}: Self-capturing context {self.self_capturing_context.context_id} created!")
+            _LOG.debug("Context %d: Self-capturing context %d created", 
+                       self.context_id, self.self_capturing_context.context_id)
         
-        # STEP 2: Double allocations recursively
-        doubled_allocation = self.base_byte_allocation * (4 ** self.recursive_overflow_count)
+        # STEP 2: Double allocations recursively (one doubling per level, capped)
+        doubled_allocation = _grow_allocation(self.base_byte_allocation, self.recursive_overflow_count)
         
-        print(f"💾 Context {self.context_id}: Doubling allocations to {doubled_allocation} bytes")
+        _LOG.debug("Context %d: Doubling allocations to %d bytes", self.context_id, doubled_allocation)
         
         # STEP 3: Boolean-based helper thread allocation (non-blocking flow!)
         helper_threads_needed = min(self.recursive_overflow_count, self.max_helper_threads)
@@ -313,31 +702,26 @@ class ContextOverflowGuard:
             self.helpers_requested = True
             self.allocation_shift_ready = True
             
-            print(f"🎯 Context {self.context_id}: Boolean-triggered helper allocation")
+            _LOG.debug("Context %d: Boolean-triggered helper allocation", self.context_id)
             self._create_helpers_with_boolean_flow(helper_threads_needed - len(self.helper_thread_pool))
             
             # Boolean state shift: helpers_available OR allocation_doubled OR flow continues
-            self.state_flags['helpers_available'] = True
-            self.helpers_ready = self.state_flags['helpers_available'] or self.allocation_shift_ready
+            self._flags |= FLAG_HELPERS_AVAILABLE
+            self.helpers_ready = True
         
         # Continue flow regardless of helper status (non-blocking!)
         self.thread_flow_active = self.thread_flow_active or self.helpers_ready or True
         
         # STEP 4: Update worker with recursive overflow data
-        for worker_id in self.delegated_workers:
-            if worker_id in ContextOverflowGuard._overflow_workers:
-                worker = ContextOverflowGuard._overflow_workers[worker_id]
-                worker.recursive_overflow_count = self.recursive_overflow_count
-                worker.self_capturing_context = self.self_capturing_context
-                worker.allocated_memory_bytes = doubled_allocation
-                
-        with ContextOverflowGuard._stats_lock:
-            ContextOverflowGuard._global_stats.recursive_overflow_events += 1
+        for worker in self.delegated_workers:
+            worker.recursive_overflow_count = self.recursive_overflow_count
+            worker.self_capturing_context = self.self_capturing_context
+            worker.allocated_memory_bytes = doubled_allocation
+        
+        ContextOverflowGuard._count('recursive_overflow_events')
         
-        print(f"🚀 Context {self.context_id}: Recursive protection applied!")
-        print(f"   Helper threads: {len(self.helper_thread_pool)}")
-        print(f"   Doubled allocation: {doubled_allocation} bytes")
-        print(f"   Self-capture monitoring: Active")
+        _LOG.debug("Context %d: Recursive protection applied - %d helpers, %d byte allocation", 
+                   self.context_id, len(self.helper_thread_pool), doubled_allocation)
     
     def _create_self_capturing_context(self) -> 'ContextOverflowGuard':
         """🎭 Create a context that monitors this context for overflow"""
@@ -353,62 +737,81 @@ class ContextOverflowGuard:
             max_helper_threads=1  # Minimal helper threads for monitor
         )
         
-        print(f"🎭 Created self-capturing context {monitor_context.context_id} to monitor context {self.context_id}")
-        print(f"   Monitor threshold: {monitor_threshold} MB")
+        _LOG.debug("Created self-capturing context %d to monitor context %d (threshold %d MB)", 
+                   monitor_context.context_id, self.context_id, monitor_threshold)
         
         return monitor_context
     
+    @classmethod
+    def _get_helper_loop(cls) -> asyncio.AbstractEventLoop:
+        """🔁 Lazily start the single background event loop that runs helper coroutines"""
+        
+        if cls._helper_loop is None:
+            with cls._helper_loop_lock:
+                if cls._helper_loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(target=loop.run_forever, name="OverflowHelperLoop", 
+                                     daemon=True).start()
+                    cls._helper_loop = loop
+        
+        return cls._helper_loop
+    
+    def _wake_helpers(self):
+        """🔔 Wake helper coroutines parked on the overflow event"""
+        if self._overflow_event is not None and ContextOverflowGuard._helper_loop is not None:
+            ContextOverflowGuard._helper_loop.call_soon_threadsafe(self._overflow_event.set)
+    
     def _create_helpers_with_boolean_flow(self, thread_count: int):
-        """🧵 Create helper threads using boolean flags (non-blocking flow)"""
+        """🧵 Schedule helper coroutines using boolean flags (non-blocking flow)"""
         
-        print(f"🧵 Context {self.context_id}: Boolean-flow creating {thread_count} helper threads...")
+        _LOG.debug("Context %d: Boolean-flow creating %d helpers", self.context_id, thread_count)
         threads_created = 0
+        loop = ContextOverflowGuard._get_helper_loop()
         
         for i in range(thread_count):
-            thread_name = f"BoolHelper_{self.context_id}_{len(self.helper_thread_pool) + 1}"
+            helper_id = len(self.helper_thread_pool) + 1
             
-            helper_thread = threading.Thread(
-                target=self._boolean_helper_worker,
-                name=thread_name,
-                args=(len(self.helper_thread_pool) + 1,),
-                daemon=True
-            )
+            helper = asyncio.run_coroutine_threadsafe(self._boolean_helper_worker(helper_id), loop)
             
-            self.helper_thread_pool.append(helper_thread)
-            helper_thread.start()
+            self.helper_thread_pool.append(helper)
             threads_created += 1
             
-            with ContextOverflowGuard._stats_lock:
-                ContextOverflowGuard._global_stats.helper_threads_created += 1
+            ContextOverflowGuard._count('helper_threads_created')
             
-            print(f"🧵 Boolean helper thread '{thread_name}' started")
+            _LOG.debug("Boolean helper %d for context %d scheduled", helper_id, self.context_id)
         
         # Boolean logic: Set flags based on success
         self.helpers_ready = threads_created == thread_count
-        self.state_flags['helpers_available'] = self.helpers_ready
-        self.allocation_shift_ready = self.helpers_ready or self.state_flags['allocation_doubled']
+        if self.helpers_ready:
+            self._flags |= FLAG_HELPERS_AVAILABLE
+        else:
+            self._flags &= ~FLAG_HELPERS_AVAILABLE
+        self.allocation_shift_ready = self.helpers_ready or bool(self._flags & FLAG_ALLOCATION_DOUBLED)
         
-        print(f"🎯 Context {self.context_id}: Boolean flags updated - helpers_ready: {self.helpers_ready}")
+        _LOG.debug("Context %d: Boolean flags updated - helpers_ready: %s", self.context_id, self.helpers_ready)
     
     def _can_shift_allocation_immediately(self) -> bool:
         """🎯 Boolean check if allocation can shift without waiting"""
         return (
-            self.state_flags['flow_uninterrupted'] 
+            self._flags & FLAG_FLOW_UNINTERRUPTED
             and not self.overflow_flag_triggered
-            and (self.state_flags['memory_expanded'] or len(self.helper_thread_pool) < self.max_helper_threads)
+            and (self._flags & FLAG_MEMORY_EXPANDED or len(self.helper_thread_pool) < self.max_helper_threads)
         )
     
-    def _boolean_helper_worker(self, thread_id: int):
-        """⚡ Boolean-driven helper thread worker (no blocking waits!)"""
+    async def _boolean_helper_worker(self, thread_id: int):
+        """⚡ Boolean-driven helper coroutine - parks on the overflow event when idle"""
         
-        print(f"⚡ Boolean helper thread {thread_id} for context {self.context_id} is active")
+        _LOG.debug("Boolean helper %d for context %d is active", thread_id, self.context_id)
+        
+        if self._overflow_event is None:
+            self._overflow_event = asyncio.Event()
         
         try:
             # Boolean-driven work loop - continue while flags are active
             while (
                 self.overflow_detected 
                 or self.recursive_overflow_count > 0 
-                or not self.state_flags['flow_uninterrupted']
+                or not self._flags & FLAG_FLOW_UNINTERRUPTED
             ):
                 # Boolean-driven helper tasks
                 task_completed = self._perform_boolean_helper_tasks(thread_id)
@@ -422,163 +825,110 @@ class ContextOverflowGuard:
                 
                 if not should_continue:
                     break
-                    
-                # Micro-sleep to prevent CPU spinning (non-blocking)
-                time.sleep(0.001)  # 1ms - much faster than blocking waits
                 
+                # Let the other helpers run; with nothing done, sleep until the next overflow
+                if task_completed:
+                    await asyncio.sleep(0)
+                else:
+                    self._overflow_event.clear()
+                    await self._overflow_event.wait()
+                
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
-            print(f"❌ Boolean helper thread {thread_id} error: {e}")
+            _LOG.error("Boolean helper %d error: %s", thread_id, e)
         finally:
             # Set completion flags
-            self.state_flags['helpers_available'] = True
-            print(f"� Boolean helper thread {thread_id} for context {self.context_id} completed")
+            self._flags |= FLAG_HELPERS_AVAILABLE
+            _LOG.debug("Boolean helper %d for context %d completed", thread_id, self.context_id)
+    
+    @property
+    def state_flags(self) -> Dict[str, bool]:
+        """🚩 Snapshot of the FLAG_* bitmask as a name -> bool dict"""
+        return {name: bool(self._flags & bit) for name, bit in _FLAG_NAMES.items()}
+    
+    def get_context_info(self) -> Dict[str, Any]:
+        """📋 Snapshot of this context's overflow state"""
+        return {
+            'context_id': self.context_id,
+            'overflow_detected': self.overflow_detected,
+            'recursive_overflow_count': self.recursive_overflow_count,
+            'initial_memory': self.initial_memory,
+            'last_sampled_memory': self.last_sampled_memory,
+            'overflow_threshold_bytes': self.overflow_threshold_bytes,
+            'delegated_workers': len(self.delegated_workers),
+            'helper_coroutines': len(self.helper_thread_pool),
+            'state_flags': self.state_flags,
+        }
     
     def _perform_boolean_helper_tasks(self, thread_id: int) -> bool:
         """🔧 Boolean-driven helper tasks with flag-based flow control"""
         
-        task_completed = False
-        
         try:
-            # Task selection using boolean OR logic
-            if thread_id == 1 or not self.state_flags['memory_expanded']:
-                # Aggressive garbage collection
-                collected = gc.collect()
-                if collected > 0:
-                    print(f"🗑️ Boolean helper {thread_id}: Collected {collected} objects")
-                    self.state_flags['memory_expanded'] = True
-                    task_completed = True
-            
-            elif thread_id == 2 or not self.state_flags['allocation_doubled']:
-                # Cache cleanup for delegated workers
-                cleaned = self._boolean_cleanup_worker_caches()
-                self.state_flags['allocation_doubled'] = cleaned or self.state_flags['allocation_doubled']
-                task_completed = cleaned
-            
-            else:
-                # Memory defragmentation simulation
-                defrag_success = self._boolean_memory_defragmentation()
-                self.state_flags['recursive_active'] = defrag_success
-                task_completed = defrag_success
+            task = ContextOverflowGuard._TASK_TABLE[(thread_id - 1) % 3]
+            task_completed = task(self, thread_id)
             
             # Update flow flags using OR logic
-            self.state_flags['flow_uninterrupted'] = (
-                self.state_flags['flow_uninterrupted'] 
-                or task_completed 
-                or self.allocation_shift_ready
-            )
+            if task_completed or self.allocation_shift_ready:
+                self._flags |= FLAG_FLOW_UNINTERRUPTED
                 
         except Exception as e:
-            print(f"⚠️ Boolean helper thread {thread_id} task error: {e}")
+            _LOG.warning("Boolean helper %d task error: %s", thread_id, e)
             task_completed = False
         
         return task_completed
     
-    def _boolean_cleanup_worker_caches(self) -> bool:
-        """🧹 Boolean-driven cache cleanup"""
-        try:
-            cleaned_count = 0
-            for worker_id in self.delegated_workers:
-                if worker_id in ContextOverflowGuard._overflow_workers:
-                    worker = ContextOverflowGuard._overflow_workers[worker_id]
-                    # Simulate cache cleanup
-                    cleaned_count += 1
-            
-            if cleaned_count > 0:
-                print(f"🧹 Boolean cleanup: {cleaned_count} worker caches cleaned")
-                return True
-        except Exception:
-            pass
-        
+    def _task_gc(self, thread_id: int) -> bool:
+        """🗑️ Helper task: aggressive garbage collection"""
+        collected = gc.collect()
+        if collected > 0:
+            _LOG.debug("Boolean helper %d: Collected %d objects", thread_id, collected)
+            self._flags |= FLAG_MEMORY_EXPANDED
+            return True
         return False
     
-    def _boolean_memory_defragmentation(self) -> bool:
-        """🔄 Boolean-driven memory defragmentation simulation"""
-        try:
-            # Simulate memory defragmentation
-            import random
-            defrag_efficiency = random.uniform(0.7, 1.0)  # 70-100% efficiency
-            
-            if defrag_efficiency > 0.8:
-                print(f"🔄 Boolean defrag: {defrag_efficiency:.1%} efficiency achieved")
-                return True
-        except Exception:
-            pass
-        
-        return False
+    def _task_cache_cleanup(self, thread_id: int) -> bool:
+        """🧹 Helper task: cache cleanup for delegated workers"""
+        cleaned = self._boolean_cleanup_worker_caches()
+        if cleaned:
+            self._flags |= FLAG_ALLOCATION_DOUBLED
+        return cleaned
     
-    def _helper_thread_worker(self, thread_id: int):
-        """⚡ Helper thread worker for overflow assistance"""
-        
-        print(f"⚡ Helper thread {thread_id} for context {self.context_id} is active")
-        
-        try:
-            while self.overflow_detected and self.recursive_overflow_count > 0:
-                # Simulate helper work - memory cleanup, garbage collection, etc.
-                time.sleep(0.1)  # Small delay
-                
-                # Perform helper tasks
-                self._perform_helper_tasks(thread_id)
-                
-                # Check if overflow resolved
-                if not self.overflow_detected:
-                    break
-                    
-        except Exception as e:
-            print(f"❌ Helper thread {thread_id} error: {e}")
-        finally:
-            print(f"🏁 Helper thread {thread_id} for context {self.context_id} completed")
+    def _task_defrag(self, thread_id: int) -> bool:
+        """🔄 Helper task: memory defragmentation simulation"""
+        defrag_success = self._boolean_memory_defragmentation()
+        if defrag_success:
+            self._flags |= FLAG_RECURSIVE_ACTIVE
+        else:
+            self._flags &= ~FLAG_RECURSIVE_ACTIVE
+        return defrag_success
     
-    def _perform_helper_tasks(self, thread_id: int):
-        """🔧 Perform helper tasks for overflow recovery"""
-        
-        try:
-            # Task 1: Aggressive garbage collection
-            if thread_id == 1:
-                collected = gc.collect()
-                if collected > 0:
-                    print(f"🗑️ Helper thread {thread_id}: Collected {collected} objects")
-            
-            # Task 2: Cache cleanup for delegated workers
-            elif thread_id == 2:
-                self._cleanup_worker_caches()
-            
-            # Task 3: Memory defragmentation simulation
-            else:
-                self._simulate_memory_defragmentation()
-                
-        except Exception as e:
-            print(f"⚠️ Helper thread {thread_id} task error: {e}")
+    # Helper task per helper id - (id - 1) % 3 picks gc / cache cleanup / defrag.
+    # Plain functions at class level, so instances don't hold bound-method cycles.
+    _TASK_TABLE = (_task_gc, _task_cache_cleanup, _task_defrag)
     
-    def _cleanup_worker_caches(self):
-        """🧹 Cleanup caches for all delegated workers"""
+    def _boolean_cleanup_worker_caches(self) -> bool:
+        """🧹 Boolean-driven cache cleanup"""
+        # Simulate cache cleanup
+        cleaned_count = len(self.delegated_workers)
         
-        try:
-            cleaned_count = 0
-            for worker_id in self.delegated_workers:
-                if worker_id in ContextOverflowGuard._overflow_workers:
-                    # Simulate cache cleanup
-                    cleaned_count += 1
-            
-            if cleaned_count > 0:
-                print(f"🧹 Cleaned caches for {cleaned_count} workers")
-                
-        except Exception as e:
-            print(f"❌ Cache cleanup error: {e}")
+        if cleaned_count > 0:
+            _LOG.debug("Boolean cleanup: %d worker caches cleaned", cleaned_count)
+            return True
+        
+        return False
     
-    def _simulate_memory_defragmentation(self):
-        """🔧 Simulate memory defragmentation for performance"""
+    def _boolean_memory_defragmentation(self) -> bool:
+        """🔄 Boolean-driven memory defragmentation simulation
         
-        try:
-            # Simulate memory operations
-            temp_data = []
-            for _ in range(100):
-                temp_data.append(list(range(10)))
-            
-            # Clear temporary data
-            temp_data.clear()
-            
-        except Exception as e:
-            print(f"❌ Memory defragmentation error: {e}")
+        Deterministic 1-in-8 success from a wrapping tick - no RNG on the helper path.
+        """
+        self._defrag_tick = (self._defrag_tick + 1) & 7
+        if self._defrag_tick == 0:
+            _LOG.debug("Boolean defrag: pass completed")
+            return True
+        
+        return False
     
     def check_recursive_overflow_against_self(self) -> bool:
         """🔍 Check if this context is causing overflow against its own monitoring"""
@@ -588,31 +938,30 @@ class ContextOverflowGuard:
         
         try:
             # Get current memory of self-capturing context
-            monitor_memory = self.self_capturing_context._get_current_memory_usage()
+            monitor_memory = self.self_capturing_context._sampler.get_rss()
             monitor_threshold = self.self_capturing_context.overflow_threshold_bytes
             
             if monitor_memory > monitor_threshold:
-                print(f"🤯 Context {self.context_id}: RECURSIVE OVERFLOW DETECTED!")
-                print(f"   Self-capture context {self.self_capturing_context.context_id} overflowed!")
-                print(f"   Monitor memory: {monitor_memory / (1024*1024):.2f} MB")
-                print(f"   Monitor threshold: {monitor_threshold / (1024*1024):.2f} MB")
+                _LOG.warning("Context %d: Recursive overflow - self-capture context %d at %.2f MB "
+                             "(threshold %.2f MB)", self.context_id, self.self_capturing_context.context_id, 
+                             monitor_memory / (1024*1024), monitor_threshold / (1024*1024))
                 
                 # Apply emergency recursive protection
                 self._apply_emergency_recursive_protection()
                 return True
                 
         except Exception as e:
-            print(f"❌ Recursive overflow check error: {e}")
+            _LOG.error("Recursive overflow check error: %s", e)
         
         return False
     
     def _apply_emergency_recursive_protection(self):
         """🚨 Apply emergency recursive protection when context overflows against itself"""
         
-        print(f"🚨 Context {self.context_id}: APPLYING EMERGENCY RECURSIVE PROTECTION!")
+        _LOG.warning("Context %d: Applying emergency recursive protection", self.context_id)
         
-        # Emergency allocation multiplication
-        emergency_allocation = self.base_byte_allocation * (8 ** self.recursive_overflow_count)
+        # Emergency allocation - one step ahead of the recursive level, same cap
+        emergency_allocation = _grow_allocation(self.base_byte_allocation, self.recursive_overflow_count + 1)
         
         # Create emergency helper threads (double the normal amount)
         emergency_threads = min(self.max_helper_threads * 2, 4)
@@ -624,37 +973,99 @@ class ContextOverflowGuard:
         for _ in range(3):  # Triple garbage collection
             gc.collect()
         
-        print(f"🚨 Emergency protection applied:")
-        print(f"   Emergency allocation: {emergency_allocation} bytes")
-        print(f"   Emergency helper threads: {len(self.helper_thread_pool)}")
-        print(f"   Triple garbage collection completed")
+        _LOG.debug("Emergency protection applied - %d byte allocation, %d helpers, triple GC done", 
+                   emergency_allocation, len(self.helper_thread_pool))
         
-        with ContextOverflowGuard._stats_lock:
-            ContextOverflowGuard._global_stats.recursive_overflow_events += 1
+        ContextOverflowGuard._count('recursive_overflow_events')
     
     def _create_overflow_worker(self, allocated_memory: int) -> OverflowWorker:
-        """🏗️ Create new overflow worker with specified memory allocation"""
+        """🏗️ Create new overflow worker with specified memory allocation
         
-        with ContextOverflowGuard._stats_lock:
-            ContextOverflowGuard._worker_counter += 1
-            worker_id = ContextOverflowGuard._worker_counter
-            ContextOverflowGuard._global_stats.worker_delegations += 1
+        Raises MemoryError when the active workers already use up what available
+        system memory can back at this allocation (N_max = available / allocation).
+        """
+        
+        if PSUTIL_AVAILABLE:
+            available = psutil.virtual_memory().available  # type: ignore
+            max_workers_by_mem = available // max(1, allocated_memory)
+            active_workers = sum(1 for w in ContextOverflowGuard._overflow_workers.values() if w.is_active)
+            if active_workers >= max_workers_by_mem:
+                if not ContextOverflowGuard._memory_cap_warned:
+                    ContextOverflowGuard._memory_cap_warned = True
+                    _LOG.warning("Overflow worker cap reached: %d active workers, %.0f MB available - "
+                                 "falling back to in-process work", active_workers, available / (1024*1024))
+                raise MemoryError("worker creation would exceed system memory")
+        
+        worker_id = next(ContextOverflowGuard._worker_ids)
+        ContextOverflowGuard._count('worker_delegations')
         
         # Create worker data structure
         worker = OverflowWorker(
             worker_id=worker_id,
-            process_id=os.getpid(),  # Will be updated if using separate process
+            process_id=_PID,  # Will be updated if using separate process
             allocated_memory_bytes=allocated_memory,
             creation_time=time.time()
         )
         
         # Register worker
         ContextOverflowGuard._overflow_workers[worker_id] = worker
-        self.delegated_workers.append(worker_id)
+        self.delegated_workers.append(worker)
         
         return worker
     
-    def _execute_in_worker(self, operation: Callable, args: tuple, kwargs: dict) -> Any:
+    @classmethod
+    def _get_shared_pool(cls, max_tasks_per_child: Optional[int] = None) -> multiprocessing.pool.Pool:
+        """🏊 Lazily create the process pool shared by all overflow delegations
+        
+        Workers are replaced after max_tasks_per_child tasks so leaked memory in
+        long-lived children can't accumulate.
+        """
+        
+        if cls._shared_pool is None:
+            with cls._shared_pool_lock:
+                if cls._shared_pool is None:
+                    processes = _autosize_workers(cls._worker_memory_mb)
+                    
+                    cls._shared_pool = multiprocessing.get_context("spawn").Pool(
+                        processes=processes, 
+                        maxtasksperchild=max_tasks_per_child or cls._max_tasks_per_child
+                    )
+                    atexit.register(cls._shared_pool.terminate)
+                    _LOG.info("Shared overflow pool started with %d workers (recycled every %d tasks)", 
+                              processes, max_tasks_per_child or cls._max_tasks_per_child)
+        
+        return cls._shared_pool
+    
+    @classmethod
+    def _discard_shared_pool(cls, stale: multiprocessing.pool.Pool):
+        """💥 Terminate a shared pool with a hung task so the next call starts fresh"""
+        
+        with cls._shared_pool_lock:
+            # Another timed-out caller may already have replaced it
+            if cls._shared_pool is stale:
+                cls._shared_pool = None
+        
+        atexit.unregister(stale.terminate)
+        stale.terminate()
+        _LOG.warning("Shared overflow pool terminated after a task timed out")
+    
+    @classmethod
+    def _get_shared_thread_pool(cls) -> concurrent.futures.ThreadPoolExecutor:
+        """🧵 Lazily create the thread pool shared by I/O-bound delegations"""
+        
+        if cls._shared_thread_pool is None:
+            with cls._shared_pool_lock:
+                if cls._shared_thread_pool is None:
+                    cls._shared_thread_pool = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=cls._thread_pool_workers, 
+                        thread_name_prefix="OverflowIO"
+                    )
+                    atexit.register(cls._shared_thread_pool.shutdown, wait=False)
+        
+        return cls._shared_thread_pool
+    
+    @staticmethod
+    def _execute_in_worker(operation: Callable, args: tuple, kwargs: dict) -> Any:
         """⚡ Execute operation in worker context"""
         
         # Set memory limit for this process if possible (Unix systems only)
@@ -672,24 +1083,21 @@ class ContextOverflowGuard:
     def _handle_context_exception(self, exc_type, exc_val, exc_tb) -> bool:
         """🛡️ Handle exceptions within context"""
         
-        print(f"⚠️ Context {self.context_id}: Exception caught: {exc_type.__name__}")
-        print(f"   Exception message: {exc_val}")
+        _LOG.debug("Context %d: Exception caught: %s: %s", self.context_id, exc_type.__name__, exc_val)
         
-        # Store exception data for analysis
-        self.context_data['exception'] = {
-            'type': exc_type.__name__,
-            'message': str(exc_val),
-            'traceback': traceback.format_tb(exc_tb)
-        }
+        # Store exception data for analysis (type names interned - the same few recur)
+        self.exception_type = sys.intern(exc_type.__name__)
+        self.exception_message = str(exc_val)
+        self.exception_traceback = traceback.format_tb(exc_tb)
         
         # For overflow-related exceptions, try worker delegation
         if self.overflow_detected and self.enable_worker_delegation:
-            print(f"🔄 Context {self.context_id}: Attempting overflow recovery")
+            _LOG.info("Context %d: Attempting overflow recovery", self.context_id)
             return True  # Suppress exception for overflow recovery
         
         # For other exceptions, log and suppress based on type
         if exc_type in (MemoryError, RuntimeError):
-            print(f"🛡️ Context {self.context_id}: Suppressing {exc_type.__name__} for stability")
+            _LOG.warning("Context %d: Suppressing %s for stability", self.context_id, exc_type.__name__)
             return True
         
         return False  # Don't suppress other exceptions
@@ -697,97 +1105,158 @@ class ContextOverflowGuard:
     def _cleanup_context(self):
         """🧹 Cleanup context resources"""
         
-        # Cleanup helper threads
-        for thread in self.helper_thread_pool:
-            if thread.is_alive():
-                try:
-                    thread.join(timeout=1.0)  # Wait max 1 second
-                except:
-                    pass
+        # Cleanup helper coroutines - parked helpers are cancelled, not waited on
+        for helper in self.helper_thread_pool:
+            helper.cancel()
         
         self.helper_thread_pool.clear()
         
-        # Cleanup self-capturing context
+        # Cleanup self-capturing context - the monitor is never entered, so dropping our
+        # reference is what lets the weak registry reap it
         if self.self_capturing_context:
-            try:
+            with suppress(RuntimeError, AttributeError):
                 self.self_capturing_context._cleanup_context()
-                if self.self_capturing_context.context_id in ContextOverflowGuard._active_contexts:
-                    del ContextOverflowGuard._active_contexts[self.self_capturing_context.context_id]
-            except:
-                pass
+            self.self_capturing_context = None
         
         # Cleanup delegated workers
-        for worker_id in self.delegated_workers:
-            if worker_id in ContextOverflowGuard._overflow_workers:
-                worker = ContextOverflowGuard._overflow_workers[worker_id]
-                worker.is_active = False
+        for worker in self.delegated_workers:
+            worker.is_active = False
+        self.delegated_workers.clear()
+        self.child_processes.clear()
         
         # Clear context data
-        self.context_data.clear()
+        self.exception_type = self.exception_message = self.exception_traceback = None
     
-    def _report_context_completion(self, duration: float, memory_growth: int):
+    def _report_context_completion(self, duration_ns: int, memory_growth: int):
         """📊 Report context completion statistics"""
         
-        print(f"🏴‍☠️ Context {self.context_id} complete: {duration:.6f}s")
-        print(f"   Memory growth: {memory_growth / (1024*1024):.2f} MB")
+        if not _LOG.isEnabledFor(logging.INFO):
+            return
         
-        if self.overflow_detected:
-            print(f"   ⚠️ Overflow handled with {len(self.delegated_workers)} workers")
+        _LOG.info("Context %d complete: %.6fs, memory growth %.2f MB", 
+                  self.context_id, duration_ns / 1e9, memory_growth / (1024*1024))
         
-        if self.context_data.get('exception'):
-            print(f"   🛡️ Exception handled: {self.context_data['exception']['type']}")
-    
-    def _get_current_memory_usage(self) -> int:
-        """📊 Get current process memory usage in bytes"""
+        if self.traced_memory is not None:
+            _LOG.info("Context %d: Traced Python memory %.2f MB (peak %.2f MB)", 
+                      self.context_id, self.traced_memory[0] / (1024*1024), 
+                      self.traced_memory[1] / (1024*1024))
         
-        if PSUTIL_AVAILABLE:
-            try:
-                # psutil already imported at module level if available
-                process = psutil.Process()  # type: ignore
-                return process.memory_info().rss
-            except:
-                pass
+        if self.overflow_detected:
+            _LOG.info("Context %d: Overflow handled with %d workers", 
+                      self.context_id, len(self.delegated_workers))
         
-        # Fallback: Use sys.getsizeof for basic tracking
-        try:
-            # Get approximate memory usage from garbage collector
-            import gc
-            objects = gc.get_objects()
-            return sum(sys.getsizeof(obj) for obj in objects[:1000])  # Sample first 1000 objects
-        except:
-            return 1024 * 1024  # Default 1MB if all else fails
+        if self.exception_type is not None:
+            _LOG.info("Context %d: Exception handled: %s", self.context_id, self.exception_type)
+    
+    @staticmethod
+    def _rss_fresh() -> int:
+        """📊 Current RSS straight from psutil (OS reader if the psutil read fails)"""
+        with suppress(*_PSUTIL_ERRORS):
+            return _PROC.memory_info().rss
+        return _rss_from_os_safe()
+    
+    # Get current process memory usage in bytes - reader chosen once, not per call
+    _get_current_memory_usage = _rss_fresh if PSUTIL_AVAILABLE else staticmethod(_rss_from_os_safe)
+    
+    @classmethod
+    def get_sampled_rss(cls) -> Tuple[int, int]:
+        """📈 (latest, peak) RSS seen by the background sampler - for stats, not overflow checks"""
+        if PSUTIL_AVAILABLE and cls._rss_sampler is None:
+            cls._start_rss_sampler()
+        return cls._rss_cache, cls._rss_peak
+    
+    @classmethod
+    def _default_helper_threads(cls) -> int:
+        """🔢 Helper-thread cap for max_helper_threads=None - sized on first use, then cached"""
+        if cls._auto_helper_threads is None:
+            cls._auto_helper_threads = _autosize_workers()
+        return cls._auto_helper_threads
+    
+    @classmethod
+    def _suppress_gc(cls):
+        """🧊 Raise the GC thresholds for the first active guard; later ones only count"""
+        with cls._stats_lock:
+            if cls._gc_depth == 0:
+                cls._gc_saved_threshold = gc.get_threshold()
+                gc.set_threshold(*GC_SUPPRESSED_THRESHOLD)
+            cls._gc_depth += 1
     
     @classmethod
-    def get_global_stats(cls) -> ContextStats:
-        """📊 Get global context statistics"""
-        return cls._global_stats
+    def _release_gc(cls):
+        """🧊 Restore the saved GC thresholds once no guard is active"""
+        with cls._stats_lock:
+            cls._gc_depth -= 1
+            if cls._gc_depth == 0 and cls._gc_saved_threshold is not None:
+                gc.set_threshold(*cls._gc_saved_threshold)
+                cls._gc_saved_threshold = None
     
     @classmethod
-    def get_active_contexts(cls) -> Dict[int, 'ContextOverflowGuard']:
-        """📋 Get all active contexts"""
-        return cls._active_contexts.copy()
+    def _count(cls, name: str):
+        """➕ Bump a stats counter (under _stats_lock, so snapshots never see it go backwards)"""
+        with cls._stats_lock:
+            setattr(cls._global_stats, name, getattr(cls._global_stats, name) + 1)
     
     @classmethod
-    def get_overflow_workers(cls) -> Dict[int, OverflowWorker]:
-        """🚀 Get all overflow workers"""
-        return cls._overflow_workers.copy()
+    def _start_rss_sampler(cls):
+        """📈 Start the daemon thread that keeps _rss_cache fresh"""
+        
+        with cls._stats_lock:
+            if cls._rss_sampler is not None:
+                return
+            with suppress(*_PSUTIL_ERRORS):
+                cls._rss_cache = _PROC.memory_info().rss
+                cls._rss_peak = max(cls._rss_peak, cls._rss_cache)
+            cls._rss_sampler = threading.Thread(target=cls._sample_rss, name="OverflowRSSSampler", 
+                                                daemon=True)
+            cls._rss_sampler.start()
+    
+    @classmethod
+    def _sample_rss(cls):
+        """📈 Sampler loop - one memory_info() call per interval for the whole process"""
+        while True:
+            with suppress(*_PSUTIL_ERRORS):
+                rss = _PROC.memory_info().rss
+                cls._rss_cache = rss
+                if rss > cls._rss_peak:
+                    cls._rss_peak = rss
+            time.sleep(cls._rss_sample_interval)
+    
+    @classmethod
+    def _add_execution_ns(cls, duration_ns: int):
+        """⏱️ Fold one context duration into the stats (caller holds _stats_lock)"""
+        stats = cls._global_stats
+        stats.total_execution_ns += duration_ns
+        stats.total_execution_time = stats.total_execution_ns / 1e9
+        stats.average_execution_time = stats.total_execution_ns / max(1, stats.total_contexts) / 1e9
+    
+    @classmethod
+    def get_global_stats(cls) -> ContextStatsSnapshot:
+        """📊 Get global context statistics (immutable snapshot - safe to keep or share)"""
+        with cls._stats_lock:
+            return cls._global_stats.snapshot()
+    
+    @classmethod
+    def get_active_contexts(cls) -> Mapping[int, 'ContextOverflowGuard']:
+        """📋 Live read-only view of active contexts (dict() it for a snapshot)"""
+        return MappingProxyType(cls._active_contexts)
+    
+    @classmethod
+    def get_overflow_workers(cls) -> Mapping[int, OverflowWorker]:
+        """🚀 Live read-only view of overflow workers (dict() it for a snapshot)"""
+        return MappingProxyType(cls._overflow_workers)
     
     @classmethod
     def cleanup_inactive_workers(cls) -> int:
         """🗑️ Cleanup inactive overflow workers"""
         
         cleaned_count = 0
-        inactive_workers = [
-            worker_id for worker_id, worker in cls._overflow_workers.items()
-            if not worker.is_active
-        ]
-        
-        for worker_id in inactive_workers:
-            del cls._overflow_workers[worker_id]
-            cleaned_count += 1
+        # C-level filter over a snapshot (the weak registry can't change size mid-walk)
+        for worker in list(itertools.filterfalse(attrgetter('is_active'), cls._overflow_workers.values())):
+            if cls._overflow_workers.pop(worker.worker_id, None) is not None:
+                cleaned_count += 1
         
         if cleaned_count > 0:
-            print(f"🗑️ Cleaned up {cleaned_count} inactive overflow workers")
+            _LOG.debug("Cleaned up %d inactive overflow workers", cleaned_count)
         
         return cleaned_count
 
@@ -795,6 +1264,8 @@ class ContextOverflowGuard:
 class AdvancedContextOverflowGuard(ContextOverflowGuard):
     """🎭 Advanced context guard with additional features"""
     
+    __slots__ = ('performance_monitoring', 'auto_scaling', 'memory_prediction')
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.performance_monitoring = True
@@ -802,59 +1273,61 @@ class AdvancedContextOverflowGuard(ContextOverflowGuard):
         self.memory_prediction = True
     
     def predict_memory_growth(self, operation_size: int) -> int:
-        """🔮 Predict memory growth for operation"""
+        """🔮 Predict memory growth for operation (and count it toward the next RSS sample)"""
         # Simple prediction based on operation size
-        return operation_size * 8  # Rough estimate: 8 bytes per operation unit
+        predicted = operation_size * 8  # Rough estimate: 8 bytes per operation unit
+        self.track_allocation(predicted)
+        return predicted
 
 def demonstrate_context_overflow_guard():
     """🎭 Demonstrate the context overflow guard"""
     
-    print("CONTEXT OVERFLOW GUARD")
-    print("=" * 80)
-    print("Advanced Execution Context Control + Dynamic Overflow Reassignment")
-    print("")
+    import numpy as np
     
-    # Test 1: Basic context manager usage
-    print("🎭 Test 1: Basic Context Manager")
-    print("-" * 40)
+    # Static sections go out as one write each instead of a print (and flush) per line
+    sys.stdout.write(
+        "CONTEXT OVERFLOW GUARD\n"
+        f"{'=' * 80}\n"
+        "Advanced Execution Context Control + Dynamic Overflow Reassignment\n"
+        "\n"
+        "🎭 Test 1: Basic Context Manager\n"
+        f"{'-' * 40}\n"
+    )
     
     with ContextOverflowGuard(base_byte_allocation=2048, overflow_threshold_mb=50):
         print("   Executing operation in protected context...")
         # Simulate some work
-        data = list(range(1000))
-        result = sum(x**2 for x in data)
+        data = np.arange(1000, dtype=np.int64)
+        result = int((data * data).sum())
         print(f"   Result: {result}")
     
     # Test 2: Decorator usage
-    print("\n🎪 Test 2: Decorator Usage")
-    print("-" * 40)
+    sys.stdout.write(f"\n🎪 Test 2: Decorator Usage\n{'-' * 40}\n")
     
     @ContextOverflowGuard(base_byte_allocation=4096)
     def decorated_function(n: int):
         """Protected function with context guard"""
         print(f"   Decorated function processing {n} items...")
-        return sum(i**3 for i in range(n))
+        return int((np.arange(n, dtype=np.int64) ** 3).sum())
     
     result = decorated_function(500)
     print(f"   Decorated result: {result}")
     
     # Test 3: Callable usage
-    print("\n📞 Test 3: Callable Usage")
-    print("-" * 40)
+    sys.stdout.write(f"\n📞 Test 3: Callable Usage\n{'-' * 40}\n")
     
     guard = ContextOverflowGuard(base_byte_allocation=8192)
     
     def callable_operation():
         print("   Callable operation executing...")
-        return [x**2 for x in range(100)]
+        return np.arange(100, dtype=np.int64) ** 2
     
     guarded_operation = guard(callable_operation)
     result = guarded_operation()
     print(f"   Callable result length: {len(result)}")
     
     # Test 4: Recursive overflow simulation with self-capturing context
-    print("\n🤯 Test 4: RECURSIVE OVERFLOW SIMULATION WITH SELF-CAPTURING CONTEXT")
-    print("-" * 70)
+    sys.stdout.write(f"\n🤯 Test 4: RECURSIVE OVERFLOW SIMULATION WITH SELF-CAPTURING CONTEXT\n{'-' * 70}\n")
     
     with ContextOverflowGuard(
         base_byte_allocation=1024, 
@@ -867,13 +1340,13 @@ def demonstrate_context_overflow_guard():
             print("   Simulating recursive memory-intensive operation...")
             
             # First overflow - triggers initial protection
-            large_data = [list(range(10000)) for _ in range(100)]
+            large_data = np.ones((100, 10000), dtype=np.int32)  # One contiguous, fully touched buffer
             
             if guard.overflow_detected:
                 print("   🎭 First overflow detected - self-capturing context created!")
                 
                 # Second overflow - triggers recursive protection
-                even_larger_data = [list(range(20000)) for _ in range(200)]
+                even_larger_data = np.ones((200, 20000), dtype=np.int32)
                 
                 # Check for recursive overflow against self
                 if guard.check_recursive_overflow_against_self():
@@ -890,8 +1363,7 @@ def demonstrate_context_overflow_guard():
             print(f"   Handled recursive exception: {e}")
     
     # Test 5: Exception handling
-    print("\n🛡️ Test 5: Exception Handling")
-    print("-" * 40)
+    sys.stdout.write(f"\n🛡️ Test 5: Exception Handling\n{'-' * 40}\n")
     
     with ContextOverflowGuard() as guard:
         try:
@@ -902,57 +1374,64 @@ def demonstrate_context_overflow_guard():
             print("   Exception was caught and handled by context")
     
     # Show global statistics
-    print("\n📊 GLOBAL STATISTICS:")
-    print("=" * 60)
     stats = ContextOverflowGuard.get_global_stats()
     
-    print(f"Context Statistics:")
-    print(f"   Total contexts: {stats.total_contexts}")
-    print(f"   Overflow events: {stats.overflow_events}")
-    print(f"   Recursive overflow events: {stats.recursive_overflow_events}")
-    print(f"   Self-capture events: {stats.self_capture_events}")
-    print(f"   Worker delegations: {stats.worker_delegations}")
-    print(f"   Helper threads created: {stats.helper_threads_created}")
-    print(f"   Max recursive depth: {stats.max_recursive_depth}")
-    print(f"   Average execution time: {stats.average_execution_time:.6f}s")
-    print(f"   Exceptions handled: {stats.exceptions_handled}")
-    print(f"   Garbage collections: {stats.garbage_collections}")
-    
-    # Show active contexts and workers
-    active_contexts = ContextOverflowGuard.get_active_contexts()
-    overflow_workers = ContextOverflowGuard.get_overflow_workers()
-    
-    print(f"\nSystem State:")
-    print(f"   Active contexts: {len(active_contexts)}")
-    print(f"   Overflow workers: {len(overflow_workers)}")
+    # Show active contexts and workers (counted before cleanup - these are live views)
+    active_count = len(ContextOverflowGuard.get_active_contexts())
+    worker_count = len(ContextOverflowGuard.get_overflow_workers())
     
     # Cleanup inactive workers
     cleaned = ContextOverflowGuard.cleanup_inactive_workers()
-    print(f"   Cleaned inactive workers: {cleaned}")
+    
+    sys.stdout.write(
+        "\n📊 GLOBAL STATISTICS:\n"
+        f"{'=' * 60}\n"
+        "Context Statistics:\n"
+        f"   Total contexts: {stats.total_contexts}\n"
+        f"   Overflow events: {stats.overflow_events}\n"
+        f"   Recursive overflow events: {stats.recursive_overflow_events}\n"
+        f"   Self-capture events: {stats.self_capture_events}\n"
+        f"   Worker delegations: {stats.worker_delegations}\n"
+        f"   Helper threads created: {stats.helper_threads_created}\n"
+        f"   Max recursive depth: {stats.max_recursive_depth}\n"
+        f"   Average execution time: {stats.average_execution_time:.6f}s\n"
+        f"   Exceptions handled: {stats.exceptions_handled}\n"
+        f"   Garbage collections: {stats.garbage_collections}\n"
+        "\nSystem State:\n"
+        f"   Active contexts: {active_count}\n"
+        f"   Overflow workers: {worker_count}\n"
+        f"   Cleaned inactive workers: {cleaned}\n"
+    )
     
     return stats
 
 if __name__ == "__main__":
-    print("CONTEXT OVERFLOW GUARD")
-    print("Dynamic Context Control + Overflow Protection")
-    print("=" * 90)
-    print("\"When your context explodes, we adapt and overcome\"")
-    print("")
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    
+    sys.stdout.write(
+        "CONTEXT OVERFLOW GUARD\n"
+        "Dynamic Context Control + Overflow Protection\n"
+        f"{'=' * 90}\n"
+        "\"When your context explodes, we adapt and overcome\"\n"
+        "\n"
+    )
     
     # Run the demonstration
     stats = demonstrate_context_overflow_guard()
     
-    print("\n🎉 RECURSIVE CONTEXT OVERFLOW GUARD COMPLETE!")
-    print("\n📚 Revolutionary Context Control Features Achieved:")
-    print("1. Triple usage: Context manager, Decorator, Callable")
-    print("2. Automatic garbage collection optimization")
-    print("3. Context overflow detection and handling")
-    print("4. 🤯 RECURSIVE OVERFLOW PROTECTION with self-capturing contexts!")
-    print("5. 🧵 Dynamic helper thread multiplication (up to 2+ threads)")
-    print("6. 💾 Exponential allocation doubling (2^n, 4^n, 8^n)")
-    print("7. 🎭 Self-monitoring contexts that watch themselves")
-    print("8. 🚨 Emergency recursive protection for infinite overflow loops")
-    print("9. Exception handling with context preservation")
-    print("10. Memory growth monitoring and prediction")
-    print("11. Performance statistics and reporting")
-    print("12. Worker cleanup and resource management")
+    sys.stdout.write(
+        "\n🎉 RECURSIVE CONTEXT OVERFLOW GUARD COMPLETE!\n"
+        "\n📚 Revolutionary Context Control Features Achieved:\n"
+        "1. Triple usage: Context manager, Decorator, Callable\n"
+        "2. Automatic garbage collection optimization\n"
+        "3. Context overflow detection and handling\n"
+        "4. 🤯 RECURSIVE OVERFLOW PROTECTION with self-capturing contexts!\n"
+        "5. 🧵 Dynamic helper thread multiplication (up to 2+ threads)\n"
+        "6. 💾 Allocation doubling (2^n) capped at 70% of physical RAM\n"
+        "7. 🎭 Self-monitoring contexts that watch themselves\n"
+        "8. 🚨 Emergency recursive protection for infinite overflow loops\n"
+        "9. Exception handling with context preservation\n"
+        "10. Memory growth monitoring and prediction\n"
+        "11. Performance statistics and reporting\n"
+        "12. Worker cleanup and resource management\n"
+    )
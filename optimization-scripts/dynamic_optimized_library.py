@@ -18,16 +18,76 @@ Memory Target: 70-90% memory reduction compared to standard Python objects
 """
 
 import sys
+import itertools
 import weakref
+from types import MappingProxyType
 import threading
-from typing import Any, Dict, List, Optional, Union, Callable, Tuple
-from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Union, Callable, Tuple
+from dataclasses import dataclass, fields
 import time
 import gc
-from collections import defaultdict
+import heapq
+from collections import OrderedDict
 import numpy as np
+from contextlib import ExitStack, suppress
 from functools import wraps
+from operator import itemgetter
 import pickle
+import hashlib
+import logging
+
+_LOG = logging.getLogger("cortex.dynamic_optimized_library")
+_LOG.addHandler(logging.NullHandler())  # Silent unless the application configures logging
+
+# Fixed object-header sizes measured once at import (exact for this interpreter build)
+_SMALL_INT_SIZE = sys.getsizeof(1)  # Any nonzero int with |v| < 2**30 (one digit); 0 has no digits
+_FLOAT_SIZE = sys.getsizeof(0.0)
+_ASCII_STR_BASE = sys.getsizeof('')
+_BYTES_BASE = sys.getsizeof(b'')
+_NDARRAY_HEADER = sys.getsizeof(np.empty(0))
+
+# type -> sizer for the common value types; anything else falls back to sys.getsizeof
+_SIZERS: Dict[type, Callable[[Any], int]] = {
+    int: lambda v: _SMALL_INT_SIZE if v and -0x40000000 < v < 0x40000000 else sys.getsizeof(v),
+    float: lambda v: _FLOAT_SIZE,
+    str: lambda v: _ASCII_STR_BASE + len(v) if v.isascii() else sys.getsizeof(v),
+    bytes: lambda v: _BYTES_BASE + len(v),
+    np.ndarray: lambda v: _NDARRAY_HEADER + v.nbytes,
+}
+
+def _structural_key(value: Any) -> Hashable:
+    """🔑 Hashable stand-in for an argument - by value, type-tagged so 1, 1.0 and True differ"""
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:  # The buffer holds pointers, not values
+            return (np.ndarray, value.shape, value.dtype.str, tuple(map(_structural_key, value.ravel().tolist())))
+        # A 256-bit digest, not hash(): a 64-bit collision would hand back another array's result
+        digest = hashlib.blake2b(np.ascontiguousarray(value), digest_size=32).digest()
+        return (np.ndarray, value.shape, value.dtype.str, digest)
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(map(_structural_key, value)))
+    if isinstance(value, dict):
+        return (dict, tuple((k, _structural_key(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(map(_structural_key, value)))
+    try:
+        hash(value)
+        return (type(value), value)
+    except TypeError:
+        # Unhashable and not a known container - fall back to its pickled bytes
+        try:
+            return (type(value), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            return (type(value), repr(value))
+
+def _argkey(args: tuple, kwargs: Dict[str, Any]) -> Hashable:
+    """🔑 Cache key for call arguments - one structural pass, no str() of the payload"""
+    return (tuple(map(_structural_key, args)),
+            tuple((k, _structural_key(kwargs[k])) for k in sorted(kwargs)))
+
+def _fast_sizeof(value: Any) -> int:
+    """📏 Byte size from the type table, sys.getsizeof only for unlisted types"""
+    sizer = _SIZERS.get(type(value))
+    return sizer(value) if sizer is not None else sys.getsizeof(value)
 
 @dataclass
 class MemoryStats:
@@ -41,36 +101,133 @@ class MemoryStats:
     cache_memory_bytes: int = 0
     gc_collections: int = 0
 
+# Each thread updates its own MemoryStats bucket (no shared read-modify-write, no lock);
+# get_global_stats sums the buckets. Buckets outlive their threads so totals stay exact.
+_thread_stats = threading.local()
+_stats_buckets: List[MemoryStats] = []
+_stats_buckets_lock = threading.Lock()  # Only taken when a thread creates its bucket
+_SUMMED_STATS = tuple(
+    f.name for f in fields(MemoryStats) 
+    if f.name not in ('min_allocation_bytes', 'max_allocation_bytes')
+)
+
+def _local_stats() -> MemoryStats:
+    """📊 This thread's stats bucket (created and registered on first use)"""
+    stats = getattr(_thread_stats, 'bucket', None)
+    if stats is None:
+        stats = _thread_stats.bucket = MemoryStats()
+        with _stats_buckets_lock:
+            _stats_buckets.append(stats)
+    return stats
+
+# Results at least this large are cached through a weak reference (when the type allows
+# one), so the GC can reclaim them once nothing outside the cache uses them
+WEAK_RESULT_MIN_BYTES = 1 << 20
+
+class _CacheEntry:
+    """📦 One cached operation result - fixed slots instead of a 4-key dict per entry
+    
+    result is a weakref.ref for large payloads (see WEAK_RESULT_MIN_BYTES);
+    timestamp is time.monotonic_ns() at caching - integer, only compared for age.
+    """
+    __slots__ = ('result', 'timestamp', 'size_bytes', 'operation')
+    
+    def __init__(self, result: Any, timestamp: int, size_bytes: int, operation: str):
+        self.result = result
+        self.timestamp = timestamp
+        self.size_bytes = size_bytes
+        self.operation = operation
+
+# Shared read-only stand-in for a treasure's cache until its first cache_operation -
+# storing a term allocates no per-term dict
+_EMPTY_CACHE: Dict[Hashable, _CacheEntry] = MappingProxyType({})  # type: ignore
+
+def _make_cache_writer() -> Callable[[Any, Hashable, str, Any], None]:
+    """🏭 Build the fused cache-write path (size, store, stats) with its globals in closure cells
+    
+    Constants such as WEAK_RESULT_MIN_BYTES are captured when this runs.
+    """
+    sizers_get = _SIZERS.get
+    getsizeof = sys.getsizeof
+    now_ns = time.monotonic_ns
+    make_ref = weakref.ref
+    entry_cls = _CacheEntry
+    empty_cache = _EMPTY_CACHE
+    weak_min_bytes = WEAK_RESULT_MIN_BYTES
+    local_stats = _local_stats
+    
+    def write(treasure: Any, key: Hashable, operation_name: str, result: Any) -> None:
+        sizer = sizers_get(type(result))
+        cache_size = sizer(result) if sizer is not None else getsizeof(result)
+        
+        stored = result
+        if cache_size >= weak_min_bytes:
+            # The callback drops the entry (and its bytes) as soon as the payload is
+            # collected; it holds the treasure weakly so the cache adds no cycle
+            owner_ref = make_ref(treasure)
+            
+            def reclaimed(ref, key=key, owner_ref=owner_ref):
+                owner = owner_ref()
+                if owner is not None:
+                    owner._drop_reclaimed(key, ref)
+            
+            try:
+                stored = make_ref(result, reclaimed)
+            except TypeError:  # list/dict/int etc. can't be weakly referenced
+                pass
+        
+        cache = treasure._cache
+        if cache is empty_cache:
+            cache = treasure._cache = {}
+            treasure._op_index = {}
+        op_index = treasure._op_index
+        replaced = cache.get(key)
+        cache[key] = entry_cls(stored, now_ns(), cache_size, operation_name)
+        
+        if replaced is not None and replaced.operation != operation_name:
+            op_index[replaced.operation].discard(key)
+        keys = op_index.get(operation_name)
+        if keys is None:
+            keys = op_index[operation_name] = set()
+        keys.add(key)
+        
+        # Update cache statistics (net of any entry this one replaced)
+        size_diff = cache_size - (replaced.size_bytes if replaced is not None else 0)
+        treasure._cache_memory_bytes += size_diff
+        local_stats().cache_memory_bytes += size_diff
+    
+    return write
+
 class OptimizedTreasure:
     """💾 Control memory layout at the C level"""
-    __slots__ = ('_value', '_cache', '_memory_size', '_allocation_id', '__weakref__')
+    __slots__ = ('_value', '_cache', '_memory_size', '_allocation_id', '_access_count', 
+                 '_cache_memory_bytes', '_op_index', '__weakref__')
     
-    # Class-level memory tracking
-    _global_stats = MemoryStats()
-    _allocation_counter = 0
-    _allocation_lock = threading.Lock()
+    # Class-level memory tracking (statistics live in the per-thread buckets above)
+    _allocation_counter = itertools.count(1)  # next() is atomic under the GIL - no lock per allocation
+    _write_cache = staticmethod(_make_cache_writer())  # One closure shared by every treasure
     
     def __init__(self, value: Any, min_bytes: int = 16):
         """🎯 Initialize with C-level memory optimization"""
         
-        with OptimizedTreasure._allocation_lock:
-            OptimizedTreasure._allocation_counter += 1
-            self._allocation_id = OptimizedTreasure._allocation_counter
+        self._allocation_id = next(OptimizedTreasure._allocation_counter)
         
         self._value = value
-        self._cache = {}
+        self._cache: Dict[Hashable, _CacheEntry] = _EMPTY_CACHE
+        self._access_count = 0  # Library lookups - lives on the slot, not in a side dict
+        self._cache_memory_bytes = 0  # Running total of entry sizes - no summing on reads
+        self._op_index: Optional[Dict[str, set]] = None  # operation -> cache keys, built with the cache dict
         
         # Calculate memory allocation (minimum 16 bytes, scales up)
-        base_size = sys.getsizeof(value)
+        base_size = _fast_sizeof(value)
         self._memory_size = max(min_bytes, base_size)
         
         # Update global statistics
-        OptimizedTreasure._global_stats.total_objects += 1
-        OptimizedTreasure._global_stats.total_memory_bytes += self._memory_size
-        OptimizedTreasure._global_stats.max_allocation_bytes = max(
-            OptimizedTreasure._global_stats.max_allocation_bytes, 
-            self._memory_size
-        )
+        stats = _local_stats()
+        stats.total_objects += 1
+        stats.total_memory_bytes += self._memory_size
+        if self._memory_size > stats.max_allocation_bytes:
+            stats.max_allocation_bytes = self._memory_size
     
     @property
     def value(self) -> Any:
@@ -83,72 +240,93 @@ class OptimizedTreasure:
         old_size = self._memory_size
         
         self._value = new_value
-        base_size = sys.getsizeof(new_value)
+        base_size = _fast_sizeof(new_value)
         self._memory_size = max(16, base_size)
         
         # Update global memory tracking
         size_diff = self._memory_size - old_size
-        OptimizedTreasure._global_stats.total_memory_bytes += size_diff
-        OptimizedTreasure._global_stats.max_allocation_bytes = max(
-            OptimizedTreasure._global_stats.max_allocation_bytes,
-            self._memory_size
-        )
+        stats = _local_stats()
+        stats.total_memory_bytes += size_diff
+        if self._memory_size > stats.max_allocation_bytes:
+            stats.max_allocation_bytes = self._memory_size
     
     def cache_operation(self, operation_name: str, result: Any, 
-                       cache_key: Optional[str] = None) -> None:
+                       cache_key: Optional[Hashable] = None) -> None:
         """💾 Cache operation result with memory tracking"""
         
         key = cache_key or f"{operation_name}_{self._allocation_id}"
-        cache_size = sys.getsizeof(result)
-        
-        self._cache[key] = {
-            'result': result,
-            'timestamp': time.time(),
-            'size_bytes': cache_size,
-            'operation': operation_name
-        }
-        
-        # Update cache statistics
-        OptimizedTreasure._global_stats.cache_memory_bytes += cache_size
+        OptimizedTreasure._write_cache(self, key, operation_name, result)
     
     def get_cached_result(self, operation_name: str, 
-                         cache_key: Optional[str] = None) -> Optional[Any]:
+                         cache_key: Optional[Hashable] = None) -> Optional[Any]:
         """🔍 Retrieve cached operation result"""
         
         key = cache_key or f"{operation_name}_{self._allocation_id}"
         
-        if key in self._cache:
-            OptimizedTreasure._global_stats.cache_hits += 1
-            return self._cache[key]['result']
-        else:
-            OptimizedTreasure._global_stats.cache_misses += 1
-            return None
+        entry = self._cache.get(key)
+        if entry is not None:
+            result = entry.result
+            if type(result) is weakref.ref:
+                result = result()
+            if result is not None:
+                _local_stats().cache_hits += 1
+                return result
+            # Reclaimed payload whose callback hasn't run yet - drop the entry now
+            self._drop_reclaimed(key, entry.result)
+        
+        _local_stats().cache_misses += 1
+        return None
     
     def clear_cache(self, operation_name: Optional[str] = None):
         """🗑️ Clear cache (specific operation or all)"""
         
         if operation_name:
-            # Clear specific operation cache
-            keys_to_remove = [
-                key for key, data in self._cache.items() 
-                if data['operation'] == operation_name
-            ]
-            for key in keys_to_remove:
-                cache_size = self._cache[key]['size_bytes']
-                OptimizedTreasure._global_stats.cache_memory_bytes -= cache_size
-                del self._cache[key]
+            # Clear specific operation cache - only its indexed keys, no scan of the cache
+            if self._op_index is None:
+                return
+            for key in self._op_index.pop(operation_name, ()):
+                self._discard_cache_entry(key)
         else:
-            # Clear all cache
-            total_cache_size = sum(
-                data['size_bytes'] for data in self._cache.values()
-            )
-            OptimizedTreasure._global_stats.cache_memory_bytes -= total_cache_size
-            self._cache.clear()
+            # Clear all cache - one counter update, no per-entry arithmetic
+            _local_stats().cache_memory_bytes -= self._cache_memory_bytes
+            self._cache_memory_bytes = 0
+            self._cache = _EMPTY_CACHE  # Drop the dict itself, not just its entries
+            self._op_index = None
+    
+    def _discard_cache_entry(self, key: Hashable) -> int:
+        """🗑️ Remove one cache entry and return the bytes it accounted for"""
+        
+        entry = self._cache.pop(key)
+        keys = self._op_index.get(entry.operation)
+        if keys is not None:
+            keys.discard(key)
+        
+        cache_size = entry.size_bytes
+        self._cache_memory_bytes -= cache_size
+        _local_stats().cache_memory_bytes -= cache_size
+        return cache_size
+    
+    def _drop_reclaimed(self, key: Hashable, ref: 'weakref.ref') -> None:
+        """🗑️ Forget a weakly cached entry whose payload was garbage collected
+        
+        Called from the weakref callback (in whichever thread dropped the last
+        reference) and from get_cached_result; whichever runs second finds the
+        entry gone or replaced and does nothing.
+        """
+        entry = self._cache.get(key)
+        if entry is None or entry.result is not ref:
+            return
+        with suppress(KeyError):
+            self._discard_cache_entry(key)
+    
+    def total_bytes(self) -> int:
+        """📏 Value plus cache bytes from two slot reads"""
+        return self._memory_size + self._cache_memory_bytes
     
     def get_memory_info(self) -> Dict[str, Any]:
         """📊 Get memory information for this instance"""
         
-        cache_size = sum(data['size_bytes'] for data in self._cache.values())
+        cache_size = self._cache_memory_bytes
         
         return {
             'allocation_id': self._allocation_id,
@@ -161,14 +339,24 @@ class OptimizedTreasure:
     
     @classmethod
     def get_global_stats(cls) -> MemoryStats:
-        """📊 Get global memory statistics for all OptimizedTreasure instances"""
-        return cls._global_stats
+        """📊 Get global memory statistics for all OptimizedTreasure instances
+        
+        Returns a fresh MemoryStats summed over every thread's bucket.
+        """
+        with _stats_buckets_lock:
+            buckets = tuple(_stats_buckets)
+        
+        total = MemoryStats()
+        for name in _SUMMED_STATS:
+            setattr(total, name, sum(getattr(bucket, name) for bucket in buckets))
+        total.max_allocation_bytes = max((b.max_allocation_bytes for b in buckets), default=0)
+        return total
     
     @classmethod
     def force_garbage_collection(cls) -> int:
         """🗑️ Force garbage collection and update statistics"""
         collected = gc.collect()
-        cls._global_stats.gc_collections += 1
+        _local_stats().gc_collections += 1
         return collected
     
     def __repr__(self) -> str:
@@ -176,8 +364,46 @@ class OptimizedTreasure:
     
     def __sizeof__(self) -> int:
         """Return actual memory size including cache"""
-        cache_size = sum(data['size_bytes'] for data in self._cache.values())
-        return self._memory_size + cache_size
+        return self.total_bytes()
+
+# Cache admission: a result is cached if it took at least this long to compute,
+# or if the sketch has seen its key at least _MIN_ADMIT_FREQUENCY times recently
+MIN_CACHE_COST_SEC = 1e-6
+_MIN_ADMIT_FREQUENCY = 2
+
+_SKETCH_BITS = 12  # 4096 counters per row; 4 rows consume 48 bits of one hash
+_HALVE_TABLE = bytes(i >> 1 for i in range(256))
+
+class _FrequencySketch:
+    """📈 Count-min sketch of recent key frequencies (TinyLFU-style admission filter)"""
+    __slots__ = ('_rows', '_mask', '_additions', '_reset_at')
+    
+    def __init__(self, depth: int = 4):
+        self._rows = [bytearray(1 << _SKETCH_BITS) for _ in range(depth)]
+        self._mask = (1 << _SKETCH_BITS) - 1
+        self._additions = 0
+        self._reset_at = 10 << _SKETCH_BITS
+    
+    def increment(self, key: Any) -> int:
+        """➕ Count one sighting of key and return its estimated recent frequency"""
+        h = hash(key)
+        estimate = 255
+        for row in self._rows:
+            i = h & self._mask
+            h >>= _SKETCH_BITS
+            count = row[i]
+            if count < 255:
+                row[i] = count = count + 1
+            estimate = min(estimate, count)
+        
+        # Periodically halve every counter so old popularity fades
+        self._additions += 1
+        if self._additions >= self._reset_at:
+            self._additions = 0
+            self._rows = [row.translate(_HALVE_TABLE) for row in self._rows]
+        return estimate
+
+_LOCK_STRIPES = 64  # Power of two - a term's stripe is hash(term_id) & (_LOCK_STRIPES - 1)
 
 class DynamicOptimizedLibrary:
     """🏛️ Dynamic library for storing and managing OptimizedTreasure terms"""
@@ -186,48 +412,61 @@ class DynamicOptimizedLibrary:
                  cache_allocation_mb: int = 100):
         """🎯 Initialize dynamic optimized library"""
         
-        self.terms: Dict[str, OptimizedTreasure] = {}
+        # Kept in LRU order (least recently used first) - no timestamps to sort on eviction
+        self.terms: 'OrderedDict[str, OptimizedTreasure]' = OrderedDict()
         self.capacity = initial_capacity
         self.cache_allocation_bytes = cache_allocation_mb * 1024 * 1024
-        self.creation_order: List[str] = []
-        self.access_counts: Dict[str, int] = defaultdict(int)
-        self.last_access: Dict[str, float] = {}
-        self._lock = threading.RLock()
+        self._lock = threading.RLock()  # Whole-library work: eviction, cache heap, stats
+        # Per-term writers lock only their stripe, so stores of unrelated terms run in parallel
+        self._stripe_locks = [threading.Lock() for _ in range(_LOCK_STRIPES)]
         
-        print(f"🏛️ DynamicOptimizedLibrary initialized")
-        print(f"   Initial capacity: {initial_capacity:,} terms")
-        print(f"   Cache allocation: {cache_allocation_mb} MB")
-        print(f"   Memory optimization: C-level __slots__")
+        # Min-heap of (timestamp, seq, term_id, cache_key, size_bytes), oldest cache entry on top.
+        # seq breaks timestamp ties so keys are never compared. Entries go stale when
+        # overwritten/cleared/evicted and are skipped on pop.
+        self._cache_heap: List[Tuple[int, int, str, Hashable, int]] = []
+        self._heap_seq = itertools.count()
+        self._heap_compact_at = 1024
+        
+        # Admission filter - keeps cheap one-shot results from eating the cache budget
+        self._admission_sketch = _FrequencySketch()
+        
+        _LOG.info("DynamicOptimizedLibrary initialized: capacity %s terms, cache allocation %d MB", 
+                  f"{initial_capacity:,}", cache_allocation_mb)
     
     def store_term(self, term_id: str, value: Any, 
                    min_bytes: int = 16) -> OptimizedTreasure:
         """💾 Store a term with optimized memory allocation"""
         
-        with self._lock:
+        with self._stripe_locks[hash(term_id) & (_LOCK_STRIPES - 1)]:
             # Create optimized treasure
             treasure = OptimizedTreasure(value, min_bytes)
             
-            # Store in library
+            # Store in library (most recently used end) - each call is atomic under the GIL
             self.terms[term_id] = treasure
-            self.creation_order.append(term_id)
-            self.last_access[term_id] = time.time()
-            
-            # Check capacity and cleanup if needed
-            if len(self.terms) > self.capacity:
-                self._cleanup_old_terms()
-            
-            print(f"💾 Stored term '{term_id}' ({treasure._memory_size} bytes)")
-            return treasure
+            self.terms.move_to_end(term_id)
+        
+        # Check capacity and cleanup if needed
+        if len(self.terms) > self.capacity:
+            self._cleanup_old_terms()
+        
+        _LOG.debug("Stored term '%s' (%d bytes)", term_id, treasure._memory_size)
+        return treasure
     
     def get_term(self, term_id: str) -> Optional[OptimizedTreasure]:
-        """🔍 Retrieve a stored term"""
+        """🔍 Retrieve a stored term
         
-        with self._lock:
-            if term_id in self.terms:
-                self.access_counts[term_id] += 1
-                self.last_access[term_id] = time.time()
-                return self.terms[term_id]
-            return None
+        Lock-free: each dict/OrderedDict call is atomic under the GIL, so only
+        writers lock (term stores their stripes, eviction self._lock). Writers
+        iterate over snapshots for the same reason.
+        """
+        
+        treasure = self.terms.get(term_id)
+        if treasure is not None:
+            treasure._access_count += 1
+            # A concurrent eviction may have removed it since the get - nothing to promote then
+            with suppress(KeyError):
+                self.terms.move_to_end(term_id)
+        return treasure
     
     def cache_operation_result(self, term_id: str, operation_name: str, 
                               operation_func: Callable, *args, **kwargs) -> Any:
@@ -238,78 +477,122 @@ class DynamicOptimizedLibrary:
             raise ValueError(f"Term '{term_id}' not found in library")
         
         # Check cache first
-        cache_key = f"{operation_name}_{hash(str(args) + str(kwargs))}"
+        cache_key = (operation_name, _argkey(args, kwargs))
         cached_result = term.get_cached_result(operation_name, cache_key)
         
         if cached_result is not None:
-            print(f"💾 Cache hit for '{operation_name}' on term '{term_id}'")
+            _LOG.debug("Cache hit for '%s' on term '%s'", operation_name, term_id)
             return cached_result
         
         # Execute operation
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = operation_func(term.value, *args, **kwargs)
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         
-        # Cache result
-        term.cache_operation(operation_name, result, cache_key)
+        # Cache result only if it was costly to compute or keeps being requested
+        seen = self._admission_sketch.increment((term_id, cache_key))
+        if execution_time >= MIN_CACHE_COST_SEC or seen >= _MIN_ADMIT_FREQUENCY:
+            term.cache_operation(operation_name, result, cache_key)
+            self._track_cache_entry(term_id, term, cache_key)
         
-        print(f"⚡ Executed '{operation_name}' on term '{term_id}' ({execution_time:.4f}s)")
+        _LOG.debug("Executed '%s' on term '%s' (%.4fs)", operation_name, term_id, execution_time)
         return result
     
+    def _track_cache_entry(self, term_id: str, term: OptimizedTreasure, cache_key: Hashable):
+        """⏱️ Record a new cache entry in the eviction heap"""
+        
+        entry = term._cache[cache_key]
+        with self._lock:
+            heapq.heappush(self._cache_heap, (entry.timestamp, next(self._heap_seq), 
+                                              term_id, cache_key, entry.size_bytes))
+            
+            # Drop stale entries once they could outnumber live ones (amortized O(1) per push)
+            if len(self._cache_heap) >= self._heap_compact_at:
+                self._compact_cache_heap()
+    
+    def _is_live_cache_entry(self, timestamp: int, term_id: str, cache_key: Hashable) -> bool:
+        """🔍 True if the heap item still matches a cached entry (not overwritten or evicted)"""
+        term = self.terms.get(term_id)
+        if term is None:
+            return False
+        entry = term._cache.get(cache_key)
+        return entry is not None and entry.timestamp == timestamp
+    
+    def _compact_cache_heap(self):
+        """🧹 Rebuild the eviction heap from live entries only"""
+        
+        self._cache_heap = [
+            item for item in self._cache_heap 
+            if self._is_live_cache_entry(item[0], item[2], item[3])
+        ]
+        heapq.heapify(self._cache_heap)
+        self._heap_compact_at = max(1024, 2 * len(self._cache_heap))
+    
     def bulk_store_terms(self, terms_data: Dict[str, Any], 
                         min_bytes: int = 16) -> Dict[str, OptimizedTreasure]:
         """📦 Store multiple terms efficiently"""
         
-        print(f"📦 Bulk storing {len(terms_data)} terms...")
-        start_time = time.time()
+        _LOG.debug("Bulk storing %d terms...", len(terms_data))
+        start_time = time.perf_counter()
+        
+        # Build every treasure first, then publish them while holding their stripes -
+        # the same locks store_term takes, acquired in index order so neither can deadlock
+        stored_terms = {
+            term_id: OptimizedTreasure(value, min_bytes) 
+            for term_id, value in terms_data.items()
+        }
+        stripes = sorted({hash(term_id) & (_LOCK_STRIPES - 1) for term_id in stored_terms})
+        
+        with ExitStack() as held:
+            for stripe in stripes:
+                held.enter_context(self._stripe_locks[stripe])
+            terms = self.terms
+            for term_id, treasure in stored_terms.items():
+                terms[term_id] = treasure
+                terms.move_to_end(term_id)
         
-        stored_terms = {}
-        for term_id, value in terms_data.items():
-            stored_terms[term_id] = self.store_term(term_id, value, min_bytes)
+        # One capacity check for the whole batch
+        if len(self.terms) > self.capacity:
+            self._cleanup_old_terms()
         
-        bulk_time = time.time() - start_time
-        print(f"✅ Bulk storage complete ({bulk_time:.4f}s)")
+        bulk_time = time.perf_counter() - start_time
+        _LOG.debug("Bulk storage complete (%.4fs)", bulk_time)
         
         return stored_terms
     
     def _cleanup_old_terms(self, cleanup_ratio: float = 0.2):
         """🗑️ Clean up least recently used terms"""
         
-        cleanup_count = int(len(self.terms) * cleanup_ratio)
-        
-        # Sort by last access time (oldest first)
-        sorted_terms = sorted(
-            self.last_access.items(), 
-            key=lambda x: x[1]
-        )
-        
-        terms_to_remove = sorted_terms[:cleanup_count]
-        
-        for term_id, _ in terms_to_remove:
-            if term_id in self.terms:
-                del self.terms[term_id]
-                del self.last_access[term_id]
-                if term_id in self.access_counts:
-                    del self.access_counts[term_id]
-                if term_id in self.creation_order:
-                    self.creation_order.remove(term_id)
+        with self._lock:
+            # Another writer may have already evicted while we waited
+            if len(self.terms) <= self.capacity:
+                return
+            
+            # At least enough to get back under capacity
+            cleanup_count = max(int(len(self.terms) * cleanup_ratio), len(self.terms) - self.capacity)
+            
+            # Least recently used terms sit at the front - O(1) per eviction
+            for _ in range(cleanup_count):
+                self.terms.popitem(last=False)
         
-        print(f"🗑️ Cleaned up {len(terms_to_remove)} old terms")
+        _LOG.debug("Cleaned up %d old terms", cleanup_count)
     
     def get_library_stats(self) -> Dict[str, Any]:
         """📊 Get comprehensive library statistics"""
         
         with self._lock:
             total_memory = sum(
-                term.get_memory_info()['total_memory_bytes'] 
-                for term in self.terms.values()
+                term._memory_size + term._cache_memory_bytes 
+                for term in tuple(self.terms.values())
             )
             
             most_accessed = max(
-                self.access_counts.items(), 
-                key=lambda x: x[1], 
+                ((term_id, term._access_count) for term_id, term in tuple(self.terms.items())), 
+                key=itemgetter(1), 
                 default=("none", 0)
             )
+            if not most_accessed[1]:
+                most_accessed = ("none", 0)
             
             return {
                 'total_terms': len(self.terms),
@@ -326,16 +609,16 @@ class DynamicOptimizedLibrary:
     def optimize_memory(self) -> Dict[str, Any]:
         """🚀 Perform comprehensive memory optimization"""
         
-        print("🚀 Starting memory optimization...")
-        start_time = time.time()
+        _LOG.info("Starting memory optimization...")
+        start_time = time.perf_counter()
         
         # Force garbage collection
         collected = OptimizedTreasure.force_garbage_collection()
         
         # Clear old cache entries based on allocation limit
         total_cache_memory = sum(
-            term.get_memory_info()['cache_memory_bytes'] 
-            for term in self.terms.values()
+            term._cache_memory_bytes 
+            for term in tuple(self.terms.values())
         )
         
         if total_cache_memory > self.cache_allocation_bytes:
@@ -346,12 +629,11 @@ class DynamicOptimizedLibrary:
         if len(self.terms) > self.capacity:
             self._cleanup_old_terms()
         
-        optimization_time = time.time() - start_time
+        optimization_time = time.perf_counter() - start_time
         final_stats = self.get_library_stats()
         
-        print(f"✅ Memory optimization complete ({optimization_time:.4f}s)")
-        print(f"   Garbage collected: {collected} objects")
-        print(f"   Final memory usage: {final_stats['memory_usage_mb']:.2f} MB")
+        _LOG.info("Memory optimization complete (%.4fs): %d objects collected, %.2f MB in use", 
+                  optimization_time, collected, final_stats['memory_usage_mb'])
         
         return {
             'optimization_time': optimization_time,
@@ -362,65 +644,59 @@ class DynamicOptimizedLibrary:
     def _reduce_cache_memory(self, reduction_bytes: int):
         """📉 Reduce cache memory usage"""
         
-        print(f"📉 Reducing cache memory by {reduction_bytes / (1024*1024):.2f} MB")
-        
-        # Collect all cache entries with timestamps
-        cache_entries = []
-        for term_id, term in self.terms.items():
-            for cache_key, cache_data in term._cache.items():
-                cache_entries.append((
-                    term_id, cache_key, cache_data['timestamp'], 
-                    cache_data['size_bytes']
-                ))
-        
-        # Sort by timestamp (oldest first)
-        cache_entries.sort(key=lambda x: x[2])
+        _LOG.debug("Reducing cache memory by %.2f MB", reduction_bytes / (1024*1024))
         
+        # Pop oldest entries off the heap until enough is freed - O(k log N), no full scan
         bytes_reduced = 0
-        for term_id, cache_key, _, cache_size in cache_entries:
-            if bytes_reduced >= reduction_bytes:
-                break
-            
-            term = self.terms[term_id]
-            if cache_key in term._cache:
-                del term._cache[cache_key]
-                bytes_reduced += cache_size
-                OptimizedTreasure._global_stats.cache_memory_bytes -= cache_size
-        
-        print(f"📉 Reduced cache memory by {bytes_reduced / (1024*1024):.2f} MB")
+        with self._lock:
+            while bytes_reduced < reduction_bytes and self._cache_heap:
+                timestamp, _, term_id, cache_key, cache_size = heapq.heappop(self._cache_heap)
+                if not self._is_live_cache_entry(timestamp, term_id, cache_key):
+                    continue
+                
+                bytes_reduced += self.terms[term_id]._discard_cache_entry(cache_key)
+        
+        _LOG.debug("Reduced cache memory by %.2f MB", bytes_reduced / (1024*1024))
+
+# Example operations for demonstration - one table lookup per call instead of an if-chain
+_SCALAR_MATH_OPS: Dict[str, Callable[[Any], Any]] = {
+    'square': lambda v: v ** 2,
+    'cube': lambda v: v ** 3,
+    'sqrt': lambda v: v ** 0.5,
+}
+_ARRAY_MATH_OPS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    'square': np.square,
+    'cube': lambda a: np.power(a, 3),
+    'sqrt': np.sqrt,
+}
 
-# Example operations for demonstration
 def mathematical_operation(value: Any, operation: str = "square") -> Any:
     """🧮 Perform mathematical operations on values"""
     if isinstance(value, (int, float)):
-        if operation == "square":
-            return value ** 2
-        elif operation == "cube":
-            return value ** 3
-        elif operation == "sqrt":
-            return value ** 0.5
-    elif isinstance(value, (list, np.ndarray)):
-        arr = np.array(value) if not isinstance(value, np.ndarray) else value
-        if operation == "square":
-            return arr ** 2
-        elif operation == "cube":
-            return arr ** 3
-        elif operation == "sqrt":
-            return np.sqrt(arr)
+        op = _SCALAR_MATH_OPS.get(operation)
+        return op(value) if op is not None else value
+    
+    if isinstance(value, (list, np.ndarray)):
+        op = _ARRAY_MATH_OPS.get(operation)
+        if op is not None:
+            # asarray passes ndarrays through untouched - only lists get converted
+            return op(np.asarray(value))
     
     return value
 
+_STRING_OPS: Dict[str, Callable[[str], Any]] = {
+    'upper': str.upper,
+    'lower': str.lower,
+    'reverse': lambda v: v[::-1],
+    'length': len,
+}
+
 def string_operation(value: Any, operation: str = "upper") -> Any:
     """📝 Perform string operations on values"""
     if isinstance(value, str):
-        if operation == "upper":
-            return value.upper()
-        elif operation == "lower":
-            return value.lower()
-        elif operation == "reverse":
-            return value[::-1]
-        elif operation == "length":
-            return len(value)
+        op = _STRING_OPS.get(operation)
+        if op is not None:
+            return op(value)
     
     return str(value)
 
@@ -524,6 +800,8 @@ def demonstrate_dynamic_optimized_library():
     return library, stats
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    
     print("DYNAMIC OPTIMIZED LIBRARY")
     print("C-Level Memory Control + Dynamic Term Storage")
     print("=" * 90)
@@ -22,20 +22,48 @@ Architecture:
 """
 
 import time
-import sys
+import math
 import threading
 import multiprocessing
-from decimal import Decimal, getcontext
+from decimal import Decimal, getcontext, localcontext
 from typing import Any, Dict, List, Tuple, Optional, Union, Callable
 import numpy as np
 from dataclasses import dataclass, field
 import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+import contextvars
 from collections import defaultdict, deque
 import weakref
+import pickle
+import logging
+import heapq
+import functools
+import itertools
+
+_LOG = logging.getLogger("cortex.intelligent_term_delegator")
+_LOG.addHandler(logging.NullHandler())  # Silent unless the application configures logging
 
 # Set high precision for complex operations
 getcontext().prec = 100
 
+# Inputs up to this size get every term costed exactly; larger ones are estimated from samples
+FULL_ANALYSIS_MAX_TERMS = 50000
+
+# Below this many terms a group runs inline - pool startup and pickling cost more than the work
+PARALLEL_MIN_TERMS = 2000
+MIN_TERMS_PER_CHUNK = 256  # Smaller chunks are all dispatch overhead
+
+# Powers of ten for counting int64 decimal digits without str()
+_POW10_INT64 = np.array([10 ** k for k in range(19)], dtype=np.int64)
+_INT64_MIN = np.iinfo(np.int64).min  # Has no int64 absolute value
+
+# Uniform numeric inputs only use the full pipeline past this many terms per configured thread
+UNIFORM_TERMS_PER_THREAD = 10000
+_UNIFORM_COST_CV = 0.1  # Sample cost std/mean below this counts as uniform
+
+# Term types a homogeneous chunk can hand to numpy unchanged, with the dtype kind that proves it
+_VECTOR_DTYPE_KINDS = {int: 'i', float: 'f'}
+
 @dataclass
 class TermComplexity:
     """📊 Analysis results for term complexity"""
@@ -55,6 +83,65 @@ class ArrayGroupConfig:
     max_terms_per_thread: int
     complexity_filter: str  # 'complex', 'simple', 'all'
 
+def _compute_term_byte_cost(term: Any) -> int:
+    """📏 Calculate byte cost of a single term"""
+    
+    try:
+        if isinstance(term, (int, float)):
+            # Numeric terms
+            if isinstance(term, int):
+                # Integer byte cost based on magnitude
+                if abs(term) < 256:
+                    return 1
+                elif abs(term) < 65536:
+                    return 2
+                elif abs(term) < 16777216:
+                    return 4
+                else:
+                    return 8 + len(str(abs(term)))
+            else:
+                # Float byte cost
+                return 8 + (4 if abs(term) > 1e6 else 0)
+        
+        elif isinstance(term, Decimal):
+            # Decimal precision byte cost
+            str_repr = str(term)
+            return len(str_repr.encode('utf-8')) + 16  # Decimal overhead
+        
+        elif isinstance(term, str):
+            # String byte cost
+            return len(term.encode('utf-8'))
+        
+        elif isinstance(term, (list, tuple)):
+            # Collection byte cost
+            total_cost = 24  # Collection overhead
+            for item in term[:10]:  # Sample first 10 items
+                total_cost += _term_byte_cost(item)
+            return total_cost * (len(term) / min(10, len(term)))
+        
+        else:
+            # Default estimation - a flat proxy; every object has __sizeof__, so probing it never filtered anything
+            return 128
+            
+    except Exception:
+        # Fallback estimation
+        return 64  # Default 64 bytes for unknown types
+
+# Exact types whose cost depends only on their value - safe to memoize on (type, value)
+_COST_CACHE_TYPES = frozenset((int, float, str))
+
+@functools.lru_cache(maxsize=65536)
+def _cached_term_byte_cost(term_type: type, term: Any) -> int:
+    """📏 Memoized cost for repeated scalar terms - the type in the key keeps 1, 1.0 and True apart"""
+    return _compute_term_byte_cost(term)
+
+def _term_byte_cost(term: Any) -> int:
+    """📏 Byte cost of one term, served from the cache for hashable scalars"""
+    term_type = type(term)
+    if term_type in _COST_CACHE_TYPES:
+        return _cached_term_byte_cost(term_type, term)
+    return _compute_term_byte_cost(term)
+
 class IntelligentTermDelegator:
     """🧠 Intelligent term analysis and delegation system"""
     
@@ -75,10 +162,11 @@ class IntelligentTermDelegator:
         # Configure array groups
         self._setup_array_groups()
         
-        print(f"🧠 Intelligent Term Delegator initialized")
-        print(f"   Total threads: {self.total_threads}")
-        print(f"   Group 1 (Wide Arrays): {self.group1_config.thread_count} threads")
-        print(f"   Group 2 (Split Arrays): {self.group2_config.thread_count} threads")
+        # Compile kernels before any pool forks, so workers inherit them ready to run
+        _warm_jit_kernels()
+        
+        _LOG.info("Intelligent Term Delegator initialized: %d threads (group 1: %d wide, group 2: %d split)",
+                  self.total_threads, self.group1_config.thread_count, self.group2_config.thread_count)
     
     def _setup_array_groups(self):
         """⚙️ Setup two array groups with optimal configurations"""
@@ -102,9 +190,9 @@ class IntelligentTermDelegator:
             complexity_filter='simple'
         )
         
-        print(f"📊 Array Groups Configured:")
-        print(f"   Group 1: {self.group1_config.thread_count} threads (wide arrays, complex terms)")
-        print(f"   Group 2: {self.group2_config.thread_count} threads (split arrays, simple terms)")
+        _LOG.debug("Array groups configured: group 1 %d threads (wide arrays, complex terms), "
+                   "group 2 %d threads (split arrays, simple terms)",
+                   self.group1_config.thread_count, self.group2_config.thread_count)
     
     def detect_input_complexity(self, input_data: List[Any]) -> Dict[str, Any]:
         """🔍 Detect forms and complexity before reaching arrays"""
@@ -114,7 +202,6 @@ class IntelligentTermDelegator:
         # Sample terms for complexity analysis
         sample_size = min(100, len(input_data))
         sample_indices = np.linspace(0, len(input_data) - 1, sample_size, dtype=int)
-        samples = [input_data[i] for i in sample_indices]
         
         complexity_analysis = {
             'total_terms': len(input_data),
@@ -126,28 +213,28 @@ class IntelligentTermDelegator:
             'complexity_level': 'unknown'
         }
         
-        # Analyze each sample term
-        total_byte_cost = 0
-        for term in samples:
-            byte_cost = self._calculate_term_byte_cost(term)
-            complexity_analysis['byte_costs'].append(byte_cost)
-            total_byte_cost += byte_cost
+        # Analyze each sample term - when every term will be costed anyway, cost them all here, once,
+        # and hand the array on to delegate_terms instead of recomputing it there
+        if len(input_data) <= FULL_ANALYSIS_MAX_TERMS:
+            term_costs = self._calculate_byte_costs_bulk(input_data)
+            complexity_analysis['term_byte_costs'] = term_costs
+            sample_costs = term_costs[sample_indices]
+        else:
+            sample_costs = self._calculate_byte_costs_bulk([input_data[i] for i in sample_indices.tolist()])
+        complexity_analysis['byte_costs'] = sample_costs.tolist()
+        costs = sample_costs.astype(np.float64)
         
         # Calculate statistics
-        if complexity_analysis['byte_costs']:
-            complexity_analysis['byte_cost_average'] = total_byte_cost / len(complexity_analysis['byte_costs'])
+        if costs.size:
+            complexity_analysis['byte_cost_average'] = float(costs.mean())  # Pairwise summation
             self.byte_cost_threshold = complexity_analysis['byte_cost_average'] / 2  # Half average for "low byte"
         
-        # Classify complexity distribution
-        for byte_cost in complexity_analysis['byte_costs']:
-            if byte_cost < self.byte_cost_threshold:
-                complexity_analysis['complexity_distribution']['low'] += 1
-            elif byte_cost < self.byte_cost_threshold * 2:
-                complexity_analysis['complexity_distribution']['medium'] += 1
-            elif byte_cost < self.byte_cost_threshold * 4:
-                complexity_analysis['complexity_distribution']['high'] += 1
-            else:
-                complexity_analysis['complexity_distribution']['overflow'] += 1
+        # Classify complexity distribution - one digitize/bincount instead of a branch chain per sample
+        bucket_edges = [self.byte_cost_threshold, self.byte_cost_threshold * 2, self.byte_cost_threshold * 4]
+        bucket_counts = np.bincount(np.digitize(costs, bucket_edges), minlength=4)
+        complexity_analysis['complexity_distribution'] = dict(
+            zip(('low', 'medium', 'high', 'overflow'), bucket_counts.tolist())
+        )
         
         # Determine overall complexity level
         high_complex_ratio = (
@@ -165,143 +252,316 @@ class IntelligentTermDelegator:
         detection_time = time.time() - start_time
         complexity_analysis['detection_time'] = detection_time
         
-        print(f"🔍 Input Complexity Detection Complete:")
-        print(f"   Total terms: {complexity_analysis['total_terms']:,}")
-        print(f"   Average byte cost: {complexity_analysis['byte_cost_average']:.1f} bytes")
-        print(f"   Complexity level: {complexity_analysis['complexity_level']}")
-        print(f"   Distribution: {complexity_analysis['complexity_distribution']}")
-        print(f"   Recommended split: {complexity_analysis['recommended_split']}")
-        print(f"   Detection time: {detection_time:.6f}s")
+        _LOG.debug("Input complexity detection complete (%.6fs): %d terms, average byte cost %.1f bytes, "
+                   "%s level, distribution %s, recommended split %s",
+                   detection_time, complexity_analysis['total_terms'], complexity_analysis['byte_cost_average'],
+                   complexity_analysis['complexity_level'], complexity_analysis['complexity_distribution'],
+                   complexity_analysis['recommended_split'])
         
         return complexity_analysis
     
     def _calculate_term_byte_cost(self, term: Any) -> int:
         """📏 Calculate byte cost of a single term"""
-        
-        try:
-            if isinstance(term, (int, float)):
-                # Numeric terms
-                if isinstance(term, int):
-                    # Integer byte cost based on magnitude
-                    if abs(term) < 256:
-                        return 1
-                    elif abs(term) < 65536:
-                        return 2
-                    elif abs(term) < 16777216:
-                        return 4
-                    else:
-                        return 8 + len(str(abs(term)))
-                else:
-                    # Float byte cost
-                    return 8 + (4 if abs(term) > 1e6 else 0)
-            
-            elif isinstance(term, Decimal):
-                # Decimal precision byte cost
-                str_repr = str(term)
-                return len(str_repr.encode('utf-8')) + 16  # Decimal overhead
-            
-            elif isinstance(term, str):
-                # String byte cost
-                return len(term.encode('utf-8'))
-            
-            elif isinstance(term, (list, tuple)):
-                # Collection byte cost
-                total_cost = 24  # Collection overhead
-                for item in term[:10]:  # Sample first 10 items
-                    total_cost += self._calculate_term_byte_cost(item)
-                return total_cost * (len(term) / min(10, len(term)))
-            
-            elif hasattr(term, '__sizeof__'):
-                # Objects with sizeof
-                return term.__sizeof__()
-            
-            else:
-                # Default estimation
-                return sys.getsizeof(term)
-                
-        except Exception:
-            # Fallback estimation
-            return 64  # Default 64 bytes for unknown types
+        return _term_byte_cost(term)
+    
+    def _calculate_byte_costs_bulk(self, terms: List[Any]) -> np.ndarray:
+        """📏 Byte costs for a whole term list - a single numpy pass when every term has the same type"""
+        
+        term_types = set(map(type, terms))
+        if term_types == {int}:
+            arr = np.asarray(terms)
+            if arr.dtype.kind == 'i' and arr.min() > _INT64_MIN:  # Huge ints come back as object arrays
+                abs_arr = np.abs(arr)
+                # Past 3 bytes the scalar path charges 8 + the decimal digit count
+                digits = np.searchsorted(_POW10_INT64, abs_arr, side='right')
+                return np.select([abs_arr < 256, abs_arr < 65536, abs_arr < 16777216], [1, 2, 4], default=8 + digits)
+        elif term_types == {float}:
+            return np.where(np.abs(np.asarray(terms, dtype=np.float64)) > 1e6, 12, 8)
+        elif term_types == {Decimal}:
+            # Decimal strings are pure ASCII, so len(str) is already the UTF-8 byte count
+            return np.fromiter((len(str(term)) for term in terms), dtype=np.int64, count=len(terms)) + 16
+        
+        # Mixed or other types: the scalar path, still collected in one pass
+        return np.fromiter(map(_term_byte_cost, terms), dtype=np.float64, count=len(terms))
+    
+    def _extrapolate_type_costs(self, input_data: List[Any]) -> Dict[type, float]:
+        """📐 Per-type average cost from a sqrt-scale stratified sample, for types the sample routes unanimously"""
+        
+        sample_count = min(len(input_data), max(256, math.isqrt(len(input_data)) * 8))
+        sample_indices = np.linspace(0, len(input_data) - 1, sample_count, dtype=np.int64)
+        sample_terms = [input_data[i] for i in sample_indices.tolist()]
+        sample_costs = self._calculate_byte_costs_bulk(sample_terms).tolist()
+        
+        costs_by_type = defaultdict(list)
+        for term, byte_cost in zip(sample_terms, sample_costs):
+            costs_by_type[type(term)].append(byte_cost)
+        
+        complex_cost = self.byte_cost_threshold * 2
+        type_costs = {}
+        for term_type, costs in costs_by_type.items():
+            complex_votes = sum(cost >= complex_cost for cost in costs)
+            if complex_votes == 0 or complex_votes == len(costs):  # Mixed types keep per-term estimation
+                type_costs[term_type] = sum(costs) / len(costs)
+        
+        return type_costs
     
     def delegate_terms(self, input_data: List[Any], complexity_analysis: Dict[str, Any]) -> Dict[str, List[Any]]:
         """🎯 Delegate terms to appropriate array groups"""
         
         start_time = time.time()
         
-        delegated_terms = {
-            'group1_complex': [],    # Wide arrays for complex terms
-            'group2_simple': [],     # Split arrays for simple terms
-            'delegation_map': {}     # Track original indices
-        }
-        
         # Pre-calculate byte costs for all terms (if not too many)
-        if len(input_data) <= 50000:  # Full analysis for reasonable sizes
-            term_complexities = []
-            for i, term in enumerate(input_data):
-                byte_cost = self._calculate_term_byte_cost(term)
-                
-                if byte_cost >= self.byte_cost_threshold * 2:  # High complexity
-                    complexity_level = 'complex'
-                    thread_group = 1
-                    delegated_terms['group1_complex'].append(term)
-                    self.delegation_stats['complex_terms'] += 1
-                else:  # Low byte cost
-                    complexity_level = 'simple'
-                    thread_group = 2
-                    delegated_terms['group2_simple'].append(term)
-                    self.delegation_stats['simple_terms'] += 1
-                
-                # Track delegation mapping
-                delegated_terms['delegation_map'][i] = {
-                    'group': thread_group,
-                    'complexity': complexity_level,
-                    'byte_cost': byte_cost
-                }
-                
-                term_complexities.append(TermComplexity(
-                    term_value=term,
-                    byte_cost=byte_cost,
-                    complexity_level=complexity_level,
-                    estimated_compute_time=byte_cost / 1000.0,  # Rough estimate
-                    memory_requirement=byte_cost,
-                    thread_group=thread_group
-                ))
+        if len(input_data) <= FULL_ANALYSIS_MAX_TERMS:  # Full analysis for reasonable sizes
+            term_costs = complexity_analysis.get('term_byte_costs')
+            if term_costs is None or len(term_costs) != len(input_data):
+                term_costs = self._calculate_byte_costs_bulk(input_data)
+            costs = term_costs.astype(np.float64)
         
         else:  # Sampling for very large datasets
             # Use the complexity analysis to make delegation decisions
             complex_ratio = complexity_analysis['complexity_distribution']['high'] / complexity_analysis['sample_size']
+            type_costs = self._extrapolate_type_costs(input_data)
             
-            for i, term in enumerate(input_data):
-                # Use sampling strategy for large datasets
-                if i % 10 == 0:  # Every 10th term gets full analysis
-                    byte_cost = self._calculate_term_byte_cost(term)
-                else:
-                    # Estimate based on complex ratio
-                    if np.random.random() < complex_ratio:
-                        byte_cost = self.byte_cost_threshold * 3  # Assume complex
-                    else:
-                        byte_cost = self.byte_cost_threshold * 0.5  # Assume simple
+            # Types the stratified sample routed consistently take their sampled average cost; NaN = unresolved
+            costs = np.fromiter(map(type_costs.get, map(type, input_data), itertools.repeat(np.nan)),
+                                dtype=np.float64, count=len(input_data))
+            unresolved = np.isnan(costs)
+            
+            if unresolved.any():
+                # Every 10th unresolved term gets full analysis; the rest are estimated from the complex ratio
+                is_sampled = unresolved & (np.arange(len(input_data)) % 10 == 0)
+                sampled_positions = np.flatnonzero(is_sampled)
+                costs[sampled_positions] = self._calculate_byte_costs_bulk(
+                    [input_data[i] for i in sampled_positions.tolist()]
+                )
                 
-                if byte_cost >= self.byte_cost_threshold * 2:
-                    delegated_terms['group1_complex'].append(term)
-                    self.delegation_stats['complex_terms'] += 1
-                    delegated_terms['delegation_map'][i] = {'group': 1, 'complexity': 'complex', 'byte_cost': byte_cost}
-                else:
-                    delegated_terms['group2_simple'].append(term)
-                    self.delegation_stats['simple_terms'] += 1
-                    delegated_terms['delegation_map'][i] = {'group': 2, 'complexity': 'simple', 'byte_cost': byte_cost}
+                is_guessed = unresolved & ~is_sampled
+                # One vectorized Bernoulli draw instead of an np.random.random() call per term
+                is_complex_guess = np.random.random(len(input_data)) < complex_ratio
+                costs[is_guessed] = np.where(is_complex_guess[is_guessed],
+                                             self.byte_cost_threshold * 3,     # Assume complex
+                                             self.byte_cost_threshold * 0.5)   # Assume simple
+            
+        # Per-term delegation record as parallel arrays - group id and byte cost by original index
+        is_complex = costs >= self.byte_cost_threshold * 2  # High complexity
+        groups = np.where(is_complex, 1, 2).astype(np.int8)
+        byte_costs = costs.astype(np.float32)
+        
+        # Target slots per group, in group order - workers' results are written straight into them
+        group1_indices = np.flatnonzero(is_complex)
+        group2_indices = np.flatnonzero(~is_complex)
+        
+        # Group lists are gathered at their final size instead of grown one append at a time
+        delegated_terms = {
+            'group1_complex': [input_data[i] for i in group1_indices.tolist()],  # Wide arrays for complex terms
+            'group2_simple': [input_data[i] for i in group2_indices.tolist()],   # Split arrays for simple terms
+            'groups': groups,
+            'byte_costs': byte_costs,
+            'group1_indices': group1_indices,
+            'group2_indices': group2_indices,
+            'group1_byte_costs': byte_costs[is_complex],
+            'group2_byte_costs': byte_costs[~is_complex],
+        }
+        self.delegation_stats['complex_terms'] += len(group1_indices)
+        self.delegation_stats['simple_terms'] += len(group2_indices)
         
         delegation_time = time.time() - start_time
         self.delegation_stats['delegation_time'] = delegation_time
         
-        print(f"🎯 Term Delegation Complete:")
-        print(f"   Group 1 (Complex): {len(delegated_terms['group1_complex']):,} terms")
-        print(f"   Group 2 (Simple): {len(delegated_terms['group2_simple']):,} terms")
-        print(f"   Delegation time: {delegation_time:.6f}s")
-        print(f"   Complex ratio: {len(delegated_terms['group1_complex']) / len(input_data):.1%}")
+        _LOG.debug("Term delegation complete (%.6fs): %d complex, %d simple",
+                   delegation_time, len(group1_indices), len(group2_indices))
         
         return delegated_terms
 
+# Per-process cache of compiled chunk loops, keyed by operation (None = no inline form)
+_SPECIALIZED_LOOPS: 'weakref.WeakKeyDictionary[Callable, Optional[Callable]]' = weakref.WeakKeyDictionary()
+
+def _specialized_loop(operation_func: Callable) -> Optional[Callable]:
+    """🧬 Chunk loop with the operation's inline_expr compiled into a comprehension - no call per term"""
+    
+    try:
+        return _SPECIALIZED_LOOPS[operation_func]
+    except KeyError:
+        pass
+    except TypeError:  # Not weak-referenceable, so never specialized
+        return None
+    
+    loop = None
+    inline_expr = getattr(operation_func, 'inline_expr', None)
+    if inline_expr is not None:
+        source = f"def loop(chunk):\n    return [{inline_expr} for term in chunk]\n"
+        namespace = {}
+        try:
+            # The operation's own globals, so names in the expression resolve exactly as in its body
+            exec(compile(source, f"<inlined {operation_func.__name__}>", 'exec'),
+                 getattr(operation_func, '__globals__', {}), namespace)
+            loop = namespace['loop']
+        except SyntaxError as e:
+            _LOG.warning("Cannot inline %s: %s", operation_func.__name__, e)
+    
+    _SPECIALIZED_LOOPS[operation_func] = loop
+    return loop
+
+def _run_specialized(chunk: List[Any], operation_func: Callable) -> Optional[List[Any]]:
+    """🧬 Results from the compiled loop - None when there is none or it raised"""
+    loop = _specialized_loop(operation_func)
+    if loop is None:
+        return None
+    try:
+        return loop(chunk)
+    except Exception:
+        return None  # The caller reruns term by term, keeping the good prefix and logging the failure
+
+def _process_wide_chunk(chunk: List[Any], operation_func: Callable, chunk_idx: int) -> List[Any]:
+    """🔥 Process a chunk using wide array method (for complex terms)"""
+    
+    results = []
+    try:
+        # Wide processing: More memory, more precision, more time per term
+        wide_context = getcontext().copy()
+        wide_context.prec += 20  # Extra precision for Decimal terms, built once per chunk
+        
+        if set(map(type, chunk)) == {Decimal}:
+            # All-Decimal chunk (the usual group 1 case): one context push for the whole chunk
+            with localcontext(wide_context):
+                specialized = _run_specialized(chunk, operation_func)
+                results.extend(map(operation_func, chunk) if specialized is None else specialized)
+        else:
+            for term in chunk:
+                # Apply operation with extra precision for complex terms
+                if isinstance(term, Decimal):
+                    with localcontext(wide_context):
+                        results.append(operation_func(term))
+                else:
+                    results.append(operation_func(term))
+            
+    except Exception as e:
+        _LOG.error("Wide chunk %d processing error: %s", chunk_idx, e)
+    
+    return results
+
+def _run_chunk_at_prec(chunk_func: Callable, chunk: List[Any], operation_func: Callable, 
+                       chunk_idx: int, prec: int) -> Union[List[Any], np.ndarray]:
+    """🎯 Pool entry point - workers were forked earlier, so run under the submitter's precision"""
+    with localcontext() as ctx:
+        ctx.prec = prec
+        return chunk_func(chunk, operation_func, chunk_idx)
+
+def _apply_vector_func(chunk: List[Any], vector_func: Callable) -> Optional[np.ndarray]:
+    """🚀 Run a homogeneous int/float chunk through one numpy call - None means use the scalar loop"""
+    
+    kind = _VECTOR_DTYPE_KINDS.get(type(chunk[0]))
+    if kind is None or len(set(map(type, chunk))) != 1:
+        return None
+    
+    arr = np.asarray(chunk)
+    if arr.dtype.kind != kind:  # Ints beyond int64 come back as object arrays
+        return None
+    
+    # Stays a typed array - one buffer to pickle back from the worker instead of a PyObject per term
+    return vector_func(arr)
+
+def _process_split_chunk(chunk: List[Any], operation_func: Callable, chunk_idx: int) -> Union[List[Any], np.ndarray]:
+    """⚡ Process a chunk using split array method (for simple terms)"""
+    
+    # Operations with an array twin skip the per-term Python call entirely
+    vector_func = getattr(operation_func, 'vector_func', None)
+    if vector_func is not None and chunk:
+        vector_results = _apply_vector_func(chunk, vector_func)
+        if vector_results is not None:
+            return vector_results
+    
+    specialized = _run_specialized(chunk, operation_func)
+    if specialized is not None:
+        return specialized
+    
+    results = []
+    try:
+        # Split processing: Fast and efficient for simple terms
+        for term in chunk:
+            result = operation_func(term)
+            results.append(result)
+            
+    except Exception as e:
+        _LOG.error("Split chunk %d processing error: %s", chunk_idx, e)
+    
+    return results
+
+def _store_chunk_results(final_results: np.ndarray, chunk_indices: np.ndarray, 
+                         chunk_results: Union[List[Any], np.ndarray]):
+    """📥 Scatter a chunk's results into their original slots (a failed chunk returns only its prefix)"""
+    count = len(chunk_results)
+    if isinstance(chunk_results, np.ndarray):
+        # Vectorized chunks scatter straight from their typed buffer
+        final_results[chunk_indices[:count]] = chunk_results
+        return
+    # fromiter keeps tuple/list results as single objects instead of letting numpy unpack them
+    final_results[chunk_indices[:count]] = np.fromiter(chunk_results, dtype=object, count=count)
+
+def _chunk_count(term_count: int, thread_count: int, max_terms_per_thread: int) -> int:
+    """📦 Chunks for a group - enough to honour max_terms_per_thread, few enough that none is tiny"""
+    # More chunks than workers is fine: the pool queue hands them out as workers free up
+    chunk_count = max(thread_count, -(-term_count // max_terms_per_thread))
+    return max(1, min(chunk_count, term_count // MIN_TERMS_PER_CHUNK))
+
+def _plan_chunks(byte_costs: np.ndarray, chunk_count: int) -> List[np.ndarray]:
+    """⚖️ Group positions per chunk - LPT by byte cost, or an even split when every cost is equal"""
+    
+    term_count = len(byte_costs)
+    chunk_count = max(1, min(chunk_count, term_count))
+    
+    if term_count == 0 or byte_costs.min() == byte_costs.max():
+        # begin(c) = N*c//T spreads the remainder instead of leaving a short tail chunk
+        bounds = [term_count * c // chunk_count for c in range(chunk_count + 1)]
+        return [np.arange(bounds[c], bounds[c + 1]) for c in range(chunk_count)]
+    
+    # Longest processing time first: heaviest remaining term goes to the lightest chunk
+    order = np.argsort(byte_costs, kind='stable')[::-1]
+    loads = [(0.0, c) for c in range(chunk_count)]
+    members = [[] for _ in range(chunk_count)]
+    for position, cost in zip(order.tolist(), byte_costs[order].tolist()):
+        load, c = heapq.heappop(loads)
+        members[c].append(position)
+        heapq.heappush(loads, (load + cost, c))
+    
+    # Keep each chunk in group order so neighbouring terms stay together
+    return [np.sort(np.asarray(chunk_members, dtype=np.int64)) for chunk_members in members]
+
+def _pool_context():
+    """🍴 Prefer fork so workers inherit imports and the Decimal context instead of re-importing"""
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+def _warm_pool_worker():
+    """🔥 No-op task that makes a fresh pool start its worker processes"""
+    return None
+
+def _discard_pool(pool: concurrent.futures.ProcessPoolExecutor):
+    """♻️ Shut a pool down without waiting and stop workers still busy with abandoned chunks"""
+    processes = list((getattr(pool, '_processes', None) or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+
+def _shutdown_executors(executors: Dict[str, Any]):
+    """🧹 Shut down a processor's pools - close() and its GC / interpreter-exit finalizer"""
+    for name, executor in executors.items():
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+            executors[name] = None
+
+def _can_use_pool(terms: List[Any], operation_func: Callable) -> bool:
+    """🧮 Worth a process pool: enough terms, and an operation the workers can unpickle"""
+    if len(terms) < PARALLEL_MIN_TERMS:
+        return False
+    try:
+        pickle.dumps(operation_func)  # Lambdas and closures cannot cross the process boundary
+    except Exception:
+        return False
+    return True
+
 class IntelligentArrayProcessor:
     """🔧 Process arrays using intelligent delegation system"""
     
@@ -313,15 +573,59 @@ class IntelligentArrayProcessor:
             'recombination_time': 0,
             'total_processing_time': 0
         }
+        
+        # Long-lived pools - fork and import cost is paid once per processor, not on every call.
+        # 'runner' drives group 1 while the calling thread drives group 2 (the groups share no data).
+        self._executors: Dict[str, Any] = {
+            'group1': self._create_pool(delegator.group1_config.thread_count),
+            'group2': self._create_pool(delegator.group2_config.thread_count),
+            'runner': concurrent.futures.ThreadPoolExecutor(max_workers=1),
+        }
+        # Callers that never close() still get their worker processes shut down
+        self._finalizer = weakref.finalize(self, _shutdown_executors, self._executors)
+    
+    @staticmethod
+    def _create_pool(thread_count: int) -> Optional[concurrent.futures.ProcessPoolExecutor]:
+        """🏊 Persistent worker pool for a group - the submitting thread acts as its last worker"""
+        
+        # Decimal work holds the GIL, so only separate processes actually run chunks in parallel
+        if thread_count < 2:
+            return None
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=thread_count - 1, mp_context=_pool_context())
+        pool.submit(_warm_pool_worker)  # Start the workers now rather than on the first real chunk
+        return pool
+    
+    def _recycle_pool(self, group: str, thread_count: int, stale: Any, reason: str):
+        """♻️ Replace a group's pool that timed out or broke (no-op if `stale` was already replaced)"""
+        
+        if stale is None or self._executors[group] is not stale:
+            return
+        _discard_pool(stale)
+        self._executors[group] = self._create_pool(thread_count)
+        _LOG.warning("Recycled the %s worker pool after %s", group, reason)
+    
+    def close(self):
+        """🧹 Shut down the persistent worker pools (also runs at GC or interpreter exit)"""
+        self._finalizer()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
     
     def process_with_intelligent_delegation(self, input_data: List[Any], operation_func: Callable) -> List[Any]:
         """🚀 Main processing function with intelligent delegation"""
         
         total_start_time = time.time()
         
-        print(f"🚀 Starting Intelligent Array Processing:")
-        print(f"   Input size: {len(input_data):,} terms")
-        print(f"   Operation: {operation_func.__name__}")
+        if self._should_run_inline(input_data):
+            final_results = self._process_inline(input_data, operation_func)
+            self.processing_stats['total_processing_time'] = time.time() - total_start_time
+            return final_results
+        
+        _LOG.debug("Starting intelligent array processing: %d terms, operation %s",
+                   len(input_data), getattr(operation_func, '__name__', operation_func))
         
         # Step 1: Detect input complexity
         complexity_analysis = self.delegator.detect_input_complexity(input_data)
@@ -329,215 +633,213 @@ class IntelligentArrayProcessor:
         # Step 2: Delegate terms to appropriate groups
         delegated_terms = self.delegator.delegate_terms(input_data, complexity_analysis)
         
-        # Step 3: Process Group 1 (Wide Arrays - Complex Terms)
-        group1_results = {}
+        # Every result is written straight into its original slot; 0 stays wherever a chunk failed
+        final_results = np.zeros(len(input_data), dtype=object)
+        
+        # Step 3: Process Group 1 (Wide Arrays - Complex Terms) - concurrently with group 2
+        group1_future = None
         if delegated_terms['group1_complex']:
-            print(f"\n🔥 Processing Group 1 (Wide Arrays):")
-            group1_start = time.time()
-            group1_results = self._process_group1_wide_arrays(
+            group1_args = (
+                'group1_time',
+                self._process_group1_wide_arrays,
                 delegated_terms['group1_complex'], 
+                delegated_terms['group1_indices'],
+                delegated_terms['group1_byte_costs'],
+                final_results,
                 operation_func
             )
-            self.processing_stats['group1_time'] = time.time() - group1_start
+            runner = self._executors['runner']
+            if runner is None:  # Closed processor: run the groups back to back
+                self._run_timed_group(*group1_args)
+            else:
+                # The copied context carries this thread's Decimal precision over to the runner thread
+                group1_future = runner.submit(
+                    contextvars.copy_context().run, self._run_timed_group, *group1_args
+                )
         
-        # Step 4: Process Group 2 (Split Arrays - Simple Terms)
-        group2_results = {}
+        # Step 4: Process Group 2 (Split Arrays - Simple Terms) on the calling thread
         if delegated_terms['group2_simple']:
-            print(f"\n⚡ Processing Group 2 (Split Arrays):")
-            group2_start = time.time()
-            group2_results = self._process_group2_split_arrays(
+            self._run_timed_group(
+                'group2_time',
+                self._process_group2_split_arrays,
                 delegated_terms['group2_simple'], 
+                delegated_terms['group2_indices'],
+                delegated_terms['group2_byte_costs'],
+                final_results,
                 operation_func
             )
-            self.processing_stats['group2_time'] = time.time() - group2_start
+        
+        # Total wall time is max(group1, group2) rather than their sum
+        if group1_future is not None:
+            group1_future.result()
         
         # Step 5: Re-combine results
-        print(f"\n🔄 Re-combining results...")
         recombine_start = time.time()
-        final_results = self._recombine_results(
-            group1_results, 
-            group2_results, 
-            delegated_terms['delegation_map'],
-            len(input_data)
-        )
+        final_results = self._recombine_results(final_results)
         self.processing_stats['recombination_time'] = time.time() - recombine_start
         
         self.processing_stats['total_processing_time'] = time.time() - total_start_time
         
-        self._print_processing_summary()
+        self._log_processing_summary()
         
         return final_results
     
-    def _process_group1_wide_arrays(self, complex_terms: List[Any], operation_func: Callable) -> Dict[int, Any]:
-        """🔥 Process complex terms using wide arrays (4 threads)"""
-        
-        print(f"   Complex terms: {len(complex_terms):,}")
-        print(f"   Using wide arrays with {self.delegator.group1_config.thread_count} threads")
-        
-        # Split into fewer, wider chunks for complex operations
-        chunk_size = max(1, len(complex_terms) // self.delegator.group1_config.thread_count)
-        chunks = [complex_terms[i:i + chunk_size] for i in range(0, len(complex_terms), chunk_size)]
-        
-        results = {}
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.delegator.group1_config.thread_count) as executor:
-            futures = []
-            
-            for chunk_idx, chunk in enumerate(chunks):
-                future = executor.submit(self._process_wide_chunk, chunk, operation_func, chunk_idx)
-                futures.append((future, chunk_idx, len(chunk)))
-            
-            # Collect results from wide array processing
-            for future, chunk_idx, chunk_size in futures:
-                try:
-                    chunk_results = future.result(timeout=30)
-                    results[chunk_idx] = chunk_results
-                    print(f"   Wide array chunk {chunk_idx}: {chunk_size} terms processed")
-                except Exception as e:
-                    print(f"   ❌ Wide array chunk {chunk_idx} error: {e}")
-                    results[chunk_idx] = []
-        
-        return results
+    def _should_run_inline(self, input_data: List[Any]) -> bool:
+        """🧭 Small or uniform plain-numeric inputs - delegation would cost more than it saves"""
+        
+        # Decimals stay on the full path: their precision depends on the group they land in
+        if not input_data or not set(map(type, input_data)) <= _VECTOR_DTYPE_KINDS.keys():
+            return False
+        if len(input_data) < PARALLEL_MIN_TERMS:
+            return True
+        if len(input_data) > self.delegator.total_threads * UNIFORM_TERMS_PER_THREAD:
+            return False
+        
+        sample_indices = np.linspace(0, len(input_data) - 1, min(100, len(input_data)), dtype=np.int64)
+        sample_costs = self.delegator._calculate_byte_costs_bulk([input_data[i] for i in sample_indices.tolist()])
+        return float(np.std(sample_costs)) < _UNIFORM_COST_CV * float(np.mean(sample_costs))
     
-    def _process_group2_split_arrays(self, simple_terms: List[Any], operation_func: Callable) -> Dict[int, Any]:
-        """⚡ Process simple terms using split arrays (remaining threads)"""
-        
-        print(f"   Simple terms: {len(simple_terms):,}")
-        print(f"   Using split arrays with {self.delegator.group2_config.thread_count} threads")
+    def _process_inline(self, input_data: List[Any], operation_func: Callable) -> List[Any]:
+        """⚡ Whole input as one split chunk on the calling thread - vectorized when the operation allows"""
         
-        # Split into many smaller chunks for simple operations
-        chunk_size = max(1, len(simple_terms) // self.delegator.group2_config.thread_count)
-        chunks = [simple_terms[i:i + chunk_size] for i in range(0, len(simple_terms), chunk_size)]
-        
-        results = {}
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.delegator.group2_config.thread_count) as executor:
-            futures = []
-            
-            for chunk_idx, chunk in enumerate(chunks):
-                future = executor.submit(self._process_split_chunk, chunk, operation_func, chunk_idx)
-                futures.append((future, chunk_idx, len(chunk)))
-            
-            # Collect results from split array processing
-            for future, chunk_idx, chunk_size in futures:
-                try:
-                    chunk_results = future.result(timeout=15)
-                    results[chunk_idx] = chunk_results
-                    print(f"   Split array chunk {chunk_idx}: {chunk_size} terms processed")
-                except Exception as e:
-                    print(f"   ❌ Split array chunk {chunk_idx} error: {e}")
-                    results[chunk_idx] = []
+        _LOG.debug("Processing %d terms inline, skipping delegation", len(input_data))
         
+        results = _process_split_chunk(list(input_data), operation_func, 0)
+        results = results.tolist() if isinstance(results, np.ndarray) else results
+        results.extend([0] * (len(input_data) - len(results)))  # A failed tail stays 0, as in a failed chunk
         return results
     
-    def _process_wide_chunk(self, chunk: List[Any], operation_func: Callable, chunk_idx: int) -> List[Any]:
-        """🔥 Process a chunk using wide array method (for complex terms)"""
+    def _run_timed_group(self, stat_key: str, group_func: Callable, *group_args):
+        """⏱️ Run one group's processing and record its wall time"""
         
-        results = []
-        try:
-            # Wide processing: More memory, more precision, more time per term
-            for term in chunk:
-                # Apply operation with extra precision for complex terms
-                if hasattr(term, '__class__') and 'Decimal' in str(term.__class__):
-                    # High precision processing
-                    original_prec = getcontext().prec
-                    getcontext().prec = original_prec + 20  # Extra precision
-                    
-                    result = operation_func(term)
-                    
-                    getcontext().prec = original_prec  # Restore precision
-                else:
-                    result = operation_func(term)
-                
-                results.append(result)
-                
-        except Exception as e:
-            print(f"   ❌ Wide chunk {chunk_idx} processing error: {e}")
-        
-        return results
+        group_start = time.time()
+        group_func(*group_args)
+        self.processing_stats[stat_key] = time.time() - group_start
     
-    def _process_split_chunk(self, chunk: List[Any], operation_func: Callable, chunk_idx: int) -> List[Any]:
-        """⚡ Process a chunk using split array method (for simple terms)"""
-        
-        results = []
-        try:
-            # Split processing: Fast and efficient for simple terms
-            for term in chunk:
-                result = operation_func(term)
-                results.append(result)
-                
-        except Exception as e:
-            print(f"   ❌ Split chunk {chunk_idx} processing error: {e}")
+    def _process_group1_wide_arrays(self, complex_terms: List[Any], indices: np.ndarray, byte_costs: np.ndarray,
+                                    final_results: np.ndarray, operation_func: Callable):
+        """🔥 Process complex terms using wide arrays (4 threads)"""
         
-        return results
-    
-    def _recombine_results(self, group1_results: Dict[int, Any], group2_results: Dict[int, Any], 
-                          delegation_map: Dict[int, Dict], original_length: int) -> List[Any]:
-        """🔄 Intelligently recombine results from both groups"""
+        thread_count = self.delegator.group1_config.thread_count
+        _LOG.debug("Group 1: %d complex terms on wide arrays with %d threads", len(complex_terms), thread_count)
         
-        # Create final results array
-        final_results = [None] * original_length
+        if self._executors['group1'] is None or not _can_use_pool(complex_terms, operation_func):
+            _store_chunk_results(final_results, indices, _process_wide_chunk(complex_terms, operation_func, 0))
+            return
         
-        # Flatten group results
-        group1_flat = []
-        for chunk_results in group1_results.values():
-            group1_flat.extend(chunk_results)
+        # Split into fewer, wider chunks for complex operations, balanced by byte cost
+        chunk_count = _chunk_count(len(complex_terms), thread_count, self.delegator.group1_config.max_terms_per_thread)
+        self._run_pooled_chunks('group1', thread_count, _process_wide_chunk, "Wide array", 30,
+                                complex_terms, indices, _plan_chunks(byte_costs, chunk_count),
+                                final_results, operation_func)
+    
+    def _process_group2_split_arrays(self, simple_terms: List[Any], indices: np.ndarray, byte_costs: np.ndarray,
+                                     final_results: np.ndarray, operation_func: Callable):
+        """⚡ Process simple terms using split arrays (remaining threads)"""
         
-        group2_flat = []
-        for chunk_results in group2_results.values():
-            group2_flat.extend(chunk_results)
+        thread_count = self.delegator.group2_config.thread_count
+        _LOG.debug("Group 2: %d simple terms on split arrays with %d threads", len(simple_terms), thread_count)
         
-        # Map results back to original positions
-        group1_idx = 0
-        group2_idx = 0
+        if self._executors['group2'] is None or not _can_use_pool(simple_terms, operation_func):
+            _store_chunk_results(final_results, indices, _process_split_chunk(simple_terms, operation_func, 0))
+            return
         
-        for original_idx in range(original_length):
-            if original_idx in delegation_map:
-                delegation_info = delegation_map[original_idx]
-                
-                if delegation_info['group'] == 1 and group1_idx < len(group1_flat):
-                    final_results[original_idx] = group1_flat[group1_idx]
-                    group1_idx += 1
-                elif delegation_info['group'] == 2 and group2_idx < len(group2_flat):
-                    final_results[original_idx] = group2_flat[group2_idx]
-                    group2_idx += 1
-                else:
-                    # Fallback: use default value
-                    final_results[original_idx] = 0
-            else:
-                # Handle unmapped indices
-                final_results[original_idx] = 0
-        
-        # Fill any remaining None values
-        for i in range(len(final_results)):
-            if final_results[i] is None:
-                final_results[i] = 0
+        # Split into many smaller chunks for simple operations, balanced by byte cost
+        chunk_count = _chunk_count(len(simple_terms), thread_count, self.delegator.group2_config.max_terms_per_thread)
+        self._run_pooled_chunks('group2', thread_count, _process_split_chunk, "Split array", 15,
+                                simple_terms, indices, _plan_chunks(byte_costs, chunk_count),
+                                final_results, operation_func)
+    
+    def _run_pooled_chunks(self, group: str, thread_count: int, chunk_func: Callable, label: str, 
+                           timeout: float, terms: List[Any], indices: np.ndarray, 
+                           chunk_positions: List[np.ndarray], final_results: np.ndarray, 
+                           operation_func: Callable):
+        """🏊 Run every chunk but the last on the group's pool and the last one inline
+        
+        A chunk whose worker died (BrokenProcessPool at submit or result) is rerun
+        inline and the pool is rebuilt; a chunk that timed out while running also
+        gets its pool rebuilt, since only that frees the worker.
+        """
+        
+        *pooled_positions, inline_positions = chunk_positions
+        chunk_debug = _LOG.isEnabledFor(logging.DEBUG)  # Per-chunk messages only when someone is listening
+        prec = getcontext().prec  # Shipped with every chunk - the workers' own context is from fork time
+        
+        # Pool workers take every chunk but the last - the submitting thread works that one itself
+        futures = []
+        
+        for chunk_idx, positions in enumerate(pooled_positions):
+            chunk = [terms[p] for p in positions.tolist()]
+            executor = self._executors[group]
+            future = None
+            if executor is not None:
+                try:
+                    future = executor.submit(_run_chunk_at_prec, chunk_func, chunk, operation_func, 
+                                             chunk_idx, prec)
+                except BrokenProcessPool:
+                    self._recycle_pool(group, thread_count, executor, "a worker died")
+            if future is None:
+                _store_chunk_results(final_results, indices[positions], chunk_func(chunk, operation_func, chunk_idx))
+                continue
+            futures.append((future, executor, chunk, chunk_idx, indices[positions]))
+        
+        inline_idx = len(pooled_positions)
+        inline_chunk = [terms[p] for p in inline_positions.tolist()]
+        _store_chunk_results(final_results, indices[inline_positions], 
+                             chunk_func(inline_chunk, operation_func, inline_idx))
+        if chunk_debug:
+            _LOG.debug("%s chunk %d: %d terms processed (inline)", label, inline_idx, len(inline_chunk))
+        
+        # Collect results from the pool; recycling waits until every sibling chunk is in
+        stale: Dict[int, Tuple[Any, str]] = {}
+        for future, executor, chunk, chunk_idx, chunk_indices in futures:
+            try:
+                _store_chunk_results(final_results, chunk_indices, future.result(timeout=timeout))
+                if chunk_debug:
+                    _LOG.debug("%s chunk %d: %d terms processed", label, chunk_idx, len(chunk_indices))
+            except concurrent.futures.TimeoutError:
+                _LOG.error("%s chunk %d timed out after %ss", label, chunk_idx, timeout)
+                if not future.cancel():  # Still running - only a new pool frees the worker
+                    stale[id(executor)] = (executor, "a chunk timeout")
+            except BrokenProcessPool:
+                _LOG.warning("%s chunk %d lost its worker - rerunning it inline", label, chunk_idx)
+                stale[id(executor)] = (executor, "a worker died")
+                _store_chunk_results(final_results, chunk_indices, chunk_func(chunk, operation_func, chunk_idx))
+            except Exception as e:
+                _LOG.error("%s chunk %d error: %s", label, chunk_idx, e)
+        
+        for executor, reason in stale.values():
+            self._recycle_pool(group, thread_count, executor, reason)
+    
+    def _recombine_results(self, final_results: np.ndarray) -> List[Any]:
+        """🔄 Hand back the slot buffer - both groups already wrote results in original order"""
         
-        print(f"   Recombined {len(final_results):,} results")
-        print(f"   Group 1 results used: {group1_idx}")
-        print(f"   Group 2 results used: {group2_idx}")
+        _LOG.debug("Recombined %d results", len(final_results))
         
-        return final_results
+        return final_results.tolist()
     
-    def _print_processing_summary(self):
-        """📊 Print comprehensive processing summary"""
+    def _log_processing_summary(self):
+        """📊 Log comprehensive processing summary"""
+        
+        if not _LOG.isEnabledFor(logging.INFO):
+            return
         
-        print(f"\n📊 INTELLIGENT PROCESSING SUMMARY:")
-        print(f"   Group 1 (Wide Arrays) time: {self.processing_stats['group1_time']:.6f}s")
-        print(f"   Group 2 (Split Arrays) time: {self.processing_stats['group2_time']:.6f}s")
-        print(f"   Recombination time: {self.processing_stats['recombination_time']:.6f}s")
-        print(f"   Total processing time: {self.processing_stats['total_processing_time']:.6f}s")
+        _LOG.info("Processing summary: group 1 (wide arrays) %.6fs, group 2 (split arrays) %.6fs, "
+                  "recombination %.6fs, total %.6fs",
+                  self.processing_stats['group1_time'], self.processing_stats['group2_time'],
+                  self.processing_stats['recombination_time'], self.processing_stats['total_processing_time'])
         
         # Calculate efficiency metrics
         if self.processing_stats['group1_time'] > 0 and self.processing_stats['group2_time'] > 0:
             parallel_efficiency = min(self.processing_stats['group1_time'], self.processing_stats['group2_time']) / max(self.processing_stats['group1_time'], self.processing_stats['group2_time'])
-            print(f"   Parallel efficiency: {parallel_efficiency:.1%}")
-        
-        print(f"   Complex terms: {self.delegator.delegation_stats['complex_terms']:,}")
-        print(f"   Simple terms: {self.delegator.delegation_stats['simple_terms']:,}")
+            _LOG.info("Parallel efficiency: %.1f%%", parallel_efficiency * 100)
         
         total_terms = self.delegator.delegation_stats['complex_terms'] + self.delegator.delegation_stats['simple_terms']
+        _LOG.info("Complex terms: %d, simple terms: %d",
+                  self.delegator.delegation_stats['complex_terms'], self.delegator.delegation_stats['simple_terms'])
         if total_terms > 0:
             throughput = total_terms / self.processing_stats['total_processing_time']
-            print(f"   Overall throughput: {throughput:,.0f} terms/second")
+            _LOG.info("Overall throughput: %.0f terms/second", throughput)
 
 # Example operations for testing
 def complex_pi_operation(term):
@@ -550,13 +852,57 @@ def complex_pi_operation(term):
         return result * 4  # Convert to π approximation
     return Decimal('0')
 
+# Same computation as one expression in `term`, for the compiled chunk loops
+complex_pi_operation.inline_expr = (
+    "Decimal((-1) ** int(term)) / Decimal(2 * int(term) + 1) * 4 "
+    "if isinstance(term, (int, float)) else Decimal('0')"
+)
+
 def simple_square_operation(term):
     """² Simple square operation"""
     if isinstance(term, (int, float)):
         return term ** 2
     return 0
 
+# Elementwise square for the vector path - JIT-compiled, GIL-free machine code when Numba is installed
+try:
+    from numba import njit
+    
+    @njit(nogil=True, cache=True)
+    def _square_kernel(a):
+        out = np.empty_like(a)
+        for i in range(a.size):
+            out[i] = a[i] * a[i]
+        return out
+    
+    NUMBA_AVAILABLE = True
+except ImportError:
+    def _square_kernel(a):
+        return a * a
+    
+    NUMBA_AVAILABLE = False
+
+def _warm_jit_kernels():
+    """🔥 Compile the int64 and float64 kernel variants up front so no workload pays the JIT cost"""
+    if NUMBA_AVAILABLE:
+        _square_kernel(np.arange(2, dtype=np.int64))
+        _square_kernel(np.arange(2, dtype=np.float64))
+
+# Largest int64 magnitude whose square still fits in int64
+_INT64_SQUARE_LIMIT = 3037000499
+
+def _square_vector(arr: np.ndarray) -> Optional[np.ndarray]:
+    """² Array twin of simple_square_operation - declines int arrays whose squares would wrap"""
+    if arr.dtype.kind == 'i' and max(int(arr.max()), -int(arr.min())) > _INT64_SQUARE_LIMIT:
+        return None
+    return _square_kernel(arr)
+
+simple_square_operation.vector_func = _square_vector
+simple_square_operation.inline_expr = "term ** 2 if isinstance(term, (int, float)) else 0"
+
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    
     # Demonstration of intelligent term delegation
     print("🏴‍☠️ INTELLIGENT TERM DELEGATOR & RE-COMBINER DEMONSTRATION")
     print("=" * 90)
@@ -588,10 +934,10 @@ if __name__ == "__main__":
     
     # Initialize intelligent system
     delegator = IntelligentTermDelegator()
-    processor = IntelligentArrayProcessor(delegator)
     
     # Process with intelligent delegation
-    results = processor.process_with_intelligent_delegation(test_data, complex_pi_operation)
+    with IntelligentArrayProcessor(delegator) as processor:
+        results = processor.process_with_intelligent_delegation(test_data, complex_pi_operation)
     
     print(f"\n🎯 Final Results:")
     print(f"   Processed {len(results):,} terms")
@@ -18,6 +18,7 @@ Strategy:
 """
 
 import time
+import pickle
 import threading
 from decimal import Decimal, getcontext
 from typing import List, Tuple, Callable, Any
@@ -28,6 +29,49 @@ from context_overflow_guard import ContextOverflowGuard
 # Maintain ultra-high precision
 getcontext().prec = 150
 
+# GMP-backed mpz carries the binary-splitting integers when gmpy2 is installed
+try:
+    import gmpy2
+    
+    _split_int = gmpy2.mpz
+    GMPY2_AVAILABLE = True
+except ImportError:
+    _split_int = int
+    GMPY2_AVAILABLE = False
+
+# (P, Q, B, T) for an empty term range - the combine identity
+_SPLIT_IDENTITY = (1, 1, 1, 0)
+
+def _combine_split(left: Tuple, right: Tuple) -> Tuple:
+    """🔗 Join the binary-split terms of two adjacent ranges"""
+    p1, q1, b1, t1 = left
+    p2, q2, b2, t2 = right
+    return p1 * p2, q1 * q2, b1 * b2, b2 * q2 * t1 + b1 * p1 * t2
+
+def _split_quotient(numerator: int, denominator: int) -> Decimal:
+    """➗ numerator / denominator at the current precision via one integer division
+    
+    Dividing before converting keeps the multi-thousand-digit split integers
+    out of Decimal entirely; only the ~prec-digit quotient is converted.
+    """
+    scale = getcontext().prec + 10
+    quotient = (numerator * 10 ** scale) // denominator
+    return +Decimal(int(quotient)).scaleb(-scale)
+
+def _arctan_split(x_sq: int, a: int, b: int) -> Tuple:
+    """🔢 Binary splitting of arctan(1/x) terms [a, b) into exact integers
+    
+    Term k is (1/x) * prod(-1/x² for j in 1..k) / (2k+1), so the range
+    sums to T / (B * Q) relative to the product of the ratios before a.
+    """
+    if b - a == 1:
+        if a == 0:
+            return _split_int(1), _split_int(1), _split_int(1), _split_int(1)
+        return _split_int(-1), _split_int(x_sq), _split_int(2 * a + 1), _split_int(-1)
+    
+    mid = (a + b) // 2
+    return _combine_split(_arctan_split(x_sq, a, mid), _arctan_split(x_sq, mid, b))
+
 @dataclass
 class PrecisionThreadResult:
     """🎯 Thread result with precision tracking"""
@@ -37,6 +81,126 @@ class PrecisionThreadResult:
     calculation_time: float
     terms_processed: int
 
+def _pairwise_sum(values: List[Decimal]) -> Decimal:
+    """➕ Pairwise (cascade) sum - rounding error grows O(log n) rather than O(n)"""
+    # Short runs are summed directly, as NumPy does, to keep recursion shallow
+    if len(values) <= 8:
+        total = Decimal('0')
+        for value in values:
+            total += value
+        return total
+    
+    mid = len(values) // 2
+    return _pairwise_sum(values[:mid]) + _pairwise_sum(values[mid:])
+
+def _kahan_sum(values: List[Decimal]) -> Decimal:
+    """➕ Kahan compensated sum - carries each addition's rounding error forward"""
+    total = Decimal('0')
+    compensation = Decimal('0')
+    for value in values:
+        y = value - compensation
+        t = total + y
+        compensation = (t - total) - y
+        total = t
+    return total
+
+def _precision_safe_worker(operation: Callable, 
+                           args_list: List[Any], 
+                           thread_id: int, 
+                           prec: int) -> PrecisionThreadResult:
+    """🔒 Worker function that maintains precision (module level so it pickles)"""
+    
+    start_time = time.perf_counter()
+    
+    # Terms are kept in order and reduced with compensation once the chunk is done
+    terms: List[Decimal] = []
+    precision_maintained = True
+    
+    try:
+        # Workers run under the caller's precision, whatever their own context holds
+        getcontext().prec = prec
+        
+        if args_list and isinstance(args_list[0], Decimal):
+            # Fast path: callers already hand over Decimals, skip the str round-trip
+            for arg in args_list:
+                term_result = operation(arg)
+                
+                if not isinstance(term_result, Decimal):
+                    term_result = Decimal(str(term_result))
+                    precision_maintained = False  # Flag conversion
+                
+                terms.append(term_result)
+        else:
+            for args in args_list:
+                # Ensure all operations use Decimal
+                if isinstance(args, (int, float)):
+                    args = [Decimal(str(args))]
+                elif not isinstance(args, list):
+                    args = [Decimal(str(args))]
+                else:
+                    args = [Decimal(str(arg)) for arg in args]
+                
+                # Calculate term with precision preservation
+                term_result = operation(*args)
+                
+                # Ensure result is Decimal
+                if not isinstance(term_result, Decimal):
+                    term_result = Decimal(str(term_result))
+                    precision_maintained = False  # Flag conversion
+                
+                # Keep submission order for the compensated reduction
+                terms.append(term_result)
+                
+    except Exception as e:
+        print(f"❌ Thread {thread_id} precision error: {e}")
+        precision_maintained = False
+    
+    thread_result = _kahan_sum(terms)
+    calculation_time = time.perf_counter() - start_time
+    
+    return PrecisionThreadResult(
+        thread_id=thread_id,
+        result=thread_result,
+        precision_maintained=precision_maintained,
+        calculation_time=calculation_time,
+        terms_processed=len(args_list)
+    )
+
+def _precision_safe_worker_fast(operation: Callable, 
+                                args_list: List[Decimal], 
+                                thread_id: int, 
+                                prec: int) -> PrecisionThreadResult:
+    """⚡ Worker for callers that guarantee Decimal inputs and outputs - no coercion"""
+    
+    start_time = time.perf_counter()
+    precision_maintained = True
+    thread_result = Decimal('0')
+    
+    try:
+        getcontext().prec = prec
+        thread_result = _kahan_sum([operation(arg) for arg in args_list])
+    except Exception as e:
+        print(f"❌ Thread {thread_id} precision error: {e}")
+        precision_maintained = False
+    
+    return PrecisionThreadResult(
+        thread_id=thread_id,
+        result=thread_result,
+        precision_maintained=precision_maintained,
+        calculation_time=time.perf_counter() - start_time,
+        terms_processed=len(args_list)
+    )
+
+def _arctan_block(x: int, start: int, count: int) -> Tuple[Tuple, float]:
+    """🎯 Binary-split (P, Q, B, T) for arctan(1/x) terms [start, start + count)"""
+    
+    start_time = time.perf_counter()
+    
+    # Pure integer work - no Decimal rounding happens inside a block
+    split = _arctan_split(x * x, start, start + count) if count else _SPLIT_IDENTITY
+    
+    return split, time.perf_counter() - start_time
+
 class PrecisionSafeThreading:
     """🎯 Threading implementation that maintains full decimal precision"""
     
@@ -45,73 +209,55 @@ class PrecisionSafeThreading:
         self.result_lock = threading.Lock()
         self.thread_results = {}
         
+        # Decimal arithmetic holds the GIL, so CPU-bound work goes to
+        # processes; the pool persists across calls to amortize spawning
+        self._process_pool = None
+        self._pool_workers = 0
+        
         print("🎯 Precision-Safe Threading initialized")
         print(f"   Decimal precision: {getcontext().prec}")
         print("   Strategy: Zero-drift multi-threading")
     
+    def _get_process_pool(self, num_workers: int) -> concurrent.futures.ProcessPoolExecutor:
+        """🏊 Shared process pool, rebuilt only when the worker count changes"""
+        if self._process_pool is None or self._pool_workers != num_workers:
+            self.close()
+            self._process_pool = concurrent.futures.ProcessPoolExecutor(max_workers=num_workers)
+            self._pool_workers = num_workers
+        return self._process_pool
+    
+    def close(self):
+        """🧹 Shut down the worker processes"""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True)
+            self._process_pool = None
+            self._pool_workers = 0
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+    
     def precision_safe_worker(self, 
                             operation: Callable, 
                             args_list: List[Any], 
                             thread_id: int) -> PrecisionThreadResult:
         """🔒 Worker function that maintains precision"""
-        
-        start_time = time.perf_counter()
-        
-        # Set thread-local precision to match global
-        original_context = getcontext()
-        local_context = getcontext().copy()
-        local_context.prec = 150
-        
-        # Use thread-local accumulator (pure Decimal)
-        thread_result = Decimal('0')
-        precision_maintained = True
-        
-        try:
-            # Set the local context for this thread
-            getcontext().prec = 150
-            
-            for args in args_list:
-                    # Ensure all operations use Decimal
-                    if isinstance(args, (int, float)):
-                        args = [Decimal(str(args))]
-                    elif not isinstance(args, list):
-                        args = [Decimal(str(args))]
-                    else:
-                        args = [Decimal(str(arg)) for arg in args]
-                    
-                    # Calculate term with precision preservation
-                    term_result = operation(*args)
-                    
-                    # Ensure result is Decimal
-                    if not isinstance(term_result, Decimal):
-                        term_result = Decimal(str(term_result))
-                        precision_maintained = False  # Flag conversion
-                    
-                    # Accumulate with order preservation
-                    thread_result += term_result
-                    
-        except Exception as e:
-            print(f"❌ Thread {thread_id} precision error: {e}")
-            precision_maintained = False
-        finally:
-            # Restore original context
-            pass
-        
-        calculation_time = time.perf_counter() - start_time
-        
-        return PrecisionThreadResult(
-            thread_id=thread_id,
-            result=thread_result,
-            precision_maintained=precision_maintained,
-            calculation_time=calculation_time,
-            terms_processed=len(args_list)
-        )
+        return _precision_safe_worker(operation, args_list, thread_id, getcontext().prec)
     
     def precision_safe_map(self, 
                           operation: Callable, 
                           input_data: List[Any], 
-                          num_threads: int = 4) -> Tuple[Decimal, List[PrecisionThreadResult]]:
-        """🎯 Map operation across threads with precision preservation"""
+                          num_threads: int = 4, 
+                          coerce: bool = True) -> Tuple[Decimal, List[PrecisionThreadResult]]:
+        """🎯 Map operation across threads with precision preservation
+        
+        coerce=False skips per-item Decimal coercion; the caller guarantees
+        Decimal inputs and an operation that returns Decimal. Raises
+        RuntimeError if any chunk fails or times out.
+        """
         
         print(f"🎯 Starting precision-safe mapping with {num_threads} threads...")
         print(f"   Input size: {len(input_data)} items")
@@ -128,37 +274,117 @@ class PrecisionSafeThreading:
         # Execute with precision safety
         thread_results = []
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=num_threads) as executor:
+        prec = getcontext().prec
+        worker = _precision_safe_worker if coerce else _precision_safe_worker_fast
+        
+        # Only picklable operations (module-level functions) can reach worker
+        # processes; lambdas and closures run on a thread pool instead
+        thread_executor = None
+        try:
+            pickle.dumps(operation)
+            executor = self._get_process_pool(num_threads)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            print("   ⚠️ Operation is not picklable - falling back to threads")
+            thread_executor = executor = concurrent.futures.ThreadPoolExecutor(max_workers=num_threads)
+        
+        try:
             # Submit all threads
             futures = []
             for i, chunk in enumerate(thread_chunks):
-                future = executor.submit(self.precision_safe_worker, operation, chunk, i)
+                future = executor.submit(worker, operation, chunk, i, prec)
                 futures.append((future, i))
             
-            # Collect results in order (critical for precision!)
+            # Collect results in order (critical for precision!) - a missing
+            # chunk would make the sum wrong, so any failure fails the map
             for future, thread_id in futures:
                 try:
                     result = future.result(timeout=30)  # Longer timeout for precision
-                    thread_results.append(result)
-                    
-                    precision_status = "✅ PRECISE" if result.precision_maintained else "⚠️ CONVERTED"
-                    print(f"   Thread {thread_id}: {result.terms_processed} terms, "
-                          f"{result.calculation_time:.6f}s, {precision_status}")
-                    
-                except concurrent.futures.TimeoutError:
+                except concurrent.futures.TimeoutError as e:
                     print(f"❌ Thread {thread_id} timeout")
+                    raise RuntimeError(f"precision_safe_map: thread {thread_id} timed out") from e
                 except Exception as e:
                     print(f"❌ Thread {thread_id} error: {e}")
+                    raise RuntimeError(f"precision_safe_map: thread {thread_id} failed: {e}") from e
+                
+                thread_results.append(result)
+                
+                precision_status = "✅ PRECISE" if result.precision_maintained else "⚠️ CONVERTED"
+                print(f"   Thread {thread_id}: {result.terms_processed} terms, "
+                      f"{result.calculation_time:.6f}s, {precision_status}")
+        finally:
+            if thread_executor is not None:
+                thread_executor.shutdown(wait=True)
         
-        # Combine results with order preservation (critical!)
-        final_result = Decimal('0')
-        for thread_result in sorted(thread_results, key=lambda x: x.thread_id):
-            final_result += thread_result.result
+        # Combine results with order preservation (critical!) - thread_results
+        # was filled in submission order, and a fixed-precision Decimal sum is
+        # deterministic for a fixed order, so no re-sort is needed; the pairwise
+        # tree keeps that order while bounding rounding growth if prec is lowered
+        final_result = _pairwise_sum([r.result for r in thread_results])
         
         print(f"✅ Precision-safe mapping complete: {len(thread_results)} threads successful")
         
         return final_result, thread_results
     
+    def precision_safe_arctan(self, x: int, start: int, count: int) -> Tuple[Tuple, float]:
+        """🎯 Binary-split (P, Q, B, T) for arctan(1/x) terms [start, start + count)"""
+        return _arctan_block(x, start, count)
+    
+    def _submit_arctan_blocks(self, x: int, terms: int, num_threads: int) -> Tuple[list, list]:
+        """📤 Queue arctan(1/x) term blocks on the pool without waiting for them"""
+        
+        num_threads = max(1, min(num_threads, terms))
+        block_size = terms // num_threads
+        blocks = []
+        
+        for i in range(num_threads):
+            start = i * block_size
+            count = block_size if i < num_threads - 1 else terms - start
+            blocks.append((start, count))
+        
+        executor = self._get_process_pool(num_threads)
+        futures = [executor.submit(_arctan_block, x, start, count) for start, count in blocks]
+        
+        return blocks, futures
+    
+    def _collect_arctan_blocks(self, 
+                               x: int, 
+                               blocks: list, 
+                               futures: list) -> Tuple[Decimal, List[PrecisionThreadResult]]:
+        """📥 Wait for queued arctan(1/x) blocks and combine them"""
+        
+        block_splits = [future.result() for future in futures]
+        
+        # Combine in thread_id order; each block's share of the sum is
+        # reported against the ratio product of the blocks before it
+        combined = _SPLIT_IDENTITY
+        thread_results = []
+        
+        for thread_id, ((start, count), (split, calculation_time)) in enumerate(zip(blocks, block_splits)):
+            p0, q0, _, _ = combined
+            _, q, b, t = split
+            thread_results.append(PrecisionThreadResult(
+                thread_id=thread_id,
+                result=_split_quotient(p0 * t, x * b * q0 * q),
+                precision_maintained=True,
+                calculation_time=calculation_time,
+                terms_processed=count
+            ))
+            combined = _combine_split(combined, split)
+        
+        # The whole series collapses to a single full-precision division
+        _, q, b, t = combined
+        arctan_sum = _split_quotient(t, x * b * q)
+        
+        return arctan_sum, thread_results
+    
+    def precision_safe_arctan_blocks(self, 
+                                     x: int, 
+                                     terms: int, 
+                                     num_threads: int = 4) -> Tuple[Decimal, List[PrecisionThreadResult]]:
+        """🎯 arctan(1/x) split into contiguous per-thread term blocks"""
+        blocks, futures = self._submit_arctan_blocks(x, terms, num_threads)
+        return self._collect_arctan_blocks(x, blocks, futures)
+    
     def precision_safe_machin_pi(self, terms: int = 1000, num_threads: int = 4) -> Tuple[Decimal, dict]:
         """🎯 Precision-safe Machin's formula with threading"""
         
@@ -173,37 +399,18 @@ class PrecisionSafeThreading:
             enable_recursive_protection=True
         ) as guard:
             
-            def arctan_1_5_operation(n: Decimal) -> Decimal:
-                """Precision-safe arctan(1/5) term calculation"""
-                n_int = int(n)
-                x = Decimal('1') / Decimal('5')
-                x_power = x ** (2 * n_int + 1)
-                sign = Decimal(-1) ** n_int
-                denominator = Decimal(2 * n_int + 1)
-                return sign * x_power / denominator
-            
-            def arctan_1_239_operation(n: Decimal) -> Decimal:
-                """Precision-safe arctan(1/239) term calculation"""
-                n_int = int(n)
-                x = Decimal('1') / Decimal('239')
-                x_power = x ** (2 * n_int + 1)
-                sign = Decimal(-1) ** n_int
-                denominator = Decimal(2 * n_int + 1)
-                return sign * x_power / denominator
+            # Each thread binary-splits its own block of the series into
+            # exact integers; only the final combine touches Decimal. Both
+            # series go to the pool in one batch so they run side by side
+            print("   Computing arctan(1/5) and arctan(1/239) terms...")
+            blocks_1_5, futures_1_5 = self._submit_arctan_blocks(5, terms, num_threads)
+            blocks_1_239, futures_1_239 = self._submit_arctan_blocks(239, terms, num_threads)
             
-            # Create term indices as Decimals
-            term_indices = [Decimal(str(i)) for i in range(terms)]
-            
-            # Calculate arctan(1/5) with precision-safe threading
-            print("   Computing arctan(1/5) terms...")
-            arctan_1_5_sum, arctan_1_5_results = self.precision_safe_map(
-                arctan_1_5_operation, term_indices, num_threads
+            arctan_1_5_sum, arctan_1_5_results = self._collect_arctan_blocks(
+                5, blocks_1_5, futures_1_5
             )
-            
-            # Calculate arctan(1/239) with precision-safe threading  
-            print("   Computing arctan(1/239) terms...")
-            arctan_1_239_sum, arctan_1_239_results = self.precision_safe_map(
-                arctan_1_239_operation, term_indices, num_threads
+            arctan_1_239_sum, arctan_1_239_results = self._collect_arctan_blocks(
+                239, blocks_1_239, futures_1_239
             )
             
             # Apply Machin's formula with pure Decimal arithmetic
@@ -260,6 +467,7 @@ def test_precision_safe_threading():
     # Test precision-safe threading
     print("🎯 Testing precision-safe threading...")
     threaded_pi, metrics = safe_threading.precision_safe_machin_pi(1000, 4)
+    safe_threading.close()
     
     # Compare results
     precision_drift = abs(threaded_pi - baseline_result.calculated_pi)
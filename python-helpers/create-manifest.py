@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 import argparse
-import glob
+import fnmatch
 import os
 import re
 import sys
@@ -9,79 +9,145 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Tuple
 
+import numpy as np
+
 NUM_RE = re.compile(r'(\d+)(?=\D*$)')  # last run of digits before non-digits / end
 
-def natural_index(fname: str) -> int:
+def natural_index(name: str) -> int:
     """Extract trailing numeric index (frame_000123.bmp -> 123). Return -1 if none."""
-    m = NUM_RE.search(Path(fname).stem)
+    # Slice the stem off the name string instead of allocating a Path for .stem
+    dot = name.rfind('.')
+    stem = name[:dot] if dot > 0 else name
+    m = NUM_RE.search(stem)
     return int(m.group(1)) if m else -1
 
-def list_images(directory: Path, pattern: str) -> List[Path]:
-    pats = (directory / pattern).as_posix()
-    files = [Path(p) for p in glob.glob(pats)]
-    files = [f for f in files if f.is_file()]
-    if not files:
-        return []
-    return files
-
-def sort_by_index(files: List[Path]) -> List[Path]:
-    with_index = [(natural_index(f.name), f) for f in files]
+def list_images(directory: Path, pattern: str) -> List[Tuple[int, Path]]:
+    """
+    Matching files as (natural index, path) pairs from one scandir pass.
+    DirEntry.is_file() reuses the directory listing, so there is no extra stat per file,
+    and Path objects are only built for names that match.
+    """
+    include_hidden = pattern.startswith('.')  # glob semantics: dotfiles need an explicit dot
+    entries: List[Tuple[int, Path]] = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith('.') and not include_hidden:
+                continue
+            if fnmatch.fnmatch(name, pattern) and entry.is_file():
+                entries.append((natural_index(name), Path(entry.path)))
+    return entries
+
+def sort_by_index(entries: List[Tuple[int, Path]]) -> Tuple[List[Path], List[int]]:
+    """Sort by the indices list_images already parsed; they are returned for index_repeat_positions."""
     # Filter out anything without an index
-    with_index = [p for p in with_index if p[0] >= 0]
+    with_index = [p for p in entries if p[0] >= 0]
     with_index.sort(key=lambda x: x[0])
-    return [f for _, f in with_index]
+    return [f for _, f in with_index], [i for i, _ in with_index]
 
-def sort_by_mtime(files: List[Path]) -> List[Path]:
-    return sorted(files, key=lambda f: f.stat().st_mtime)
+def sort_by_mtime(entries: List[Tuple[int, Path]]) -> Tuple[List[Path], List[float]]:
+    """Stat each file once; the sorted mtimes are returned for expand_by_timestamp_with_mtimes."""
+    timed = [(f.stat().st_mtime, f) for _, f in entries]
+    timed.sort(key=lambda x: x[0])
+    return [f for _, f in timed], [t for t, _ in timed]
+
+def index_repeat_counts(indices: List[int]) -> np.ndarray:
+    """
+    Repeat count for each index-sorted file: the gap to the next filename index
+    (or 1 for the last).
+    """
+    if not indices:
+        return np.empty(0, dtype=np.int64)
+    idxs = np.asarray(indices, dtype=np.int64)
+    gaps = np.diff(idxs, append=idxs[-1] + 1)
+    gaps[gaps < 1] = 1
+    return gaps
+
+def timestamp_repeat_counts(mtimes: List[float], fps: int) -> np.ndarray:
+    """
+    Repeat count for each mtime-sorted file: its time delta to the next converted
+    to frame count via fps, at least 1.
+    """
+    if not mtimes:
+        return np.empty(0, dtype=np.int64)
+    times = np.asarray(mtimes, dtype=np.float64)
+    dt = np.maximum(0.0, np.diff(times, append=times[-1] + 1.0 / fps))
+    # np.round is half-to-even like round(), so repeat counts match per-frame rounding
+    return np.maximum(1, np.round(dt * fps)).astype(np.int64)
+
+def repeat_positions(counts: np.ndarray) -> np.ndarray:
+    """Position into the unique files for every expanded frame."""
+    # One repeat over positions instead of growing a list with [f] * gap per frame
+    return np.repeat(np.arange(len(counts), dtype=np.int64), counts)
+
+def index_repeat_positions(indices: List[int]) -> np.ndarray:
+    return repeat_positions(index_repeat_counts(indices))
+
+def timestamp_repeat_positions(mtimes: List[float], fps: int) -> np.ndarray:
+    return repeat_positions(timestamp_repeat_counts(mtimes, fps))
 
 def expand_by_index(files: List[Path], fps: int) -> List[Path]:
     """
     Given unique frames (deduped) where filename indices represent the *original* frame numbers,
     repeat each file according to the gap to the next index (or 1 for the last).
     """
-    if not files:
-        return []
-    expanded: List[Path] = []
-    idxs = [natural_index(f.name) for f in files]
-    for i, f in enumerate(files):
-        cur_idx = idxs[i]
-        next_idx = idxs[i+1] if i + 1 < len(files) else (cur_idx + 1)
-        gap = max(1, next_idx - cur_idx)
-        expanded.extend([f] * gap)
-    return expanded
+    positions = index_repeat_positions([natural_index(f.name) for f in files])
+    return [files[i] for i in positions.tolist()]
 
 def expand_by_timestamp(files: List[Path], fps: int) -> List[Path]:
     """
     Repeat each file based on time delta to next (converted to frame count via fps).
     Last frame gets at least 1 repeat.
     """
-    if not files:
-        return []
-    expanded: List[Path] = []
-    mtimes = [f.stat().st_mtime for f in files]
-    for i, f in enumerate(files):
-        cur_t = mtimes[i]
-        next_t = mtimes[i+1] if i + 1 < len(files) else (cur_t + 1.0 / fps)
-        dt = max(0.0, next_t - cur_t)
-        frames = max(1, round(dt * fps))
-        expanded.extend([f] * frames)
-    return expanded
-
-def write_concat_manifest(expanded: List[Path], base_dir: Path, out_path: Path):
-    """
-    Writes a concat demuxer manifest where each line is:
+    return expand_by_timestamp_with_mtimes(files, [f.stat().st_mtime for f in files], fps)
+
+def expand_by_timestamp_with_mtimes(files: List[Path], mtimes: List[float], fps: int) -> List[Path]:
+    """
+    expand_by_timestamp for callers that already hold each file's mtime (no re-stat).
+    """
+    return [files[i] for i in timestamp_repeat_positions(mtimes, fps).tolist()]
+
+def concat_lines(files: List[Path], base_dir: Path) -> List[str]:
+    """
+    One concat demuxer line per unique file:
       file 'relative/path/to/frame.bmp'
+    Built once per file, however many times the frame is repeated.
+    """
+    lines = []
+    for f in files:
+        # Quote single quotes inside names (unlikely) by escaping
+        s = str(f.relative_to(base_dir)).replace("'", r"'\''")
+        lines.append(f"file '{s}'")
+    return lines
+
+def write_concat_manifest(expanded_indices: np.ndarray, unique_rel_lines: List[str], out_path: Path):
+    """
+    Writes a concat demuxer manifest with one line per expanded frame, looked up
+    from the per-file lines by position.
     (No duration lines; repeat lines handle timing.)
     """
-    rel = []
-    for f in expanded:
-        rp = f.relative_to(base_dir)
-        rel.append(rp)
     with open(out_path, 'w', encoding='utf-8') as mf:
-        for r in rel:
-            # Quote single quotes inside names (unlikely) by escaping
-            s = str(r).replace("'", r"'\''")
-            mf.write(f"file '{s}'\n")
+        if len(expanded_indices):
+            mf.write("\n".join([unique_rel_lines[i] for i in expanded_indices.tolist()]))
+            mf.write("\n")
+
+def write_concat_manifest_rle(files: List[Path], durations: np.ndarray, base_dir: Path, out_path: Path):
+    """
+    Writes a run-length concat demuxer manifest: one entry per unique frame,
+      file 'relative/path/to/frame.bmp'
+      duration <seconds>
+    The last file is listed once more without a duration - the concat demuxer
+    otherwise ignores the final entry's duration.
+    """
+    lines = concat_lines(files, base_dir)
+    if not lines:
+        open(out_path, 'w', encoding='utf-8').close()
+        return
+    body = [f"{line}\nduration {d}" for line, d in zip(lines, durations.tolist())]
+    body.append(lines[-1])
+    with open(out_path, 'w', encoding='utf-8') as mf:
+        mf.write("\n".join(body))
+        mf.write("\n")
 
 def parse_args():
     ap = argparse.ArgumentParser(
@@ -94,6 +160,8 @@ def parse_args():
                     help="index: use filename index gaps; timestamp: use file mtime gaps.")
     ap.add_argument("--output", "-o", default="", help="Optional explicit manifest path (.txt).")
     ap.add_argument("--dry-run", action="store_true", help="Show stats only; do not write manifest.")
+    ap.add_argument("--rle", action="store_true",
+                    help="Emit one file + duration entry per unique frame instead of repeated file lines.")
     ap.add_argument("--limit", type=int, default=0, help="Optional: limit number of *unique* input frames processed.")
     return ap.parse_args()
 
@@ -104,34 +172,37 @@ def main():
         print(f"[ERROR] Directory not found: {base_dir}", file=sys.stderr)
         return 1
 
-    files = list_images(base_dir, args.pattern)
-    if not files:
+    entries = list_images(base_dir, args.pattern)
+    if not entries:
         print(f"[WARN] No files matched pattern '{args.pattern}' in {base_dir}")
         return 0
 
-    original_count = len(files)
+    original_count = len(entries)
+    # keys: filename indices (index mode) or mtimes (timestamp mode), aligned with files
     if args.mode == "index":
-        files = sort_by_index(files)
+        files, keys = sort_by_index(entries)
     else:
-        files = sort_by_mtime(files)
+        files, keys = sort_by_mtime(entries)
 
     if args.limit > 0:
         files = files[:args.limit]
+        keys = keys[:args.limit]
 
     if not files:
         print("[WARN] No usable frames after filtering.")
         return 0
 
     if args.mode == "index":
-        expanded = expand_by_index(files, args.fps)
+        counts = index_repeat_counts(keys)
     else:
-        expanded = expand_by_timestamp(files, args.fps)
+        counts = timestamp_repeat_counts(keys, args.fps)
 
     timestamp_tag = datetime.now().strftime("%Y%m%d_%H%M%S")
     if args.output:
         out_path = Path(args.output)
     else:
-        suffix = "_frames_index.txt" if args.mode == "index" else "_frames_timestamp.txt"
+        suffix = "_frames_index" if args.mode == "index" else "_frames_timestamp"
+        suffix += "_rle.txt" if args.rle else ".txt"
         out_path = base_dir / f"{timestamp_tag}{suffix}"
 
     print("=== Manifest Generation Summary ===")
@@ -140,7 +211,8 @@ def main():
     print(f" Mode                : {args.mode}")
     print(f" FPS (target)        : {args.fps}")
     print(f" Unique frames (in)  : {len(files)} (raw matched: {original_count})")
-    print(f" Expanded frame count: {len(expanded)}")
+    print(f" Expanded frame count: {int(counts.sum())}")
+    print(f" Manifest layout     : {'run-length (duration)' if args.rle else 'repeated file lines'}")
     print(f" Output manifest     : {out_path if not args.dry_run else '(dry-run)'}")
 
     if args.dry_run:
@@ -148,9 +220,14 @@ def main():
 
     # Ensure parent exists if user supplied relative path outside base_dir
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    write_concat_manifest(expanded, base_dir, out_path)
+    if args.rle:
+        write_concat_manifest_rle(files, counts / args.fps, base_dir, out_path)
+    else:
+        write_concat_manifest(repeat_positions(counts), concat_lines(files, base_dir), out_path)
     print(f"[OK] Wrote concat manifest: {out_path}")
-    print("Next: ffmpeg -f concat -safe 0 -i \"{}\" -vf \"scale=trunc(iw/2)*2:trunc(ih/2)*2\" -c:v libx264 -pix_fmt yuv420p -crf 18 out.mp4".format(out_path))
+    # Durations give variable frame timing; -r resamples back to a constant rate
+    rate = f"-r {args.fps} " if args.rle else ""
+    print("Next: ffmpeg -f concat -safe 0 -i \"{}\" -vf \"scale=trunc(iw/2)*2:trunc(ih/2)*2\" {}-c:v libx264 -pix_fmt yuv420p -crf 18 out.mp4".format(out_path, rate))
     return 0
 
 if __name__ == "__main__":